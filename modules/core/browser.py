@@ -9,15 +9,41 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException, InvalidElementStateException, InvalidArgumentException, ElementClickInterceptedException # type: ignore
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.alert import Alert
+from selenium.webdriver.remote import utils as remote_utils
 from webdriver_manager.chrome import ChromeDriverManager
 from typing import List
 import time
 from urllib.parse import urlparse
 import config.env_config as env_config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _install_fast_json_decoder() -> None:
+    """
+    Swap Selenium's wire-protocol JSON decoder for `orjson` when available.
+
+    Every WebDriver command response (including large `execute_script` payloads such as
+    ancestor outerHTML) is parsed through `remote_utils.load_json`, so patching it speeds
+    up all calls without touching any call site.
+    """
+    if orjson is None or getattr(remote_utils.load_json, '_is_orjson', False):
+        return
+
+    def load_json(s):
+        return orjson.loads(s)
+
+    load_json._is_orjson = True
+    remote_utils.load_json = load_json
+
+
 class Browser:
 
     def __init__(self):
+        _install_fast_json_decoder()
         self.driver = self._setup_browser()
 
     def _setup_browser(self):
@@ -1985,7 +1985,8 @@ class FormInteractor:
         new_elements_xPaths: set[str] = self.WebParserUtils.compute_relative_xpath_str(new_elements, verify_xpath=True) # (Note: There are still possibilities of false positives.)    
         
         # Keep only visible elements
-        new_elements_xPaths: set[str] = {xPath for xPath in new_elements_xPaths if self.WebParserUtils.is_xpath_visible(xPath)}
+        new_elements_xPaths: List[str] = list(new_elements_xPaths)
+        new_elements_xPaths: set[str] = {xPath for xPath, is_visible in zip(new_elements_xPaths, self.WebParserUtils.is_xpaths_visible(new_elements_xPaths)) if is_visible}
         
         # Retain only those fields that appear after the current element in DOM
         new_elements_xPaths: set[str] = {xPath for xPath in new_elements_xPaths if self.WebParserUtils.is_element_after(xPath, current_element_xPath)}
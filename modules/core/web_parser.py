@@ -16,17 +16,30 @@ import pprint
 import time
 import re
 import string
+import itertools
+import functools
+import bisect
+import weakref
 
 import nltk
 from nltk.corpus import words as nltk_words, stopwords
 from nltk.data import find
 from nltk.stem import WordNetLemmatizer
 from nltk.tag import pos_tag, PerceptronTagger
-from nltk.util import ngrams
 from pathlib import Path
 
 from difflib import SequenceMatcher
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
 from config.system_config import *
 from config.env_config import LOG_LEVEL, NLTK_DATA_DIR, USER_JSON_FILE
 from modules.utils.logger_config import setup_logger
@@ -40,13 +53,13 @@ ENGLISH_WORDS = None
 STOPWORDS = None
 LEMMATIZER = None
 # Broader POS tag sets (grouped semantically)
-VALID_POS_TAGS = {
+VALID_POS_TAGS = frozenset({
     'NN', 'NNS', 'NNP', 'NNPS',  # Nouns
     'VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ',  # Verbs
     'JJ', 'JJR', 'JJS',  # Adjectives
     'RB', 'RBR', 'RBS'   # Adverbs
-}
-PHRASE_PATTERNS = [
+})
+PHRASE_PATTERNS = frozenset({
     ('JJ', 'NN'),
     ('NN', 'NN'),
     ('VB', 'NN'),
@@ -55,7 +68,7 @@ PHRASE_PATTERNS = [
     ('DT', 'NN'),
     ('VB', 'DT'),
     ('UH', 'VB')
-]
+})
 NLTK_DATA_DIR = Path(NLTK_DATA_DIR)
 if str(NLTK_DATA_DIR) not in nltk.data.path:
     nltk.data.path.insert(0, str(NLTK_DATA_DIR))
@@ -86,6 +99,180 @@ field_identifiers = {
     'verification': ['verify','verification', 'pin-code', 'pincode', 'one-time-pass', 'one time pass', 'code digit', 'digit code']
 }
 
+# Field type/tag groups and date format variants used while synchronizing fields
+_NUMBER_TEXT = frozenset({'number', 'text'})
+_RADIO_CHECKBOX = frozenset({'radio', 'checkbox'})
+_DATE_TYPES = frozenset({'date', 'datelist'})
+_GROUPED_FIELD_TYPES = frozenset({'radio', 'checkbox', 'textarea', 'date', 'datelist'}) # Types excluded from work/edu section text-field detection
+_FILE_TAGS = frozenset({'input', 'button'})
+_EDUCATION_CATEGORIES = frozenset({'school', 'degree', 'field_of_study', 'gpa_or_grade', 'currently_enrolled'}) # `field_identifiers` categories used by the education section
+_DATE_MISIDENTIFIERS = ('candidate', 'validate', 'update') # Contain 'date' without being date fields
+_MERGE_KEYS = ("label-srcText", "label-srcAttribute", "label-custom", "name", "id", "id-custom") # Exact-match keys for grouping radio/checkbox fields
+_BUTTON_MERGE_KEYS = ("label-srcTag", "label-srcText", "label-custom", "name", "id", "id-custom", "value") # Exact-match keys for merging a button into a field
+_DATE_FORMAT_SEARCH_KEYS = ("placeholder", "label-srcAttribute", "label-custom", "id", "id-custom", "label-srcTag", "label-srcText", "name")
+_DATE_FORMATS = ( # Base format -> possible variants (checked in order)
+    ("MMDDYYYY", ("MM/DD/YYYY", "MM-DD-YYYY", "month.day.year", "month-day-year")),
+    ("DDMMYYYY", ("DD/MM/YYYY", "DD-MM-YYYY", "day.month.year", "day-month-year")),
+    ("MMYYYY", ("MM/YYYY", "Month/Year", "Month Year", "month-year")),
+    ("DD", ("DD", "Day", ".day", "-day")),
+    ("MM", ("MM", "Month", ".month", "-month")),
+    ("YYYY", ("YYYY", "Year", ".year")),
+)
+_DATE_FORMAT_PLACEHOLDERS = { # Lowercased variant -> base formats having it (exact placeholder match)
+    variant.lower(): frozenset(base_format for base_format, variants in _DATE_FORMATS if variant.lower() in map(str.lower, variants))
+    for _, variants in _DATE_FORMATS for variant in variants
+}
+
+# Precompiled regex patterns (hot-path text/xpath processing)
+_NS_PREFIX_RE = re.compile(r'<([a-zA-Z0-9]+):[a-zA-Z0-9]+')
+_TAG_GAP_RE = re.compile(r">\s+<")
+_XPATH_INDEX_RE = re.compile(r'\[(\d+)\]')
+_CLEAN_RUN_RE = re.compile(r'[^\w.,;:*()"\-]+') # Runs of whitespace and/or characters outside word chars + basic punctuation
+_ATTR_FILTER_RE = re.compile(r'(\[[^\]]+\])')
+_TAG_ATTRS_RE = re.compile(r"//(\w+)((\[[^\]]+\])*)")
+_DYN_SAFE_RE = re.compile(r'\[@[^=]*value[^=]*=[^\]]*\]|\[@tabindex=[^\]]*\]')
+# Aggressive mode: selective literals first, then bounded name classes so the engine can bail early on '=' / ']'
+_DYN_AGG_RE = re.compile(r'\[@(?:id|class|tabindex|placeholder|style|autocomplete|data-[\w-]*|[\w-]*value[\w-]*)=[^\]]*\]')
+_SEP_TABLE = str.maketrans('_-', '  ')
+_TOKEN_BOUNDARY_RE = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[a-zA-Z])(?=[0-9])|(?<=[0-9])(?=[a-zA-Z])') # camelCase, letter->digit, digit->letter
+_DROP_HEX = str.maketrans('', '', string.hexdigits)
+_DROP_DIGITS = str.maketrans('', '', string.digits)
+_DROP_PUNCT = str.maketrans('', '', string.punctuation)
+_DROP_ASCII_ALPHA = str.maketrans('', '', string.ascii_letters)
+_HYPHEN_UNDERSCORE_RE = re.compile(r'[-_]')
+_SENTENCE_PUNCT_RE = re.compile(r'[.?!]')
+_WS_SPLIT_RE = re.compile(r'\s+')
+_DATE_COMPONENT_RE = re.compile(r'(?=(DD|MM|YYYY|day|month|year))') # Zero-width: reports a token at every position it starts
+_WS_DEL = str.maketrans('', '', ''.join(c for c in map(chr, range(0x3001)) if c.isspace())) # Deletes exactly what `\s` matches (U+3000 is the highest whitespace code point)
+_ID_SNAKE_RE = re.compile(r'[_\-]{1,2}')
+_ID_CAMEL_RE = re.compile(r'[a-z][A-Z]')
+_ID_DIGIT_RE = re.compile(r'\w+\d+\w*')
+_INPUT_TAG_RE = re.compile(r'<input[^>]*>', re.IGNORECASE)
+_HEADER_FOOTER_XPATH_RE = re.compile(r'/(header|footer)(?=\[|/|$)', re.IGNORECASE) # <header>/<footer> steps of an absolute xPath
+_TAG_ATTRIBUTE_RE = re.compile(r'([a-zA-Z0-9\-]+)\s*=\s*"([^"]*)"|([a-zA-Z0-9\-]+)\s*(?=\s|>)')
+_INTERACTIVE_TAG_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'<input\b[^>]*>',
+    r'<textarea\b[^>]*>',
+    r'<select\b[^>]*>',
+    r'<button\b[^>]*>',
+    r'<[^>]*\brole=["\']button["\'][^>]*>'
+))
+_HTML_ATTR_PAIR_RE = re.compile(r'(\w[\w-]*)=["\']?([^"\'> ]*)')
+_HTML_DIFF_PARSER = lxml_html.HTMLParser(collect_ids=False, huge_tree=True) # `HtmlDiffer` never looks elements up by id; large pages must not hit libxml2's size limits
+
+@functools.lru_cache(maxsize=1024)
+def _strip_dynamic_attributes(xpath: str, aggressive: bool = False) -> str:
+    """Shared by `WebParserUtils` and `ParsedDataUtils`; cached since the same XPaths are re-cleaned across retries."""
+    if not aggressive:
+        # Remove any attribute that contains 'value' OR is 'tabindex'
+        return _DYN_SAFE_RE.sub('', xpath).strip()
+    else:
+        # Remove dynamic attributes (id, class, tabindex, placeholder, style, autocomplete, data-*, *value*) having a value
+        return _DYN_AGG_RE.sub('', xpath).strip()
+
+@functools.lru_cache(maxsize=4096)
+def _match_ratio(str1: str, str2: str, score_cutoff: float = 0) -> float:
+    """
+    Cached similarity ratio in [0, 1]. Uses rapidfuzz's C++ `fuzz.ratio` when installed, else
+    difflib's SequenceMatcher (argument order is kept: that ratio is not guaranteed symmetric).
+    With rapidfuzz, scores below `score_cutoff` (0-100) may be returned as 0, letting it stop early.
+    """
+    if fuzz is not None:
+        return fuzz.ratio(str1, str2, score_cutoff=score_cutoff) / 100
+    return SequenceMatcher(None, str1, str2).ratio()
+
+@functools.lru_cache(maxsize=16384)
+def _normalized_value(value: str) -> tuple:
+    """(lowercased, lowercased without spaces) forms of a parsed-data value, as matched by `ParsedDataUtils.search_items`."""
+    lowered = value.lower()
+    return lowered, lowered.replace(' ', '')
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_needles(needles: tuple, normalize_whitespace: bool, case_sensitive: bool) -> frozenset:
+    """Normalized (whitespace-stripped and/or lowercased) substring set used by `ParsedDataUtils.is_substrings_in_item*`."""
+    if normalize_whitespace:
+        needles = (needle.translate(_WS_DEL) for needle in needles)
+    return frozenset(needles if case_sensitive else (needle.lower() for needle in needles))
+
+def _build_category_matcher(categories: Dict[str, Iterable[str]], case_sensitive: bool):
+    """
+    Returns a callable mapping a whitespace-stripped text to the set of categories whose identifiers it contains.
+
+    All identifiers are compiled into one Aho–Corasick automaton when `pyahocorasick` is installed, so a text
+    is scanned once for every category. Otherwise each category is compiled into a single regex alternation.
+    """
+    category_needles: Dict[str, frozenset] = {category: _normalize_needles(tuple(needles), True, case_sensitive) for category, needles in categories.items()}
+    needle_categories: Dict[str, set] = {}
+    for category, needles in category_needles.items():
+        for needle in needles:
+            needle_categories.setdefault(needle, set()).add(category)
+
+    if ahocorasick is not None and needle_categories and '' not in needle_categories:
+        automaton = ahocorasick.Automaton()
+        for needle, needle_category_set in needle_categories.items():
+            automaton.add_word(needle, frozenset(needle_category_set))
+        automaton.make_automaton()
+
+        def match(text: str) -> set:
+            matched = set()
+            for _, needle_category_set in automaton.iter(text):
+                matched |= needle_category_set
+            return matched
+    else:
+        patterns = {category: re.compile('|'.join(map(re.escape, needles)))
+                    for category, needles in category_needles.items() if needles}
+
+        def match(text: str) -> set:
+            return {category for category, pattern in patterns.items() if pattern.search(text)}
+    return match
+
+def _has_more_words_than(text: str, limit: int) -> bool:
+    """`len(text.split()) > limit`, without splitting texts too short to hold that many words (n words need 2n-1 characters)."""
+    return len(text) > 2 * limit and len(text.split()) > limit
+
+def _max_label_word_count(item: dict) -> float:
+    """Largest word count among the item's `standard_label_keys` values (missing/None labels are ignored, non-string values count as infinite)."""
+    max_words = 0
+    for k in standard_label_keys:
+        if (v := item.get(k)) is None:
+            continue
+        if not isinstance(v, str):
+            return float('inf')
+        if (words := len(v.split())) > max_words:
+            max_words = words
+    return max_words
+
+# Link texts kept by `_extract_links` (whitespace-stripped and lowercased, compared exactly)
+_LINK_WHITELIST = _normalize_needles((*start_apply_btn_identifiers, *signup_auth_btn_identifiers, *signin_auth_btn_identifiers, *verify_auth_btn_identifiers, *other_auth_btn_identifiers), True, False)
+
+def _first_other_value(attributes: Optional[dict], exclude: Any) -> Any:
+    """First non-empty value of the matched attributes dict that differs from `exclude` (e.g. the element's own id/label), else None."""
+    return next((value for value in (attributes or {}).values() if value and value != exclude), None)
+
+def _contains_any(flat_lower: str, needles: Iterable[str]) -> bool:
+    """`is_substrings_in_item(..., normalize_whitespace=True)` against an already flattened, whitespace-stripped and lowercased text."""
+    return any(map(flat_lower.__contains__, _normalize_needles(tuple(needles), True, False)))
+
+@functools.lru_cache(maxsize=512)
+def _split_path(key_path: str) -> tuple:
+    """Dot-separated key path (e.g. "options.id") as a tuple of keys; the same few paths are split over and over."""
+    return tuple(key_path.split('.'))
+
+def _clean_run(match: re.Match) -> str:
+    """`_CLEAN_RUN_RE` replacement: a run containing whitespace collapses to one space, otherwise it is dropped."""
+    run = match.group()
+    return ' ' if len(run.translate(_WS_DEL)) != len(run) else ''
+
+@functools.lru_cache(maxsize=4096)
+def _quick_ratio(str1: str, str2: str) -> float:
+    """Cached `SequenceMatcher.quick_ratio()`: an upper bound on `ratio()` computed from character counts only."""
+    return SequenceMatcher(None, str1, str2).quick_ratio()
+
+@functools.lru_cache(maxsize=256)
+def _lower_tuple(items: tuple) -> tuple:
+    """Lowercase a tuple of needles; cached because callers probe with the same keyword sets repeatedly."""
+    return tuple(item.lower() for item in items)
+
 def initialize_nltk_resources():
     """
     Ensures NLTK resources are downloaded and initializes global constants.
@@ -123,8 +310,8 @@ def initialize_nltk_resources():
 
 
     # Safe to initialize globals
-    ENGLISH_WORDS = set(nltk_words.words())
-    STOPWORDS = set(stopwords.words('english'))
+    ENGLISH_WORDS = frozenset(nltk_words.words())
+    STOPWORDS = frozenset(stopwords.words('english'))
     LEMMATIZER = WordNetLemmatizer()
 
     logger.debug("✅ NLTK resources loaded successfully.")
@@ -185,15 +372,69 @@ USER_DATA = UserData(USER_JSON_FILE)
 TOTAL_JOBS_ENTRY = len(USER_DATA.data["Work Experience"])
 TOTAL_EDUCATION_ENTRY = len(USER_DATA.data["Education"])
 
+class _DomRevision:
+    """
+    DOM revision counter (and the XPath caches it scopes) for one WebDriver.
+
+    Shared by every `WebParserUtils` built on that driver, so a bump from any of them (or a navigation)
+    invalidates the cached XPaths of all of them.
+    """
+
+    def __init__(self):
+        self.revision = 0
+        self.xpath_counts: Dict[tuple, int] = {}
+        self.element_xpaths: Dict[tuple, str] = {}
+
+    def bump(self) -> None:
+        self.revision += 1
+        self.xpath_counts.clear()
+        self.element_xpaths.clear()
+
+_DOM_REVISIONS: "weakref.WeakKeyDictionary[WebDriver, _DomRevision]" = weakref.WeakKeyDictionary()
+
+def _get_dom_revision(driver: WebDriver) -> _DomRevision:
+    """
+    Returns the `_DomRevision` of `driver`, creating it on first use and hooking the driver's navigation
+    methods (`get`, `refresh`, `back`, `forward`) so each navigation bumps it.
+    """
+    dom_revision = _DOM_REVISIONS.get(driver)
+    if dom_revision is None:
+        dom_revision = _DOM_REVISIONS[driver] = _DomRevision()
+        for name in ('get', 'refresh', 'back', 'forward'):
+            navigate = getattr(driver, name, None)
+            if navigate is None:
+                continue
+            def navigate_and_bump(*args, _navigate=navigate, **kwargs):
+                try:
+                    return _navigate(*args, **kwargs)
+                finally:
+                    dom_revision.bump()
+            setattr(driver, name, navigate_and_bump)
+    return dom_revision
+
 class WebParserUtils:
     
     def __init__(self, driver):
         self.driver = driver
+        self._dom = _get_dom_revision(driver) # Bumped whenever the DOM may have changed; scopes `_xpath_count_cache` and `_element_xpath_cache`
+        self._xpath_count_cache: Dict[tuple, int] = self._dom.xpath_counts # Shared with the other `WebParserUtils` on this driver
+        self._element_xpath_cache: Dict[tuple, str] = self._dom.element_xpaths # Shared with the other `WebParserUtils` on this driver
+
+    @property
+    def _dom_revision(self) -> int:
+        return self._dom.revision
+
+    def bump_dom_revision(self) -> None:
+        """
+        Marks the DOM as (potentially) changed so cached XPath match counts and element XPaths are no longer reused.
+        Applies to every `WebParserUtils` sharing this driver.
+        """
+        self._dom.bump()
 
     def detect_xml_namespaces(self) -> Optional[bool]:
         if self.driver.current_url.startswith(("data:", "about:blank")): # URL not loaded on driver
             return None
-        namespace_prefixes = set(re.findall(r'<([a-zA-Z0-9]+):[a-zA-Z0-9]+', self.driver.page_source)) # set(namespace_tags)
+        namespace_prefixes = set(_NS_PREFIX_RE.findall(self.driver.page_source)) # set(namespace_tags)
         # If namespace prefixes is detected in page source, then XPath queries may require namespace-aware evaluation
         return bool(namespace_prefixes)
 
@@ -250,6 +491,7 @@ class WebParserUtils:
 
         WebDriverWait(self.driver, 10).until(lambda d: d.execute_script("return document.readyState") == "complete")
         is_stable = wait_for_stable_dom(timeout=timeout, check_interval=check_interval)
+        self.bump_dom_revision() # DOM (possibly) changed while waiting, stable or not; drop cached XPath counts
         if not is_stable:
             logger.warning(f"❗  Page is unstable since last {timeout} seconds.")
             return False
@@ -281,8 +523,17 @@ class WebParserUtils:
             int: Number of matching elements in the DOM.
         """
         if xpath:
+            key = (self._dom_revision, xpath)
+            if key in self._xpath_count_cache:
+                return self._xpath_count_cache[key]
             try:
-                return len(self.driver.find_elements(By.XPATH, xpath))
+                # Count in the browser instead of marshalling a reference for every matched element
+                count = self.driver.execute_script(
+                    "return document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;",
+                    xpath
+                )
+                self._xpath_count_cache[key] = count
+                return count
             except Exception as e:
                 print(f"[!] Error counting elements: {e}")
         return 0
@@ -301,6 +552,18 @@ class WebParserUtils:
             str: The XPath of the element.
         """
 
+        if isinstance(element, WebElement):
+            # Scanning passes (fields, buttons, required/submit checks) revisit the same elements within one DOM revision
+            key = (self._dom_revision, element.id, verify_xpath)
+            xpath = self._element_xpath_cache.get(key)
+            if xpath is None:
+                xpath = self._compute_xpath(element, verify_xpath)
+                if xpath:
+                    self._element_xpath_cache[key] = xpath
+            return xpath
+        return self._compute_xpath(element, verify_xpath)
+
+    def _compute_xpath(self, element: Union[WebElement, etree._Element], verify_xpath: bool) -> Optional[str]:
         if self.detect_xml_namespaces():
             '''
             Generate -> Relative XPath with Attributes
@@ -371,7 +634,7 @@ class WebParserUtils:
         tag = lxml_element.tag.lower()
 
         # Serialize the lxml element to HTML string (minified)
-        lxml_html = re.sub(r">\s+<", "><", tostring(lxml_element, encoding='unicode').strip())
+        lxml_html = _TAG_GAP_RE.sub("><", tostring(lxml_element, encoding='unicode').strip())
 
         # Get all elements of the same tag in the Selenium DOM
         selenium_elements = self.driver.find_elements(By.TAG_NAME, tag)
@@ -380,7 +643,7 @@ class WebParserUtils:
             try:
                 # Get the outerHTML of the element in Selenium
                 sel_html = self.driver.execute_script("return arguments[0].outerHTML;", sel_el)
-                sel_html = re.sub(r">\s+<", "><", sel_html.strip())  # Normalize
+                sel_html = _TAG_GAP_RE.sub("><", sel_html.strip())  # Normalize
 
                 # Exact or loose match
                 if lxml_html in sel_html or sel_html in lxml_html:
@@ -491,11 +754,8 @@ class WebParserUtils:
         '''
 
         def extract_attributes(tag: str) -> dict:
-            # Regular expression to match attributes in the tag, including those with JavaScript functions and hyphenated attribute names.
-            pattern = r'([a-zA-Z0-9\-]+)\s*=\s*"([^"]*)"|([a-zA-Z0-9\-]+)\s*(?=\s|>)'
-            
-            # Find all matches
-            matches = re.findall(pattern, tag)
+            # Match attributes in the tag, including those with JavaScript functions and hyphenated attribute names.
+            matches = _TAG_ATTRIBUTE_RE.findall(tag)
             
             # Create a dictionary to store the attributes
             attributes = {}
@@ -574,9 +834,9 @@ class WebParserUtils:
         id_attributes : dict = self.search_attribute("id", selenium_element)
         label_attributes : dict = self.search_attribute("label", selenium_element)
 
-        customId = (diff_set := set((id_attributes or {}).values()).difference({selenium_element.get_attribute("id")})) and diff_set.pop() or None
+        customId = _first_other_value(id_attributes, selenium_element.get_attribute("id"))
         id = val if (val := selenium_element.get_attribute("id")) not in [""] else None
-        labelCustom = (diff_set := set((label_attributes or {}).values()).difference({selenium_element.get_attribute("label")})) and diff_set.pop() or None
+        labelCustom = _first_other_value(label_attributes, selenium_element.get_attribute("label"))
 
         if optimized:
             # Step 1: Check for field_customId
@@ -670,10 +930,8 @@ class WebParserUtils:
             xpath = tree.getroottree().getpath(el)
             updated_xpath = '/' + '/'.join(xpath.strip('/').split('/')[1:])  # Remove the extra parent div
 
-            for parent in parent_xpath:
-                full_xpath = parent.rstrip('/') + updated_xpath
-                if self.is_unique_xpath(full_xpath):
-                    valid_xpath.add(full_xpath)
+            full_xpaths = [parent.rstrip('/') + updated_xpath for parent in parent_xpath]
+            valid_xpath.update(xp for xp, is_unique in self.batch_is_unique(full_xpaths).items() if is_unique)
 
         return valid_xpath
 
@@ -715,16 +973,45 @@ class WebParserUtils:
         Returns:
             Optional[str]: A valid XPath string if found, else None.
         """
-        for parent_n in range(1, max_fallbacks + 1):
-            parent_el = self.get_nth_parent(el, parent_n)
-            if parent_el is None:
-                break
-            parent_xpath = self.compute_relative_xpath_lxml(parent_el, verify_xpath=True)
-            if parent_xpath:
+        # Walk the ancestor chain once (in C) instead of re-walking from the leaf for every level
+        ancestors = list(itertools.islice(el.iterancestors(), max_fallbacks))
+        candidate_xpaths = [self.compute_relative_xpath_lxml(parent_el, verify_xpath=False) for parent_el in ancestors]
+        if not candidate_xpaths:
+            return None
+
+        # Verify all candidates in a single browser round-trip, then pick the nearest unique ancestor
+        for parent_xpath, is_unique in zip(candidate_xpaths, self.are_unique_xpaths(candidate_xpaths)):
+            if is_unique:
                 return parent_xpath
 
         return None
 
+    def are_unique_xpaths(self, xpaths: List[str]) -> List[bool]:
+        """
+        Checks uniqueness of multiple XPaths using a single `execute_script` call.
+
+        Args:
+            xpaths (List[str]): XPath strings to validate.
+
+        Returns:
+            List[bool]: Flags aligned with `xpaths`; True if the XPath matches exactly one element.
+        """
+        if not xpaths:
+            return []
+        try:
+            return self.driver.execute_script("""
+                return arguments[0].map(xp => {
+                    try {
+                        return document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength === 1;
+                    } catch (e) {
+                        return false;
+                    }
+                });
+            """, list(xpaths))
+        except Exception:
+            # Fallback to per-XPath verification if the batched script fails
+            return [self.is_unique_xpath(xp) for xp in xpaths]
+
     def is_unique_xpath(self, xpath: str) -> bool:
         """
         Safely checks if the given XPath uniquely identifies exactly one element.
@@ -736,6 +1023,19 @@ class WebParserUtils:
         except:
             return False
 
+    def batch_is_unique(self, xpaths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Checks uniqueness of several XPaths in one `execute_script` round-trip (see `are_unique_xpaths`).
+
+        Args:
+            xpaths (Iterable[str]): XPath strings to validate.
+
+        Returns:
+            Dict[str, bool]: Mapping of each XPath to True if it matches exactly one element.
+        """
+        xpaths = list(dict.fromkeys(xp for xp in xpaths if xp)) # De-duplicate while preserving order
+        return dict(zip(xpaths, self.are_unique_xpaths(xpaths)))
+
     def is_element_misplaced(self, element_metadata: Dict[str, Any]) -> bool:
         """
         Determine if an element is misplaced based on the uniqueness of its XPath locators.
@@ -753,15 +1053,16 @@ class WebParserUtils:
         # Get the relative XPath (usually shorter, relative path)
         xPath_relative = element_metadata.get('xPath-relative')
 
-        # If helper XPath exists and is relative, check uniqueness
+        # Collect candidates: helper XPath only if it is relative, plus the relative XPath
+        candidates = []
         if xPath_any and not self.is_absolute_xpath(xPath_any):
-            if self.count_elements_by_xpath(xPath_any) == 1:
-                return False  # Uniquely found — element is not misplaced
-
-        # If relative XPath exists, check uniqueness
+            candidates.append(xPath_any)
         if xPath_relative:
-            if self.count_elements_by_xpath(xPath_relative) == 1:
-                return False  # Uniquely found — element is not misplaced
+            candidates.append(xPath_relative)
+
+        # Probe both locators concurrently; any unique match means the element is not misplaced
+        if any(self.batch_is_unique(candidates).values()):
+            return False  # Uniquely found — element is not misplaced
 
         # Otherwise, element is considered misplaced (ambiguous or missing XPath)
         return True
@@ -839,21 +1140,13 @@ class WebParserUtils:
             Returns:
                 Set[str]: Hashes/fingerprints representing each interactive element.
             """
-            element_patterns = [
-                r'<input\b[^>]*>',
-                r'<textarea\b[^>]*>',
-                r'<select\b[^>]*>',
-                r'<button\b[^>]*>',
-                r'<[^>]*\brole=["\']button["\'][^>]*>'
-            ]
-
             matches = []
-            for pattern in element_patterns:
-                matches.extend(re.findall(pattern, html, flags=re.IGNORECASE))
+            for pattern in _INTERACTIVE_TAG_RES:
+                matches.extend(pattern.findall(html))
 
             fingerprints = set()
             for tag in matches:
-                attrs = dict(re.findall(r'(\w[\w-]*)=["\']?([^"\'> ]*)', tag))
+                attrs = dict(_HTML_ATTR_PAIR_RE.findall(tag))
                 key_attrs = ['name', 'id', 'placeholder', 'type', 'aria-label', 'role']
                 signature = '|'.join([f"{k}:{attrs.get(k, '')}" for k in key_attrs])
                 hash_val = hashlib.sha1(signature.encode()).hexdigest()
@@ -885,26 +1178,17 @@ class WebParserUtils:
             bool: True if DOM significantly changed, else False.
         """
 
-        def extract_fingerprints_from_tree(tree) -> set[str]:
-            interactive_tags = ['input', 'select', 'textarea', 'button']
-            role_button_xpath = "//*[@role='button']"
-            all_elements = set()
-
-            for tag in interactive_tags:
-                for el in tree.findall(f".//{tag}"):
-                    all_elements.add(el)
-
-            all_elements.update(tree.xpath(role_button_xpath))
+        def fingerprint(el) -> tuple:
+            # Tuple of key attributes acts as the fingerprint directly (no string formatting or hashing)
+            get = el.attrib.get
+            return (get('name', ''), get('id', ''), get('placeholder', ''), get('type', ''), get('aria-label', ''), get('role', ''))
 
-            fingerprints = set()
-            for el in all_elements:
-                attrs = el.attrib
-                key_attrs = ['name', 'id', 'placeholder', 'type', 'aria-label', 'role']
-                signature = '|'.join([f"{k}:{attrs.get(k, '')}" for k in key_attrs])
-                hash_val = hashlib.sha1(signature.encode()).hexdigest()
-                fingerprints.add(hash_val)
+        def extract_fingerprints_from_tree(tree) -> set[tuple]:
+            interactive_tags = ('input', 'select', 'textarea', 'button')
+            role_button_xpath = "//*[@role='button']"
 
-            return fingerprints
+            # Single tag-filtered walk (done in C by lxml) plus role-based buttons; duplicates collapse in the set
+            return set(map(fingerprint, itertools.chain(tree.iter(*interactive_tags), tree.xpath(role_button_xpath))))
 
         # Parse the HTML fragments
         tree_before = lxml_html.fragment_fromstring(dom_before, create_parent="div")
@@ -944,25 +1228,38 @@ class WebParserUtils:
             # Invalid input type
             return None
 
+        attributes = ((attr['name'], attr['value']) for attr in element.get_property('attributes'))
+        # Return matches dict or None if empty
+        return self._match_attribute_names(substring, attributes) or None
+
+    def _match_attribute_names(self, substring: List[str], attributes: Iterable[tuple]) -> dict:
+        """
+        Pure-Python core of `search_attribute`, operating on already-fetched (name, value) pairs.
+
+        Args:
+            substring (List[str]): List of substrings to match against attribute names.
+            attributes (Iterable[tuple]): (attribute_name, attribute_value) pairs.
+
+        Returns:
+            dict: Matching attributes {attribute_name (lowercased): value}.
+        """
         matches = {}
 
         # Check each attribute of the element against the substring patterns
-        for attr in element.get_property('attributes'):
-            attr_name = attr['name'].lower()
+        for name, value in attributes:
+            attr_name = name.lower()
 
             # Check each substring pattern in the list
             for sub in substring:
                 if (
                     attr_name == sub or
-                    re.search(rf'-{re.escape(sub)}$', attr_name) or   # ends with -{sub}
-                    re.search(rf'_{re.escape(sub)}$', attr_name) or   # ends with _{sub}
-                    re.match(rf'aria-{re.escape(sub)}', attr_name)    # starts with aria-{sub}
+                    attr_name.endswith(('-' + sub, '_' + sub)) or   # ends with -{sub} or _{sub}
+                    attr_name.startswith('aria-' + sub)             # starts with aria-{sub}
                 ):
-                    matches[attr_name] = attr['value']
+                    matches[attr_name] = value
                     break  # stop checking other substrings for this attribute
 
-        # Return matches dict or None if empty
-        return matches or None
+        return matches
 
     def search_attribute_value(self, substrings: List[str], element_or_xpath: Union[str, WebElement]) -> Optional[Dict[str, str]]:
         """
@@ -1046,6 +1343,54 @@ class WebParserUtils:
         else:
             return None
 
+    def get_element_attributes(self, element: WebElement) -> Dict[str, Any]:
+        """
+        Fetches the attributes commonly read while parsing a form element in a single JavaScript round-trip.
+
+        String values follow `WebElement.get_attribute` semantics (property first, then attribute, else None).
+
+        Args:
+            element (WebElement): The element to inspect.
+
+        Returns:
+            Dict[str, Any]: 'tag' (lowercase tag name), 'enabled', 'disabled', 'has-type', 'visible' (bool, same non-null
+                            `offsetParent` rule as `is_xpaths_visible`), 'type', 'id', 'name', 'value',
+                            'placeholder', 'label', 'aria-label', 'title', 'onclick' (str | None) and 'attributes'
+                            (list of {'name', 'value'} dicts).
+        """
+        return self.driver.execute_script("""
+            var el = arguments[0];
+            function attr(name) {
+                var value;
+                try { value = el[name]; } catch (e) {}
+                if (value === null || value === undefined || typeof value === 'object' || typeof value === 'function') {
+                    value = el.getAttribute(name);
+                }
+                return (value === null || value === undefined) ? null : String(value);
+            }
+            var attributes = [];
+            for (var i = 0; i < el.attributes.length; i++) {
+                attributes.push({name: el.attributes[i].name, value: el.attributes[i].value});
+            }
+            return {
+                'tag': el.tagName.toLowerCase(),
+                'enabled': !(el.matches && el.matches(':disabled')),
+                'disabled': el.hasAttribute('disabled') || !!el.disabled,
+                'has-type': el.hasAttribute('type'),
+                'visible': el.offsetParent !== null,
+                'type': attr('type'),
+                'id': attr('id'),
+                'name': attr('name'),
+                'value': attr('value'),
+                'placeholder': attr('placeholder'),
+                'label': attr('label'),
+                'aria-label': attr('aria-label'),
+                'title': attr('title'),
+                'onclick': attr('onclick'),
+                'attributes': attributes
+            };
+        """, element)
+
     def get_tag_count(self, element_or_xpath: Union[str, WebElement], tag_name: str, use_js: bool = True) -> Union[int, None]:
         """
         Returns the count of a specific HTML tag within a given WebElement or XPath.
@@ -1202,7 +1547,7 @@ class WebParserUtils:
                                 print(f"Error extracting text: {e}")
                             lst_ignoreText.append(text.strip(' '))
 
-                if ((i > allowed_split_boundary) and (int(re.search(r'\[(\d+)\]', components[-i]).group(1)) != 1)) or (int(re.search(r'\[(\d+)\]', components[-i]).group(1)) > max_splits_length) or (max_split_occurence == -1):         
+                if ((i > allowed_split_boundary) and (int(_XPATH_INDEX_RE.search(components[-i]).group(1)) != 1)) or (int(_XPATH_INDEX_RE.search(components[-i]).group(1)) > max_splits_length) or (max_split_occurence == -1):         
                     try:
                         if i > allowed_split_boundary:
                             open_text = self.driver.find_element(By.XPATH, '/' + '/'.join(components[:-i])).text
@@ -1218,7 +1563,7 @@ class WebParserUtils:
                     break
                 else:
                     # Element having [1] is not considered split
-                    if int(re.search(r'\[(\d+)\]', components[-i]).group(1)) != 1: # Check if split {#} type is not "# = 1"
+                    if int(_XPATH_INDEX_RE.search(components[-i]).group(1)) != 1: # Check if split {#} type is not "# = 1"
                         max_split_occurence -= 1 # Deduct if split is not 1.
 
             current_components = components[:-i]
@@ -1301,16 +1646,8 @@ class WebParserUtils:
         return None  # Return None if no text is found after all tracebacks
 
     def extract_input_tags(self, html:str) -> set:
-        # Split the HTML string by '<input'
-        input_tags = set()
-        parts = html.split('<input')
-        
-        # For each part after the first split, split by '>' and extract the input tag
-        for part in parts[1:]:  # Skip the first part before the first <input tag
-            input_tag = '<input' + part.split('>')[0] + '>'  # Recreate the full <input> tag
-            input_tags.add(input_tag)
-        
-        return input_tags
+        # Scan only the <input ...> tag spans (linear, no backtracking) instead of splitting the whole HTML
+        return set(_INPUT_TAG_RE.findall(html))
 
     def is_element_after(self, xpath1: str, xpath2: str) -> bool:
         """
@@ -1318,17 +1655,18 @@ class WebParserUtils:
         Uses compareDocumentPosition (bitmask 2 = preceding).
         """
         try:
-            # Resolve xpath1 to WebElement if necessary
-            element1 = self.driver.find_element(By.XPATH, xpath1) if isinstance(xpath1, str) else xpath1
-            element2 = self.driver.find_element(By.XPATH, xpath2) if isinstance(xpath2, str) else xpath2
-
-            if not element1 or not element2:
-                return False  # Elements not found or invalid
-
+            # Resolve both XPaths (or take the WebElements as-is) and compare them in a single round-trip
             # 2 = DOCUMENT_POSITION_PRECEDING (element1 is after element2)
             result = self.driver.execute_script("""
-                return arguments[0].compareDocumentPosition(arguments[1]);
-            """, element1, element2)
+                function resolve(target) {
+                    if (typeof target !== 'string') return target;
+                    return document.evaluate(target, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                }
+                const a = resolve(arguments[0]);
+                const b = resolve(arguments[1]);
+                if (!a || !b) return 0;  // Elements not found or invalid
+                return a.compareDocumentPosition(b);
+            """, xpath1, xpath2)
 
             return bool(result & 2)
         
@@ -1347,26 +1685,45 @@ class WebParserUtils:
         Returns:
             bool: True if the string or any of the strings is found, otherwise False.
         """
-        body_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
+        needles = _lower_tuple((text,) if isinstance(text, str) else tuple(text))
+        if not needles:
+            return False
 
-        if isinstance(text, str):
-            return text.lower() in body_text
-        return any(identifier.lower() in body_text for identifier in text)
+        # Search inside the browser so the (potentially large) body text is never marshalled back
+        return bool(self.driver.execute_script("""
+            const needles = arguments[0];
+            const body = ((document.body && document.body.innerText) || '').toLowerCase();
+            for (const n of needles) {
+                if (body.indexOf(n) !== -1) return true;
+            }
+            return false;
+        """, list(needles)))
 
-    def get_cleaned_text(self, element: WebElement) -> str:
+    def get_cleaned_texts(self, elements: List[WebElement]) -> List[str]:
+        """
+        Returns the visible text of several elements, cleaned inside the browser.
 
-        def clean_text(raw_text: str) -> str:
-            # Remove leading/trailing spaces, newline characters, or special symbols
-            cleaned_text = raw_text.strip()
-            # Remove any unwanted characters like newlines (\n), special characters (e.g., ), etc.
-            cleaned_text = re.sub(r'[^\w\s.,;:*()"\-]', '', cleaned_text)  # Keep only basic punctuation and word chars
-            # Replace multiple spaces or newlines with a single space
-            cleaned_text = re.sub(r'[\n\s]+', ' ', cleaned_text)
-            return cleaned_text.strip()
+        Args:
+            elements (List[WebElement]): Elements whose text should be extracted.
 
-        raw_text = element.text
+        Returns:
+            List[str]: Cleaned text for each element, in the same order.
+        """
+        if not elements:
+            return []
 
-        return clean_text(raw_text)
+        # One round-trip for the whole batch; only the cleaned strings cross the wire.
+        # `\p{L}\p{N}_` mirrors Python's unicode-aware `\w` (see `_CLEAN_RUN_RE`).
+        return self.driver.execute_script("""
+            return arguments[0].map(el => (el.getClientRects().length ? el.innerText : '')  // Like WebElement.text: empty when not rendered
+                .trim()
+                .replace(/[^\\p{L}\\p{N}_\\s.,;:*()"\\-]/gu, '')  // Keep only basic punctuation and word chars
+                .replace(/\\s+/g, ' ')                               // Collapse spaces/newlines
+                .trim());
+        """, list(elements))
+
+    def get_cleaned_text(self, element: WebElement) -> str:
+        return self.get_cleaned_texts([element])[0]
 
     def is_element_in_tag(self, element: WebElement, tag_names: List[str]) -> bool:
         """
@@ -1379,14 +1736,16 @@ class WebParserUtils:
         Returns:
             bool: True if the element is within any of the specified tags, False otherwise.
         """
+        if not tag_names:
+            return False
         try:
-            tag_names = [tag.lower() for tag in tag_names]
-            while element:
-                if element.tag_name.lower() in tag_names:
-                    return True
-                element = element.find_element(By.XPATH, "..")  # Traverse to parent
+            # `closest` walks the element and its ancestors natively in a single round-trip
+            return bool(self.driver.execute_script(
+                "return arguments[0].closest(arguments[1]) !== null;",
+                element, ",".join(tag.lower() for tag in tag_names)
+            ))
         except Exception:
-            pass  # Likely hit the root element or a stale element
+            pass  # Likely a stale element or an invalid selector
 
         return False
 
@@ -1399,17 +1758,20 @@ class WebParserUtils:
         """
         try:
             return self.driver.execute_script("""
-                return Array.from(document.getElementsByTagName('iframe')).filter(function(iframe) {
+                const visible = [];
+                const iframes = document.getElementsByTagName('iframe');
+                for (let i = 0; i < iframes.length; i++) {
+                    const iframe = iframes[i];
+                    // Zero-sized frames (ads, trackers) are rejected before touching getComputedStyle
                     const rect = iframe.getBoundingClientRect();
+                    if (rect.width <= 0 || rect.height <= 0) continue;
+
                     const style = window.getComputedStyle(iframe);
-                    return (
-                        rect.width > 0 &&
-                        rect.height > 0 &&
-                        style.display !== 'none' &&
-                        style.visibility !== 'hidden' &&
-                        style.opacity !== '0'
-                    );
-                });
+                    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') continue;
+
+                    visible.push(iframe);
+                }
+                return visible;
             """)
         except Exception as e:
             print(f"[!] Error fetching visible iframes: {e}")
@@ -1428,26 +1790,29 @@ class WebParserUtils:
         Returns:
             bool: True if any substring is found in any tag's text content, False otherwise.
         """
-        elements = []
-        for tag in tags:
-            elements.extend(self.driver.find_elements(By.TAG_NAME, tag))
-
-        for el in elements:
-            try:
-                text = el.text.strip()
-
-                if case_sensitive:
-                    match = any(sub in text for sub in substrings)
-                else:
-                    text_lower = text.lower()
-                    match = any(sub.lower() in text_lower for sub in substrings)
-
-                if match:
-                    return True
-            except Exception:
-                continue  # Skip elements that throw exceptions
+        # Normalize needles once on the Python side so the browser only compares
+        needles = tuple(substrings) if case_sensitive else _lower_tuple(tuple(substrings))
+        if not needles or not tags:
+            return False
 
-        return False
+        try:
+            # Gather, (optionally) lowercase and test every tag's text inside the browser in a single round-trip
+            return bool(self.driver.execute_script("""
+                const tags = arguments[0], subs = arguments[1], cs = arguments[2];
+                for (const t of tags) {
+                    for (const el of document.getElementsByTagName(t)) {
+                        let txt = (el.getClientRects().length ? el.innerText : '').trim(); // Like WebElement.text: empty when not rendered
+                        if (!cs) txt = txt.toLowerCase();
+                        for (const s of subs) {
+                            if (txt.includes(s)) return true;
+                        }
+                    }
+                }
+                return false;
+            """, list(tags), list(needles), case_sensitive))
+        except Exception as e:
+            logger.warning(f"⚠️  Unable to search substrings in tags: {e}")
+            return False
 
     def _reduce_xpath_to_unique_match(self, relative_xpath: str) -> Optional[str]:
         """
@@ -1462,8 +1827,7 @@ class WebParserUtils:
         :return: Longest valid XPath (str) or None.
         """
         # Extract tag and attribute filters
-        pattern = r"//(\w+)((\[[^\]]+\])*)"
-        match = re.match(pattern, relative_xpath)
+        match = _TAG_ATTRS_RE.match(relative_xpath)
         if not match:
             return None  # Invalid XPath structure
 
@@ -1471,50 +1835,29 @@ class WebParserUtils:
         attrs_str = match.group(2)
 
         # Extract all attribute bracketed filters like [@...], [contains(...)], etc.
-        attr_filters = re.findall(r"(\[[^\]]+\])", attrs_str)
-
-        # Try reducing attributes from right to left
-        for i in reversed(range(len(attr_filters))):
-            test_xpath = f"//{tag}" + ''.join(attr_filters[:i+1])
-            if self.is_unique_xpath(test_xpath):
-                return test_xpath
-
-        # As last resort, try with only the tag (e.g., "//input")
-        minimal_xpath = f"//{tag}"
-        if self.is_unique_xpath(minimal_xpath):
-            return minimal_xpath
-        
-        return None
+        attr_filters = _ATTR_FILTER_RE.findall(attrs_str)
 
-    def _clean_dynamic_attributes(self, relative_xpath: str, aggressive: bool = False):
+        # Candidates from longest to shortest: reduce attributes from right to left,
+        # and as last resort try with only the tag (e.g., "//input")
+        candidates = [f"//{tag}" + ''.join(attr_filters[:i+1]) for i in reversed(range(len(attr_filters)))]
+        candidates.append(f"//{tag}")
 
-        if not aggressive:
-            # Pattern to match any attribute that contains 'value' OR is 'tabindex'
-            pattern = r'\[@[^=]*value[^=]*=[^\]]*\]|\[@tabindex=[^\]]*\]'
-            # Remove the matched patterns
-            cleaned_xpath = re.sub(pattern, '', relative_xpath)
-            # Optional: Remove redundant brackets from consecutive conditions
-            cleaned_xpath = re.sub(r'\]\[', '][', cleaned_xpath)
-            return cleaned_xpath.strip()
-        else:
-            # Define a list of dynamic attribute patterns to remove
-            dynamic_attrs = [
-                r'id',
-                r'class',
-                r'tabindex',
-                r'placeholder',
-                r'style',
-                r'autocomplete',
-                r'data-[^=]*',           # matches all data-* attributes
-                r'[^=]*value[^=]*'       # matches any attribute name containing "value"
-            ]     
-            # Combine into a regex to match any of the listed attributes with a value
-            pattern = r'\[@(?:' + '|'.join(dynamic_attrs) + r')=[^\]]*\]'
-            # Remove all matching attributes from XPath
-            cleaned_xpath = re.sub(pattern, '', relative_xpath)
-            # Optionally clean up extra brackets between attributes
-            cleaned_xpath = re.sub(r'\]\[', '][', cleaned_xpath)
-            return cleaned_xpath.strip()
+        # Probe all candidates in a single round-trip; the browser returns the first unique one
+        try:
+            return self.driver.execute_script("""
+                for (const xp of arguments[0]) {
+                    try {
+                        const snapshot = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                        if (snapshot.snapshotLength === 1) return xp;
+                    } catch (e) {}  // Invalid candidate, keep reducing
+                }
+                return null;
+            """, candidates)
+        except WebDriverException:
+            return next((xp for xp in candidates if self.is_unique_xpath(xp)), None)
+
+    def _clean_dynamic_attributes(self, relative_xpath: str, aggressive: bool = False):
+        return _strip_dynamic_attributes(relative_xpath, aggressive)
 
     def remap_relative_xpath(self, xpath: str) -> str | None:
         """
@@ -1534,6 +1877,9 @@ class WebParserUtils:
             str | None: A uniquely matched XPath string after remapping or None if no unique match is found.
         """
 
+        # Probes below run against the same DOM snapshot, so they may share cached counts
+        self.bump_dom_revision()
+
         count = self.count_elements_by_xpath(xpath)
         if count == 1:
             logger.info("✅  Valid relative XPath found.")
@@ -1609,35 +1955,71 @@ class WebParserUtils:
 
     def is_field_required(self, element: WebElement) -> bool:
         """Check whether a form field is required based on various attributes and DOM context."""
-        
-        if element.get_attribute("required") is not None:
+        return self.are_fields_required([element])[0]
+
+    def are_fields_required(self, elements: List[WebElement]) -> List[bool]:
+        """
+        `is_field_required` for several elements, fetching every element's signals (attributes, visible error
+        indicators near the field, validity) in a single round-trip.
+
+        Returns:
+            List[bool]: Required flags parallel to `elements`.
+        """
+        if not elements:
+            return []
+        signals_list: list = self.driver.execute_script("""
+            return arguments[0].map(el => {
+                const attrs = {};
+                for (const a of el.attributes) attrs[a.name] = a.value;
+
+                let ancestorError = false;
+                try {
+                    const parent = el.parentElement;
+                    if (parent) {
+                        const snapshot = document.evaluate(".//*[contains(text(), 'required') or contains(@class, 'error')]", parent, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                        for (let i = 0; i < snapshot.snapshotLength; i++) {
+                            const node = snapshot.snapshotItem(i);
+                            const style = window.getComputedStyle(node);
+                            if (node.getClientRects().length > 0 && style.display !== 'none' && style.visibility !== 'hidden') {
+                                ancestorError = true;
+                                break;
+                            }
+                        }
+                    }
+                } catch (e) {}
+
+                let invalid = false;
+                try {
+                    invalid = !!(el.willValidate && !el.checkValidity());
+                } catch (e) {}
+
+                return {attrs: attrs, ancestorError: ancestorError, invalid: invalid};
+            });
+        """, list(elements)) or []
+        return [self._is_required_by_signals(signals or {}) for signals in signals_list]
+
+    def _is_required_by_signals(self, signals: dict) -> bool:
+        """Required decision over the signals gathered by `are_fields_required` for one element."""
+        attrs: dict = signals.get('attrs') or {}
+
+        if 'required' in attrs:
             return True
-        if element.get_attribute("data-required") is not None and element.get_attribute("data-required").strip().lower() in {"", "true", "1"}:
+        if (data_required := attrs.get("data-required")) is not None and data_required.strip().lower() in {"", "true", "1"}:
             return True
-        if "true" in (self.search_attribute("required", element) or dict()).values(): # Covers other attributes like "aria-required", etc.
+        if "true" in self._match_attribute_names("required", attrs.items()).values(): # Covers other attributes like "aria-required", etc.
             return True
-        if element.get_attribute("aria-invalid") == "true":
+        if attrs.get("aria-invalid") == "true":
             return True
 
-        class_name = element.get_attribute("class") or ""
+        class_name = attrs.get("class") or ""
         if any(keyword in class_name.lower() for keyword in ["required", "error", "has-error"]):
             return True
 
-        try:
-            parent = element.find_element(By.XPATH, "./ancestor::*[1]")
-            error_spans = parent.find_elements(By.XPATH, ".//*[contains(text(), 'required') or contains(@class, 'error')]")
-            for span in error_spans:
-                if span.is_displayed():
-                    return True
-        except Exception:
-            pass
+        if signals.get('ancestorError'):
+            return True
 
-        try:
-            is_invalid = self.driver.execute_script("return arguments[0].willValidate && !arguments[0].checkValidity();", element)
-            if is_invalid:
-                return True
-        except Exception:
-            pass
+        if signals.get('invalid'):
+            return True
 
         return False
 
@@ -1663,16 +2045,32 @@ class WebParserUtils:
         if not xpath or not tag_name:
             return False
 
-        # Remove predicates like [@id='main'] or [1]
-        xpath_cleaned = re.sub(r'\[[^\]]*\]', '', xpath.strip())
-
-        # Split into parts, ignoring leading/trailing slashes
-        parts = xpath_cleaned.strip('/').split('/')
-
-        if not parts:
-            return False
+        # Walk back from the end over trailing slashes and predicates like [@id='main'] or [1]
+        # so only the final step is inspected, regardless of how long the XPath is
+        xpath = xpath.strip()
+        end = len(xpath)
+        while end:
+            char = xpath[end - 1]
+            if char == '/':
+                end -= 1
+            elif char == ']':
+                depth = 0
+                i = end - 1
+                while i >= 0:
+                    if xpath[i] == ']':
+                        depth += 1
+                    elif xpath[i] == '[':
+                        depth -= 1
+                        if not depth:
+                            break
+                    i -= 1
+                if i < 0:
+                    return False  # Unbalanced predicate
+                end = i
+            else:
+                break
 
-        last_tag = parts[-1]
+        last_tag = xpath[xpath.rfind('/', 0, end) + 1:end]
 
         # Handle wildcard
         if last_tag == '*':
@@ -1684,55 +2082,81 @@ class WebParserUtils:
         return last_tag_only == tag_name
 
     def is_xpath_visible(self, xpath: str) -> bool:
-        if isinstance(xpath, str):
-            is_visible = self.driver.execute_script("return document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue?.offsetParent !== null;", xpath)
-            return True if is_visible else False
-        return False
+        return self.is_xpaths_visible([xpath])[0]
 
-    def query_all_elements(self, tag_names: Optional[Union[str, List[str]]] = '*', predicate_js: Optional[str] = None) -> List[WebElement]:
+    def is_xpaths_visible(self, xpaths: List[str]) -> List[bool]:
         """
-        Retrieve elements (from both DOM and shadow DOMs) matching tag names and optional JavaScript predicate.
+        Checks visibility (non-null `offsetParent`) of several XPaths in a single round-trip.
 
         Args:
-            tag_names (str | List[str] | None): Single tag name, list of tag names, or '*' for all. Default is '*'.
-            predicate_js (str | None): Optional JavaScript condition as string that receives `el` and returns a boolean.
+            xpaths (List[str]): XPath strings to check. Non-string entries are reported as not visible.
 
         Returns:
-            List[WebElement]: List of matching WebElement handles.
+            List[bool]: Visibility flags parallel to `xpaths`.
         """
+        xpaths = list(xpaths)
+        string_xpaths = [xpath for xpath in xpaths if isinstance(xpath, str)]
+        if not string_xpaths:
+            return [False] * len(xpaths)
 
-        js = """
-            const tags = arguments[0];
-            const predicateSource = arguments[1];
+        flags = iter(self.driver.execute_script("""
+            return arguments[0].map(xp =>
+                document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue?.offsetParent !== null
+            );
+        """, string_xpaths))
+        return [bool(next(flags)) if isinstance(xpath, str) else False for xpath in xpaths]
 
+    _DEEP_SEARCH_INSTALL_JS = """
+        window.__jp_deep_search__ = function(tags, predicateSource) {
             const matches = [];
 
             const predicate = predicateSource
                 ? new Function('el', predicateSource)
                 : null;
 
+            // `tags === null` is the wildcard: every element passes the tag check
+            const wildcard = tags === null;
+
             function deepSearch(node) {
                 if (!node || node.nodeType !== 1) return;
 
-                const tag = node.tagName.toLowerCase();
-                const tagMatches = tags.includes(tag);
-                const predMatches = predicate ? predicate(node) : true;
-
-                if (tagMatches && predMatches) {
+                const tagMatches = wildcard || tags.includes(node.tagName.toLowerCase());
+                if (tagMatches && (!predicate || predicate(node))) {
                     matches.push(node);
                 }
 
-                // Recurse into shadow root if present
+                // Recurse into shadow root if present (index loops avoid an array + closure per node)
                 if (node.shadowRoot) {
-                    Array.from(node.shadowRoot.children).forEach(deepSearch);
+                    const shadowChildren = node.shadowRoot.children;
+                    for (let i = 0; i < shadowChildren.length; i++) deepSearch(shadowChildren[i]);
                 }
 
                 // Recurse into child elements
-                Array.from(node.children).forEach(deepSearch);
+                const children = node.children;
+                for (let i = 0; i < children.length; i++) deepSearch(children[i]);
             }
 
             deepSearch(document.body);
             return matches;
+        };
+    """
+
+    _DEEP_SEARCH_INVOKE_JS = """
+        return typeof window.__jp_deep_search__ === 'function'
+            ? window.__jp_deep_search__(arguments[0], arguments[1])
+            : null;
+    """
+
+    def query_all_elements(self, tag_names: Optional[Union[str, List[str]]] = '*', predicate_js: Optional[str] = None) -> List[WebElement]:
+        """
+        Retrieve elements (from both DOM and shadow DOMs) matching tag names and optional JavaScript predicate.
+
+        Args:
+            tag_names (str | List[str] | None): Single tag name, list of tag names, or '*' for all. Default is '*'.
+            predicate_js (str | None): Optional JavaScript condition as string that receives `el` and returns a boolean.
+
+        Returns:
+            List[WebElement]: List of matching WebElement handles.
         """
 
         # Normalize tag_names input
@@ -1746,37 +2170,39 @@ class WebParserUtils:
         else:
             raise ValueError("tag_names must be a string, list of strings, or None.")
 
-        # If tag_names is ['*'], treat as wildcard
-        tags = '*' if tag_names == ['*'] else tag_names
+        # If tag_names contains '*', treat as wildcard (sent as null so the browser skips the tag check)
+        tags = None if '*' in tag_names else tag_names
 
-        return self.driver.execute_script(js, tags, predicate_js)
+        # The deep-search function lives on `window`, so it is parsed once per page load and
+        # then invoked by name. Navigation wipes it, in which case the invoke script returns
+        # null (a real search always returns an array) and we re-install before invoking.
+        matches = self.driver.execute_script(self._DEEP_SEARCH_INVOKE_JS, tags, predicate_js)
+        if matches is None:
+            matches = self.driver.execute_script(self._DEEP_SEARCH_INSTALL_JS + self._DEEP_SEARCH_INVOKE_JS, tags, predicate_js)
+        return matches
 
 
 class LinguisticTextEvaluator:
 
     def __init__(self):
         initialize_nltk_resources()  # Ensures one-time global setup (downloads NLTK resources)
+        self._tagger = PerceptronTagger()  # Loading the pickled model is expensive, so do it once per instance
+        self._relevance_cache: Dict[tuple, bool] = {} # (text, *flags) -> is_relevant_string verdict
 
     def _split_tokens(self, text: str):
         """
         Splits camelCase, snake_case, kebab-case, and alphanumeric words
         into lowercase tokens.
         """
-        # Replace common separators with space
-        text = re.sub(r"[_\-]+", " ", text)
-        # Split camelCase (add space before capital letters following lowercase)
-        text = re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', text)
-        # Split between letters and numbers
-        text = re.sub(r'(?<=[a-zA-Z])(?=[0-9])', ' ', text)
-        text = re.sub(r'(?<=[0-9])(?=[a-zA-Z])', ' ', text)
-
-        return text.lower().split()
+        # Replace common separators with space, then insert a space at every camelCase and
+        # letter/digit transition in one scan (alternation of the three boundary lookarounds)
+        return _TOKEN_BOUNDARY_RE.sub(' ', text.translate(_SEP_TABLE)).lower().split()
     
     def _is_valid_token(self, token: str) -> bool:
         """
         Returns True if token is mostly alphabetic and at least 2 characters (not purely numeric or symbolic).
         """
-        return re.match(r'^[a-zA-Z]{2,}$', token) is not None
+        return len(token) >= 2 and token.isascii() and token.isalpha()  # Same as ^[a-zA-Z]{2,}$ without the regex engine
 
     def _is_technical_token(self, text: str) -> bool:
         """
@@ -1797,35 +2223,48 @@ class LinguisticTextEvaluator:
         # Clean up text (strip leading/trailing spaces)
         text = text.strip()
 
+        if not text:
+            return True
+
+        # Character-class counts via str.translate (deletion tables run in C, no per-character Python work)
+        total_length = len(text)
+        n_hex = total_length - len(text.translate(_DROP_HEX))
+        n_digit = total_length - len(text.translate(_DROP_DIGITS))
+        n_punct = total_length - len(text.translate(_DROP_PUNCT))
+        n_ascii_alpha = total_length - len(text.translate(_DROP_ASCII_ALPHA))
+
         # --- 1. Hash-like strings (hexadecimal and long) ---
-        if len(text) > 30 and re.fullmatch(r'[a-f0-9]{32,}', text, re.IGNORECASE):
+        if total_length >= 32 and n_hex == total_length:
             return True  # Likely a hash value (e.g., SHA256)
 
         # --- 2. UUID pattern ---
-        if re.fullmatch(r'[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}', text, re.IGNORECASE):
+        if (
+            total_length == 36
+            and text[8] == text[13] == text[18] == text[23] == '-'
+            and n_hex == 32
+        ):
             return True  # Common UUID format (e.g., '123e4567-e89b-12d3-a456-426614174000')
 
         # --- 3. Strings with no alphabetic characters ---
-        if not re.search(r'[a-zA-Z]', text):
+        if not n_ascii_alpha:
             return True  # If no alphabetic characters, it's likely a code or ID
 
         # --- 4. Excessive numbers ---
-        if sum(c.isdigit() for c in text) / len(text) > 0.5:
+        if n_digit / total_length > 0.5:
             return True  # Mostly numbers, so it's likely a numeric code
 
         # --- 5. Strings with too many symbols or punctuation ---
-        if sum(c in string.punctuation for c in text) / len(text) > 0.5:
+        if n_punct / total_length > 0.5:
             return True  # If punctuation marks dominate the string, it's likely an identifier
 
         # --- 6. Hyphen or underscore in field names (Dynamic Analysis) ---
         # Checking for multiple fragments separated by hyphens or underscores (e.g., 'user-name', 'email_address')
         if '--' in text or '_' in text:
             # Split text by hyphen or underscore
-            fragments = re.split(r'[-_]', text)
+            fragments = _HYPHEN_UNDERSCORE_RE.split(text)
             
             # Calculate the percentage of the string affected by these separators
             num_fragments = len(fragments)
-            total_length = len(text)
             
             # Set a threshold of 25% or more of the text being split into fragments
             fragment_threshold = 0.25
@@ -1833,11 +2272,11 @@ class LinguisticTextEvaluator:
                 return True  # If more than 25% of the text is structured, treat as an identifier
 
         # --- 7. CamelCase with separators ---
-        if re.search(r'[a-z][A-Z]', text) and re.search(r'[_\-]', text):
+        if _ID_CAMEL_RE.search(text) and _HYPHEN_UNDERSCORE_RE.search(text):
             return True  # CamelCase with underscores or hyphens indicates technical field names
 
         # --- 8. Short fragments split by hyphens or underscores ---
-        parts = re.split(r'[-_]', text)
+        parts = _HYPHEN_UNDERSCORE_RE.split(text)
         if len(parts) >= 3 and all(len(p) <= 4 or p.lower() not in ENGLISH_WORDS for p in parts):
             return True  # If fragmented into short, technical-like words
         
@@ -1862,15 +2301,15 @@ class LinguisticTextEvaluator:
 
         # --------------------------------------
         # 1. Split text into "words"
-        words = re.split(r'\s+', original_text)
+        words = _WS_SPLIT_RE.split(original_text)
         total_words = len(words)
 
         # Normalize separators for identifier parts
         identifier_like_words = [
             word for word in words
-            if re.search(r'[_\-]{1,2}', word)           # snake_case, kebab-case, --delimiter
-            or re.search(r'[a-z][A-Z]', word)           # camelCase
-            or re.search(r'\w+\d+\w*', word)            # embedded digits
+            if _ID_SNAKE_RE.search(word)                # snake_case, kebab-case, --delimiter
+            or _ID_CAMEL_RE.search(word)                # camelCase
+            or _ID_DIGIT_RE.search(word)                # embedded digits
         ]
 
         identifier_ratio = len(identifier_like_words) / total_words if total_words else 1.0
@@ -1895,7 +2334,7 @@ class LinguisticTextEvaluator:
         # --------------------------------------
         # 4. Heuristic: If most characters are non-space and non-punctuation
         # Suggests a dense, compact identifier-like blob
-        text_no_spaces = re.sub(r'\s+', '', original_text)
+        text_no_spaces = _WS_SPLIT_RE.sub('', original_text)
         non_alpha_ratio = sum(1 for c in text_no_spaces if not c.isalpha()) / len(text_no_spaces)
         if non_alpha_ratio > 0.5 and total_words <= 3:
             return True
@@ -1903,7 +2342,7 @@ class LinguisticTextEvaluator:
         # --------------------------------------
         # 5. Heuristic: No sentence-like structure (no verbs, no punctuation, no natural phrasing)
         # If the whole string lacks verbs or sentence flow, likely not meaningful
-        if not re.search(r'[.?!]', original_text) and total_words <= 4:
+        if not _SENTENCE_PUNCT_RE.search(original_text) and total_words <= 4:
             if all(w in identifier_like_words for w in words):
                 return True
 
@@ -1944,6 +2383,45 @@ class LinguisticTextEvaluator:
         Returns:
             bool: True if the string is relevant human-readable text, False otherwise.
         """
+        if not isinstance(text, str):
+            return self._evaluate_relevance(text, threshold, min_token_length, use_stopwords, use_lemmatizer, min_relevant_words, min_valid_phrases, filter_technical_token, filter_technical_text)
+
+        # The same labels/ids recur across fields and pages; tokenizing + POS tagging is the expensive part
+        key = (text, threshold, min_token_length, use_stopwords, use_lemmatizer, min_relevant_words, min_valid_phrases, filter_technical_token, filter_technical_text)
+        cached = self._relevance_cache.get(key)
+        if cached is None:
+            if len(self._relevance_cache) >= 8192:
+                self._relevance_cache.clear()
+            cached = self._relevance_cache[key] = self._evaluate_relevance(*key)
+        return cached
+
+    def filter_relevant_strings(self, texts: Iterable[str], **flags) -> List[str]:
+        """
+        Returns the texts (in order) for which `is_relevant_string(text, **flags)` holds.
+        Duplicates are evaluated once.
+        """
+        verdicts: Dict[str, bool] = {}
+        relevant = []
+        for text in texts:
+            if text not in verdicts:
+                verdicts[text] = self.is_relevant_string(text, **flags)
+            if verdicts[text]:
+                relevant.append(text)
+        return relevant
+
+    def _evaluate_relevance(
+        self,
+        text: str,
+        threshold: float,
+        min_token_length: int,
+        use_stopwords: bool,
+        use_lemmatizer: bool,
+        min_relevant_words: int,
+        min_valid_phrases: int,
+        filter_technical_token: bool,
+        filter_technical_text: bool
+    ) -> bool:
+        """Uncached implementation of `is_relevant_string`."""
 
         # Early rejection for strings that look like structured/technical identifiers
         if filter_technical_text and self.is_non_natural_text(text):
@@ -1953,14 +2431,28 @@ class LinguisticTextEvaluator:
         if not text or not isinstance(text, str):
             return False
 
+        # Every accepted token is at least `min_token_length` characters of `text`, so short strings can never qualify
+        if len(text) < min_token_length * min_relevant_words:
+            return False
+
         # Tokenize the input string
         tokens = self._split_tokens(text)
-        if not tokens:
+        if not tokens or len(tokens) < min_relevant_words:
             return False
 
         # Part-of-speech tagging for each token
-        tagger = PerceptronTagger()
-        tagged_tokens = tagger.tag(tokens)
+        tagged_tokens = self._tagger.tag(tokens)
+
+        # Phrase-level check first (cheap): count meaningful POS-tagged bigrams, stopping once enough are found
+        valid_phrases = 0
+        if min_valid_phrases > 0:
+            for (w1, t1), (w2, t2) in zip(tagged_tokens, tagged_tokens[1:]):
+                if (t1, t2) in PHRASE_PATTERNS:
+                    valid_phrases += 1
+                    if valid_phrases >= min_valid_phrases:
+                        break
+            if valid_phrases < min_valid_phrases:
+                return False
 
         valid_tokens = []
 
@@ -1981,30 +2473,27 @@ class LinguisticTextEvaluator:
             if tag not in VALID_POS_TAGS:
                 continue
 
+            word = token.lower()
+
             # Optionally filter out stopwords
-            if use_stopwords and (token.lower() in STOPWORDS):
+            if use_stopwords and (word in STOPWORDS):
                 continue
 
             # Optionally lemmatize (e.g., "running" -> "run")
             if use_lemmatizer:
-                token = LEMMATIZER.lemmatize(token)
+                word = LEMMATIZER.lemmatize(word).lower()
 
             # Only accept tokens found in English dictionary
-            if token.lower() in ENGLISH_WORDS:
-                valid_tokens.append(token.lower())
-
-        # Phrase-level check: count meaningful POS-tagged bigrams
-        valid_phrases = 0
-        bigrams = list(ngrams(tagged_tokens, 2))
-        for (w1, t1), (w2, t2) in bigrams:
-            if (t1, t2) in PHRASE_PATTERNS:
-                valid_phrases += 1
+            if word in ENGLISH_WORDS:
+                valid_tokens.append(word)
+                # Both thresholds only get easier as tokens are added, so stop as soon as they hold
+                if len(valid_tokens) >= min_relevant_words and (len(valid_tokens) / len(tokens)) >= threshold:
+                    return True
 
         # Final decision based on valid token ratio and thresholds
         return (
             (len(valid_tokens) / len(tokens)) >= threshold and
-            len(valid_tokens) >= min_relevant_words and
-            valid_phrases >= min_valid_phrases
+            len(valid_tokens) >= min_relevant_words
         )
 
     def filter_normalized_metadata(self, normalized: dict, threshold: float = 0.3) -> str:
@@ -2012,12 +2501,12 @@ class LinguisticTextEvaluator:
 
         # Flatten and join labels if they exist and are relevant
         
-        relevant_labels = [label for label in normalized["labels"] if self.is_relevant_string(label, threshold, min_token_length=3, use_stopwords=False, use_lemmatizer=True, min_relevant_words=2, min_valid_phrases=1, filter_technical_token=True, filter_technical_text=True)]
+        relevant_labels = self.filter_relevant_strings(normalized["labels"], threshold=threshold, min_token_length=3, use_stopwords=False, use_lemmatizer=True, min_relevant_words=2, min_valid_phrases=1, filter_technical_token=True, filter_technical_text=True)
         if relevant_labels:
             parts.append(f"Label(s): {', '.join(relevant_labels)}")
 
         # Flatten and join IDs if they exist and are relevant
-        relevant_ids = [i for i in normalized["ids"] if self.is_relevant_string(i, threshold, min_token_length=3, use_stopwords=False, use_lemmatizer=False, min_relevant_words=2, min_valid_phrases=0, filter_technical_token=True, filter_technical_text=False)]
+        relevant_ids = self.filter_relevant_strings(normalized["ids"], threshold=threshold, min_token_length=3, use_stopwords=False, use_lemmatizer=False, min_relevant_words=2, min_valid_phrases=0, filter_technical_token=True, filter_technical_text=False)
         if relevant_ids:
             parts.append(f"Id(s): {', '.join(relevant_ids)}")
 
@@ -2038,6 +2527,10 @@ class ParsedDataUtils:
 
     def __init__(self, parsed_data: Dict[str, Any] = dict()):
         self.parsed_data = parsed_data
+        self._matcher_cache: Dict[frozenset, Any] = {} # Needle set -> matcher (see `_needle_matcher`)
+        self._blacklist_matchers: Dict[int, tuple] = {} # id(blacklist) -> (blacklist, size, matcher)
+        self._blacklist_lengths: Dict[int, tuple] = {} # id(full blacklist) -> (blacklist, size, entry lengths)
+        self._norm_cache: Dict[tuple, dict] = {} # Raw label/id/name/placeholder values -> `normalize_metadata` result
 
     def get_fields(self) -> List[Dict[str, Any]]:
         """Returns the fields from the parsed data."""
@@ -2074,18 +2567,88 @@ class ParsedDataUtils:
         return self.parsed_data.get('links', [])
 
     def match_full_blacklist(self, blacklist: set, candidates: Iterable[str]) -> bool:
-        return any(val.lower() in blacklist for val in candidates if val is not None)
+        if not blacklist: # Many configured blacklists are empty: skip lowercasing the candidates
+            return False
+        entry = self._blacklist_lengths.get(id(blacklist))
+        if entry is None or entry[0] is not blacklist or entry[1] != len(blacklist):
+            entry = (blacklist, len(blacklist), frozenset(len(full) for full in blacklist if isinstance(full, str)))
+            self._blacklist_lengths[id(blacklist)] = entry
+        lengths = entry[2]
+        # An ASCII value keeps its length when lowercased: skip lowercasing values no entry could equal
+        return any(val.lower() in blacklist for val in candidates if val is not None and (len(val) in lengths or not val.isascii()))
 
     def match_partial_blacklist(self, blacklist: set, candidates: Iterable[str]) -> bool:
-        return any(
-            partial.lower() in val.lower()
-            for val in candidates if val
-            for partial in blacklist
-        )
+        if not blacklist:
+            return False
+        values = [val.lower() for val in candidates if val]
+        if not values:
+            return False
+
+        # Blacklists are module-level constants: resolve their matcher by identity instead of
+        # re-lowercasing every entry per call (the length check catches in-place edits)
+        entry = self._blacklist_matchers.get(id(blacklist))
+        if entry is None or entry[0] is not blacklist or entry[1] != len(blacklist):
+            entry = (blacklist, len(blacklist), self._blacklist_searcher(partial.lower() for partial in blacklist))
+            self._blacklist_matchers[id(blacklist)] = entry
+
+        # One scan over all candidates; the NUL separator keeps matches from spanning two values
+        return entry[2]('\x00'.join(values))
+
+    def match_attribute_value_blacklist(self, full_blacklist: set, partial_blacklist: set, attributes: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Checks an element's attributes (as `{'name', 'value'}` dicts) against attribute-value blacklists:
+        True if any value equals a full-blacklist entry or contains a partial-blacklist entry (case-insensitive).
+        """
+        if not full_blacklist and not partial_blacklist:
+            return False
+        # Lowercase each attribute value once rather than once per blacklist entry
+        lowered_values = [(attr['value'] or '').lower() for attr in attributes]
+        if full_blacklist and not {full.lower() for full in full_blacklist}.isdisjoint(lowered_values):
+            return True
+        return any(partial.lower() in value for partial in partial_blacklist for value in lowered_values)
 
     def _is_iterable(self, variable: Any) -> bool:
         return isinstance(variable, Iterable) and not isinstance(variable, (str, bytes))
 
+    def _blacklist_searcher(self, needles: Iterable[str]):
+        """
+        Returns a predicate telling whether a value contains any of the needles.
+
+        Uses the Aho–Corasick `_needle_matcher` when `pyahocorasick` is installed; otherwise the needles are
+        compiled into one regex alternation (longest first), so the value is still scanned once in C rather
+        than once per needle.
+        """
+        needles = frozenset(needles)
+        if ahocorasick is not None and needles and '' not in needles:
+            matcher = self._needle_matcher(needles)
+            return lambda value: next(matcher(value), None) is not None
+        pattern = re.compile('|'.join(map(re.escape, sorted(needles, key=len, reverse=True)))) if needles else None
+        return lambda value: pattern is not None and pattern.search(value) is not None
+
+    def _needle_matcher(self, needles: Iterable[str]):
+        """
+        Returns a callable that yields every needle contained in a given value.
+
+        Backed by an Aho–Corasick automaton when `pyahocorasick` is installed, so each value is
+        scanned once regardless of how many needles there are. Matchers are cached per needle set
+        because the same identifier lists are searched over and over.
+        """
+        needles = frozenset(needles)
+        matcher = self._matcher_cache.get(needles)
+        if matcher is None:
+            if ahocorasick is not None and needles and '' not in needles:
+                automaton = ahocorasick.Automaton()
+                for needle in needles:
+                    automaton.add_word(needle, needle)
+                automaton.make_automaton()
+                matcher = lambda value: (needle for _, needle in automaton.iter(value))
+            else:
+                matcher = lambda value: (needle for needle in needles if needle in value)
+            if len(self._matcher_cache) >= 256:
+                self._matcher_cache.clear()
+            self._matcher_cache[needles] = matcher
+        return matcher
+
     def search_items(self, sections: List[str], start_index: int = 0, keys: List[str] = None, substrings: Union[str,Iterable[str]] = None, order_search_by_substring: bool = False, filter_dict: Dict[str, Any] = None, return_first_only : bool = False, normalize_whitespace : bool = False) -> List[Dict[str, Any]]:
         """
         Searches for the first item in the given sections where any of the specified keys
@@ -2116,61 +2679,78 @@ class ParsedDataUtils:
                     substring = substring.replace(' ', '')  # Remove spaces
                 substrings[i] = substring.lower()  # Update the list element with the modified substring
 
-        if order_search_by_substring:
-            for substring in substrings or []:
-                for section in sections:
-                    for idx, item in enumerate(self.parsed_data.get(section, [])):
-                        if idx < start_index:
-                            continue
-                        if filter_dict and not all(item.get(k) == v for k, v in filter_dict.items()):
-                            continue
-                        for key in (keys or item.keys()):
-                            value = item.get(key)
-                            if isinstance(value, str):
-                                value = value.lower()
-                                match_value = value.replace(' ', '') if normalize_whitespace else value
-                                match_substring = substring.replace(' ', '') if normalize_whitespace or key in ["id", "id-custom"] else substring
-                                if match_substring in match_value:
-                                    if return_first_only:
-                                        return [item]
-                                    if item not in matched_items:
-                                        matched_items.append(item)
-                                    break  # Don't double-match same item across keys
-        else:
+        # Substrings are matched without spaces against "id" / "id-custom" values
+        id_keys = frozenset(("id", "id-custom"))
+        if substrings is not None:
+            matcher = self._needle_matcher(substrings)
+            id_matcher = self._needle_matcher(substring.replace(' ', '') for substring in substrings)
+
+        def get_matches(item: Dict[str, Any]):
+            """Yields (key, matched substring) pairs for every string value of the item."""
+            for key in (keys or item.keys()):
+                value = item.get(key)
+                if isinstance(value, str):
+                    # Lowercased (and space-stripped, if `normalize_whitespace` is True) value, normalized once per distinct string
+                    value = _normalized_value(value)[value_slot]
+                    for needle in (id_matcher if key in id_keys else matcher)(value):
+                        yield key, needle
+
+        # Loop invariants, hoisted out of the per-item loops
+        filter_items = tuple(filter_dict.items()) if filter_dict else None
+        value_slot = 1 if normalize_whitespace else 0 # Index into `_normalized_value` result
+        first_index = max(start_index, 0)
+
+        def iter_candidates():
+            """Yields items in section order that pass `start_index` and `filter_dict`."""
             for section in sections: # Loop through the sections
-                for idx, item in enumerate(self.parsed_data.get(section, [])): # Loop through the items in each section
-                    if idx < start_index:
-                        continue
-                    if filter_dict: # Check if filter_dict is provided
-                        # If any filter condition is not met, skip this item
-                        if not all(item.get(key) == value for key, value in filter_dict.items()):
-                            continue
-                    if substrings is None: # Return all filtered items (when substring not given)
-                        matched_items.append(item)
+                for item in itertools.islice(self.parsed_data.get(section, []), first_index, None): # Loop through the items in each section
+                    # If any filter condition is not met, skip this item
+                    if filter_items and not all(item.get(key) == value for key, value in filter_items):
                         continue
-                    item_matched = False  # Flag to track if item has been matched
-                    for key in (keys or item.keys()): # Loop through each key in the item. Search all keys if not passed as argument.
-                        value = item.get(key)
-                        if isinstance(value, str): # Check if the value is a string
-                            value = value.lower()  # Convert value to lowercase for case-insensitive comparison
-                            
-                            # Remove spaces in the value if `normalize_whitespace` is True
-                            if normalize_whitespace:
-                                value = value.replace(' ', '')
-
-                            for substring in substrings:
-                                # Shrink the substring if the key is "id" or "id-custom"
-                                if key in ["id", "id-custom"]:
-                                    substring = substring.replace(' ', '') # Remove spaces from substring
-                                if substring in value: # Check if any of the substring is present in the value
-                                    if return_first_only:
-                                        return [item] # Return the first match if `return_first_only` is True
-                                    item_matched = True  # Mark that the item has been matched
-                                    matched_items.append(item)
-                                    break # Break out of the loop if a match is found
-                        
-                        if item_matched:  # Stop checking further keys once we have matched the item
-                            break  # Exit the loop for the current item
+                    yield item
+
+        if order_search_by_substring:
+            if not substrings:
+                return matched_items
+            # Rank each item by the earliest substring (in the given order) it contains, then emit items
+            # substring by substring (section order is kept within a substring).
+            # For id keys the rank belongs to the substring whose space-stripped form matched.
+            rank = {}
+            id_rank = {}
+            for position, substring in enumerate(substrings):
+                rank.setdefault(substring, position)
+                id_rank.setdefault(substring.replace(' ', ''), position)
+
+        # Single pass over the candidates serves both search orders
+        ranked = []
+        for order, item in enumerate(iter_candidates()):
+            if substrings is None: # Return all filtered items (when substring not given)
+                matched_items.append(item)
+                continue
+            if order_search_by_substring:
+                best = min(
+                    ((id_rank if key in id_keys else rank)[needle] for key, needle in get_matches(item)),
+                    default=None
+                )
+                if best is None:
+                    continue
+                if best == 0 and return_first_only:
+                    return [item] # Nothing can rank ahead of the first item matching the first substring
+                ranked.append((best, order, item))
+            elif next(get_matches(item), None) is not None: # Check if any of the substring is present in any value
+                if return_first_only:
+                    return [item] # Return the first match if `return_first_only` is True
+                matched_items.append(item)
+
+        if ranked:
+            ranked.sort(key=lambda entry: entry[:2])
+            if return_first_only:
+                return [ranked[0][2]]
+            seen = set()
+            for _, _, item in ranked:
+                if id(item) not in seen: # Don't double-match the same item (O(1) instead of a dict-equality scan)
+                    seen.add(id(item))
+                    matched_items.append(item)
 
         return matched_items # Return matched items
 
@@ -2199,17 +2779,21 @@ class ParsedDataUtils:
 
         def normalize(text: str) -> str:
             if normalize_whitespace:
-                text = re.sub(r'\s+', '', text.strip())
+                text = text.translate(_WS_DEL)
             return text if case_sensitive else text.lower()
 
+        # Identifier lists are module constants/literals: their normalized form is cached across calls
+        norm_substrings = _normalize_needles(tuple(substrings), normalize_whitespace, case_sensitive)
+
         for key in keys:
             value = item.get(key)
             if value and isinstance(value, str):
                 norm_value = normalize(value)
-                for substring in substrings:
-                    norm_substring = normalize(substring)
-                    if (exact_match and norm_value == norm_substring) or (not exact_match and norm_substring in norm_value):
+                if exact_match:
+                    if norm_value in norm_substrings:
                         return True
+                elif any(map(norm_value.__contains__, norm_substrings)):
+                    return True
         return False
 
     def is_substrings_in_item_optimized(self, item: dict, keys: Union[List[str], str], substrings: Union[List[str], str], normalize_whitespace: bool = False, exact_match: bool = False, case_sensitive: bool = False, combine_fields: bool = False) -> bool:
@@ -2227,16 +2811,16 @@ class ParsedDataUtils:
         def normalize(text: str) -> str:
             if not case_sensitive:
                 text = text.lower()
-            return re.sub(r'\s+', '', text) if normalize_whitespace else text
+            return text.translate(_WS_DEL) if normalize_whitespace else text
 
-        normalized_substrings = set(normalize(s) for s in substrings)
+        normalized_substrings = _normalize_needles(tuple(substrings), normalize_whitespace, case_sensitive)
 
         if combine_fields:
             combined = " ".join(str(item.get(k, '') or '') for k in keys).strip()
             norm_combined = normalize(combined)
             if exact_match:
                 return norm_combined in normalized_substrings
-            return any(sub in norm_combined for sub in normalized_substrings)
+            return any(map(norm_combined.__contains__, normalized_substrings))
 
         else:
             for key in keys:
@@ -2246,26 +2830,37 @@ class ParsedDataUtils:
                     if exact_match:
                         if norm_val in normalized_substrings:
                             return True
-                    else:
-                        for sub in normalized_substrings:
-                            if sub in norm_val:
-                                return True
+                    elif any(map(norm_val.__contains__, normalized_substrings)):
+                        return True
 
         return False
 
-    def string_match_percentage(self, str1: str, str2: str) -> int:
+    def string_match_percentage(self, str1: str, str2: str, threshold: int = 0) -> int:
         """
         Returns a similarity percentage (0 to 100) between two strings.
 
         Args:
             str1 (str): First string.
             str2 (str): Second string.
+            threshold (int): Caller's acceptance threshold. When the lengths alone rule out reaching it,
+                0 is returned without running the matcher.
 
         Returns:
             int: Match percentage (0 = no match, 100 = exact match).
         """
-        ratio = SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
-        return int(round(ratio * 100))
+        str1, str2 = str1.lower(), str2.lower()
+
+        # Upper bound of SequenceMatcher.ratio() is 2*min(m, n)/(m + n): cheap reject on lengths alone
+        total_length = len(str1) + len(str2)
+        if threshold and total_length and int(round(200 * min(len(str1), len(str2)) / total_length)) < threshold:
+            return 0
+
+        # Without rapidfuzz, use difflib's character-multiset bound (linear time) before the full matcher
+        if fuzz is None and threshold and int(round(_quick_ratio(str1, str2) * 100)) < threshold:
+            return 0
+
+        # Raw scores below `threshold - 0.5` can never round up to `threshold`, so rapidfuzz may cut them off
+        return int(round(_match_ratio(str1, str2, max(threshold - 0.5, 0)) * 100))
 
     def is_item_similar(self, item1: Dict, item2: Dict, keys_to_compare: List[str], threshold: int, min_match_count: int = 1) -> bool:
         """
@@ -2286,8 +2881,13 @@ class ParsedDataUtils:
         """
 
         match_count = 0
+        total_keys = len(keys_to_compare)
+
+        for i, key in enumerate(keys_to_compare):
+            # Even if every remaining key matched, `min_match_count` would be out of reach
+            if match_count + (total_keys - i) < min_match_count:
+                return False
 
-        for key in keys_to_compare:
             val1 = item1.get(key)
             val2 = item2.get(key)
 
@@ -2297,7 +2897,7 @@ class ParsedDataUtils:
                     if val1 == val2:
                         match_count += 1
                 else:
-                    similarity = self.string_match_percentage(val1, val2)
+                    similarity = self.string_match_percentage(val1, val2, threshold)
                     if similarity >= threshold:
                         match_count += 1
 
@@ -2307,13 +2907,9 @@ class ParsedDataUtils:
         return False
 
     def clean_text(self, raw_text: str) -> str:
-        # Remove leading/trailing spaces, newline characters, or special symbols
-        cleaned_text = raw_text.strip()
-        # Remove any unwanted characters like newlines (\n), special characters (e.g., ), etc.
-        cleaned_text = re.sub(r'[^\w\s.,;:*()"\-]', '', cleaned_text)  # Keep only basic punctuation and word chars
-        # Replace multiple spaces or newlines with a single space
-        cleaned_text = re.sub(r'[\n\s]+', ' ', cleaned_text)
-        return cleaned_text.strip()
+        # Single pass: each run of whitespace and/or unwanted characters (special symbols, e.g., ) becomes one
+        # space if it contains whitespace, else nothing. Keeps only basic punctuation and word chars, collapsed spaces.
+        return _CLEAN_RUN_RE.sub(_clean_run, raw_text).strip()
 
     def get_item_text(self, item: dict, keys: List[str]):
         return " ".join(str(item.get(k, '') or '') for k in keys).strip()
@@ -2323,20 +2919,34 @@ class ParsedDataUtils:
         printer.pprint(data)
 
     def normalize_metadata(self, element_metadata: Dict[str, Any]) -> dict:
+        # Same raw fields -> same result; fields are re-normalized on every fill attempt
+        key = tuple(element_metadata.get(k) for k in ("label-srcTag", "label-srcText", "label-srcAttribute", "label-custom", "id", "id-custom", "name", "placeholder"))
+        try:
+            cached = self._norm_cache.get(key)
+        except TypeError: # Unhashable metadata value; compute without caching
+            return self._normalize_metadata(element_metadata)
+        if cached is None:
+            if len(self._norm_cache) >= 4096:
+                self._norm_cache.clear()
+            cached = self._norm_cache[key] = self._normalize_metadata(element_metadata)
+        return cached
+
+    def _normalize_metadata(self, element_metadata: Dict[str, Any]) -> dict:
         # Step 1: Normalize label-related fields
-        raw_labels = {
+        raw_labels = (
             element_metadata.get("label-srcTag"),
             element_metadata.get("label-srcText"),
             element_metadata.get("label-srcAttribute"),
             element_metadata.get("label-custom"),
-        }
-        labels = list(filter(None, {label.strip() for label in raw_labels if isinstance(label, str)}))
+        )
+        # dict.fromkeys de-duplicates while keeping source order (deterministic, unlike a set)
+        labels = list(dict.fromkeys(filter(None, (label.strip() for label in raw_labels if isinstance(label, str)))))
 
         # Step 2: Normalize id-related fields
-        ids = list(filter(None, {
+        ids = list(dict.fromkeys(filter(None, (
             element_metadata.get("id"),
             element_metadata.get("id-custom")
-        }))
+        ))))
 
         # Step 3: Keep name and placeholder as is
         name = element_metadata.get("name")
@@ -2360,9 +2970,11 @@ class ParsedDataUtils:
         Returns:
             List[dict]: List of matching dictionaries from the section.
         """
-        def match(item: Dict[str, Any], query: Dict[str, Any]) -> bool:
-            for key_path, expected_value in query.items():
-                keys = key_path.split(".")
+        # Split the dot paths once for all items
+        split_query = [(_split_path(key_path), expected_value) for key_path, expected_value in query.items()]
+
+        def match(item: Dict[str, Any]) -> bool:
+            for keys, expected_value in split_query:
                 current = item
                 for key in keys:
                     if isinstance(current, dict) and key in current:
@@ -2373,7 +2985,7 @@ class ParsedDataUtils:
                     return False
             return True
 
-        return [item for item in self.parsed_data.get(section_key, []) if match(item, query)]
+        return [item for item in self.parsed_data.get(section_key, []) if match(item)]
 
     def is_match(self, item: dict, query: dict) -> bool:
         """
@@ -2389,7 +3001,7 @@ class ParsedDataUtils:
             bool: True if all query conditions match in item, False otherwise.
         """
         def get_nested_value(d: dict, path: str):
-            keys = path.split(".")
+            keys = _split_path(path)
             current = d
             for key in keys:
                 if not isinstance(current, dict) or key not in current:
@@ -2416,7 +3028,7 @@ class ParsedDataUtils:
             The retrieved value, or `default` if the path doesn't exist.
         """
         current = item
-        for key in key_path.split('.'):
+        for key in _split_path(key_path):
             if isinstance(current, dict):
                 current = current.get(key, default)
             else:
@@ -2424,34 +3036,7 @@ class ParsedDataUtils:
         return current
 
     def clean_dynamic_attributes(self, xpath, aggressive:bool = False):
-
-        if not aggressive:
-            # Pattern to match any attribute that contains 'value' OR is 'tabindex'
-            pattern = r'\[@[^=]*value[^=]*=[^\]]*\]|\[@tabindex=[^\]]*\]'
-            # Remove the matched patterns
-            cleaned_xpath = re.sub(pattern, '', xpath)
-            # Optional: Remove redundant brackets from consecutive conditions
-            cleaned_xpath = re.sub(r'\]\[', '][', cleaned_xpath)
-            return cleaned_xpath.strip()
-        else:
-            # Define a list of dynamic attribute patterns to remove
-            dynamic_attrs = [
-                r'id',
-                r'class',
-                r'tabindex',
-                r'placeholder',
-                r'style',
-                r'autocomplete',
-                r'data-[^=]*',           # matches all data-* attributes
-                r'[^=]*value[^=]*'       # matches any attribute name containing "value"
-            ]     
-            # Combine into a regex to match any of the listed attributes with a value
-            pattern = r'\[@(?:' + '|'.join(dynamic_attrs) + r')=[^\]]*\]'
-            # Remove all matching attributes from XPath
-            cleaned_xpath = re.sub(pattern, '', xpath)
-            # Optionally clean up extra brackets between attributes
-            cleaned_xpath = re.sub(r'\]\[', '][', cleaned_xpath)
-            return cleaned_xpath.strip()
+        return _strip_dynamic_attributes(xpath, aggressive)
 
 class WebPageParser:
     """
@@ -2473,18 +3058,35 @@ class WebPageParser:
         self.WebParserUtils = WebParserUtils(driver)
         self.ParsedDataUtils = ParsedDataUtils()
         self.dom_contains_xml_namespaces = self.WebParserUtils.detect_xml_namespaces() # If namespace prefixes is detected in page source, then XPath queries may require namespace-aware evaluation
+        self._field_attrs: Dict[str, Dict[str, Any]] = {} # WebElement id -> `get_element_attributes` result, recorded by `_extract_field_info` for `_synchronize_fields`
+        self._merge_index: Optional[Dict[str, Dict[Any, List[int]]]] = None # Radio/checkbox merge index (see `_refresh_merge_index`)
+        self._merge_index_fields: Optional[List[Dict[str, Any]]] = None # `self.fields` list the merge index was built for
+        self._merge_index_count = 0 # Number of fields indexed so far
+        self._button_merge_index: Optional[Dict[str, Dict[Any, List[int]]]] = None # Button merge index (see `_refresh_button_merge_index`)
+        self._button_merge_index_fields: Optional[List[Dict[str, Any]]] = None # `self.fields` list the button merge index was built for
+        self._button_merge_index_count = 0 # Number of fields indexed so far
+        # Multi-pattern matchers over `field_identifiers` (categories suffixed '_case_sensitive' keep their case)
+        self._field_identifier_matcher = _build_category_matcher({k: v for k, v in field_identifiers.items() if not k.endswith('_case_sensitive')}, case_sensitive=False)
+        self._field_identifier_matcher_case_sensitive = _build_category_matcher({k: v for k, v in field_identifiers.items() if k.endswith('_case_sensitive')}, case_sensitive=True)
+        self._date_format_matcher = _build_category_matcher(dict(_DATE_FORMATS), case_sensitive=True) # Date format variants -> base format
 
     def set_default(self):
 
+        # Every parse starts from a (possibly) changed DOM: don't reuse XPaths cached by an earlier parse
+        self.WebParserUtils.bump_dom_revision()
+
         # If namespace prefixes is detected in page source, then XPath queries may require namespace-aware evaluation
         self.dom_contains_xml_namespaces = self.WebParserUtils.detect_xml_namespaces()
 
         # Initialize empty fields -> List[Dict] 
         self.fields = []
+        self._field_attrs = {}
+        self._merge_index = None
+        self._button_merge_index = None
 
         # Helps identify change in section
-        self.work_experience_initial_comparison_parameters = None # Comparison parameters (e.g. ['job title', 'job role'] if initial work fields relates job-title) of initial field which relates to work experience (Most likely: Job Title or Company)
-        self.education_initial_comparison_parameters = None # Comparison parameters (e.g. ['school', 'university'] if initial education fields relates university) of initial field which relates to education section (Most likely: University or Degree)
+        self.work_experience_initial_comparison_category = None # `field_identifiers` category (e.g. 'job_title' if initial work fields relates job-title) of initial field which relates to work experience (Most likely: Job Title or Company)
+        self.education_initial_comparison_category = None # `field_identifiers` category (e.g. 'school' if initial education fields relates university) of initial field which relates to education section (Most likely: University or Degree)
         self.work_experience_sectionID_primary = 0 # Group counter for work experience section (Example: For 1st work experience, it hold 1 as sectionId). Primarily used to detect new sections and handle date fields.
         self.education_sectionID_primary = 0 # Group counter for education section (Example: For 1st education section, it hold 1 as sectionId). Primarily used to detect new sections and handle date fields.
         self.work_experience_sectionID = { # Define the section ID for each field in work experience section
@@ -2581,22 +3183,150 @@ class WebPageParser:
                 (el.outerHTML && el.outerHTML.includes("listbox"))
             );
 
-            return (
+            const isCandidate = (
                 (tag === "input" && !["submit", "button", "reset"].includes(inputType)) ||
                 tag === "textarea" ||
                 tag === "select" ||
                 (tag === "button" && isListType)
             );
+            if (!isCandidate) return false;
+
+            // Skip hidden fields: any 'hidden', '*-hidden', '*_hidden' or 'aria-hidden*' attribute set to "true"
+            // (same rule as `search_attribute(['hidden'], element)`, evaluated here to avoid a round-trip per element)
+            for (const attr of el.attributes) {
+                const name = attr.name.toLowerCase();
+                if (
+                    (name === "hidden" || name.endsWith("-hidden") || name.endsWith("_hidden") || name.startsWith("aria-hidden")) &&
+                    attr.value.toLowerCase() === "true"
+                ) return false;
+            }
+            return true;
         """
 
         elements: List[WebElement] = self.WebParserUtils.query_all_elements(tag_names=['input', 'textarea', 'select', 'button'], predicate_js=predicate_js)
         # elements: List[WebElement] = self.driver.execute_script("return Array.from(document.querySelectorAll('input'));")
         for element in elements:
-            if not ((hidden_value := self.WebParserUtils.search_attribute(['hidden'], element)) and 'true' in map(str.lower, hidden_value.values())):
-                # Append to self.fields(type:list) if dictionary is returned
-                if (field_info := self._synchronize_fields(self._extract_field_info(element))): self.fields.append(field_info) 
+            # Append to self.fields(type:list) if dictionary is returned
+            if (field_info := self._synchronize_fields(self._extract_field_info(element))): self.fields.append(field_info) 
         return self.fields
 
+    def _flatten_search_text(self, field_info: dict, keys: Iterable[str] = stardard_field_search_keys) -> str:
+        """
+        Returns the field's standard search key values (or those of `keys`) with whitespace removed, joined by '\x00'
+        (so that no identifier can match across two keys). Case is preserved.
+        """
+        return '\x00'.join(v for k in keys if (v := field_info.get(k)) and isinstance(v, str)).translate(_WS_DEL)
+
+    def _match_field_identifiers(self, flat: str) -> set:
+        """
+        Returns the `field_identifiers` categories found in a `_flatten_search_text` string.
+
+        Equivalent to `ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get(category), normalize_whitespace=True)`
+        for every category at once (case-sensitive for '_case_sensitive' categories).
+        """
+        if not flat:
+            return set()
+        return self._field_identifier_matcher(flat.lower()) | self._field_identifier_matcher_case_sensitive(flat)
+
+    def _get_date_base_format(self, field_info: dict) -> Optional[str]:
+        """
+        Determines the base date format of a web form element based on common date format variants.
+
+        This function checks the metadata of a form element against predefined date format variants 
+        (e.g., "MM/DD/YYYY", "Month/Year", "Day", etc.) to identify the base format category 
+        (such as "MMDDYYYY", "MMYYYY", "DD", etc.).
+
+        A variant is found in the metadata if it equals the placeholder (case-insensitive), or occurs
+        (case-sensitive, whitespace removed) in any of `_DATE_FORMAT_SEARCH_KEYS`. All variants are
+        matched in a single pass; the first base format in `_DATE_FORMATS` order wins.
+
+        Returns:
+            str or None: The matching base date format key (e.g., "MMDDYYYY", "MMYYYY"), or 
+            None if no known format matches the element metadata.
+        """
+        flat = '\x00'.join(v for k in _DATE_FORMAT_SEARCH_KEYS if (v := field_info.get(k)) and isinstance(v, str)).translate(_WS_DEL)
+        matched = self._date_format_matcher(flat) if flat else set()
+        if (placeholder := field_info.get("placeholder")) and isinstance(placeholder, str):
+            matched |= _DATE_FORMAT_PLACEHOLDERS.get(placeholder.lower(), set())
+        return next((base_format for base_format, _ in _DATE_FORMATS if base_format in matched), None)
+
+    def _refresh_merge_index(self) -> Dict[str, Dict[Any, List[int]]]:
+        """
+        Returns the radio/checkbox merge index over `self.fields`, extending or rebuilding it as needed.
+
+        Maps field type ('radio'/'checkbox') -> {None: positions of fields of that type, (key, value): positions of those
+        fields having that exact `_MERGE_KEYS` value}, positions in ascending order. Fields appended in place are indexed
+        incrementally; a new `self.fields` list or a merge in `_synchronize_button` (which edits field values) forces a rebuild.
+        """
+        if self._merge_index is None or self._merge_index_fields is not self.fields or self._merge_index_count > len(self.fields):
+            self._merge_index = {'radio': {}, 'checkbox': {}}
+            self._merge_index_fields = self.fields
+            self._merge_index_count = 0
+        for position in range(self._merge_index_count, len(self.fields)):
+            field = self.fields[position]
+            if (type_index := self._merge_index.get(field["type"])) is None:
+                continue
+            type_index.setdefault(None, []).append(position)
+            for k in _MERGE_KEYS:
+                if (v := field.get(k)) and isinstance(v, str):
+                    type_index.setdefault((k, v), []).append(position)
+        self._merge_index_count = len(self.fields)
+        return self._merge_index
+
+    def _index_button_merge_field(self, position: int, remove: bool = False) -> None:
+        """
+        Adds (or removes) the field at `position` to the button merge index under each of its `_BUTTON_MERGE_KEYS` values.
+        """
+        field = self.fields[position]
+        for k in _BUTTON_MERGE_KEYS:
+            if (v := field.get(k)) in (None, ''):
+                continue
+            try:
+                positions = self._button_merge_index[k].setdefault(v, [])
+            except TypeError: # Unhashable value: can't equal a button's (string) value anyway
+                continue
+            if remove:
+                if position in positions: positions.remove(position)
+            else:
+                bisect.insort(positions, position)
+
+    def _refresh_button_merge_index(self) -> Dict[str, Dict[Any, List[int]]]:
+        """
+        Returns the button merge index over `self.fields`, extending or rebuilding it as needed.
+
+        Maps key (`_BUTTON_MERGE_KEYS`) -> {value: positions of fields having that exact value}, positions in ascending
+        order. Fields appended in place are indexed incrementally; a new `self.fields` list forces a rebuild.
+        """
+        if self._button_merge_index is None or self._button_merge_index_fields is not self.fields or self._button_merge_index_count > len(self.fields):
+            self._button_merge_index = {k: {} for k in _BUTTON_MERGE_KEYS}
+            self._button_merge_index_fields = self.fields
+            self._button_merge_index_count = 0
+        for position in range(self._button_merge_index_count, len(self.fields)):
+            self._index_button_merge_field(position)
+        self._button_merge_index_count = len(self.fields)
+        return self._button_merge_index
+
+    def _search_field_attribute_value(self, substrings: List[str], field_info: dict, field_attrs: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        `WebParserUtils.search_attribute_value` over the attributes already fetched for the field's element,
+        falling back to querying the element when none were recorded.
+        """
+        if 'attributes' not in field_attrs:
+            return self.WebParserUtils.search_attribute_value(substrings, field_info['webElement'])
+        if isinstance(substrings, str):
+            substrings = [substrings]
+        for attr in field_attrs['attributes']:
+            attr_value = attr['value']
+            if any(substring.lower() in attr_value.lower() for substring in substrings):
+                return {attr['name']: attr_value}
+        return None
+
+    def _search_element_attribute(self, substrings: List[str], element_attrs: Dict[str, Any]) -> Optional[dict]:
+        """
+        `WebParserUtils.search_attribute` over the attributes already fetched by `WebParserUtils.get_element_attributes`.
+        """
+        return self.WebParserUtils._match_attribute_names(substrings, ((attr['name'], attr['value']) for attr in element_attrs['attributes'])) or None
+
     def _synchronize_fields(self, field_info: dict) -> Dict[str, Any] | None:
         """
         Synchronizes [currently fetched element -> field_info] with [existing elements -> self.fields] or itself.
@@ -2608,12 +3338,19 @@ class WebPageParser:
         
         return_field_info = True # Flag to indicate if field_info should be returned or not
 
+        # Flatten the field metadata once (search keys are not modified below) and match every identifier category against it
+        flat_search_text = self._flatten_search_text(field_info)
+        flat_search_text_lower = flat_search_text.lower()
+        matched_identifiers = self._match_field_identifiers(flat_search_text)
+        field_attrs = self._field_attrs.get(field_info['webElement'].id, {}) # Attributes fetched by `_extract_field_info` (empty if unavailable)
+        max_label_words = _max_label_word_count(field_info) # Word count of the longest label (shared by the label-length guards below)
+
         '''
         Verification Button
         '''
-        if field_info['type'] in {'number', 'text'}:
+        if field_info['type'] in _NUMBER_TEXT:
             if (
-                self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, substrings=field_identifiers.get('verification'), normalize_whitespace=True)
+                'verification' in matched_identifiers
                 or self.ParsedDataUtils.is_substrings_in_item(field_info, ['placeholder'], ['###'])
             ):
                 field_info['options'] = {
@@ -2626,16 +3363,16 @@ class WebPageParser:
         Identify date field
         '''
         # Check if the field is a date field
-        if self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('date'), normalize_whitespace=True):
+        if 'date' in matched_identifiers:
             is_date_type = True
             # Exclude based on label length (word count) assumption
+            date_matcher = self.ParsedDataUtils._needle_matcher(field_identifiers.get('date')) # Single multi-pattern scan per label
             for label_src in standard_label_keys:
-                if field_info.get(label_src) and any(date_identifier in field_info.get(label_src) for date_identifier in field_identifiers.get('date')):
-                    if len(field_info.get(label_src).split(' ')) > 3 :
+                if (label := field_info.get(label_src)) and next(date_matcher(label), None) is not None:
+                    if label.count(' ') >= 3 : # More than 3 space-separated parts
                         is_date_type = False
             # Exclude misinterpreted fields (e.g., candidate, update, validate, etc. which has 'date' in their name)
-            misidentifiers = ['candidate', 'validate', 'update']
-            if self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, misidentifiers, normalize_whitespace=True):
+            if _contains_any(flat_search_text_lower, _DATE_MISIDENTIFIERS):
                 is_date_type = False
             if is_date_type and field_info['type'] != 'hidden':
                 field_info['type'] = 'datelist' if field_info['type'] == 'list' else 'date'
@@ -2643,32 +3380,34 @@ class WebPageParser:
         '''
         Group related radio/checkbox fields -> merging options into existing field_info
         '''
-        if field_info["type"] in {"radio", "checkbox"}: # Only process if it's 'radio' or 'checkbox' type
+        if field_info["type"] in _RADIO_CHECKBOX: # Only process if it's 'radio' or 'checkbox' type
 
             # Avoid merging independent checkbox that shares similar metadata
             if (
                 not (
                         (
-                            self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('currently_working'), normalize_whitespace=True)
-                            or self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('currently_enrolled'), normalize_whitespace=True)
-                    ) and all(v is None or (isinstance(v, str) and len(v.split()) < 5) for k in standard_label_keys if (v := field_info.get(k)) is not None or k in field_info) # ∀(label), length should be less than 5 words
+                            'currently_working' in matched_identifiers
+                            or 'currently_enrolled' in matched_identifiers
+                    ) and max_label_words < 5 # ∀(label), length should be less than 5 words
                 )
             ):
                 
-                for existing_field in self.fields:
-                    if ((field_info["type"] == "radio" and existing_field["type"] != "radio")
-                        or (field_info["type"] == "checkbox" and existing_field["type"] != "checkbox")
-                    ):
-                        continue
+                # Fields of the same type, in `self.fields` order, and the first one sharing an exact key value (Condition 1)
+                type_index = self._refresh_merge_index()[field_info["type"]]
+                exact_position = min((positions[0] for k in _MERGE_KEYS if (v := field_info[k]) and isinstance(v, str) and (positions := type_index.get((k, v)))), default=len(self.fields))
+                for position in type_index.get(None, ()):
+                    existing_field = self.fields[position]
             
                     field_options = field_info["options"]
                     # Condition 1: Check if any of the keys match and are not None (Exact match)
-                    # Condition 2 (OR): Check by keys similarity score (Partial match)
-                    if (any(field_info[k] and field_info[k] == existing_field[k] for k in ("label-srcText", "label-srcAttribute", "label-custom", "name", "id", "id-custom"))
+                    # Condition 2 (OR): Check by keys similarity score (Partial match), only needed before the first exact match
+                    if (position >= exact_position
                         or self.ParsedDataUtils.is_item_similar(field_info, existing_field, ['id', 'id-custom'], threshold=50)
                     ):
                         # Merge options without overwriting existing ones
-                        existing_field["options"].update({k: v for k, v in field_options.items() if k not in existing_field["options"]})
+                        existing_options = existing_field["options"]
+                        for k, v in field_options.items():
+                            existing_options.setdefault(k, v)
                         existing_field["label-srcTag"] = None # Since we are merging, context is lost. Therefore, set to None.
                         return_field_info = False  # Merged successfully. No need to add a new entry.
                         break
@@ -2677,33 +3416,32 @@ class WebPageParser:
         Work Experience and Education field handling
         '''
         # Helper in segragating fields during search
-        is_type_radio_checkbox_textarea_date_datelist = field_info['type'] in {'radio', 'checkbox', 'textarea', 'date', 'datelist'}
+        is_type_radio_checkbox_textarea_date_datelist = field_info['type'] in _GROUPED_FIELD_TYPES
 
-        label_length: int = len((field_info.get('label-srcTag') or field_info.get('label-srcText') or '').split())
         max_label_words_work_or_edu: int = 7
-        workedu_label_within_limit: bool = (label_length <= max_label_words_work_or_edu)
+        workedu_label_within_limit: bool = not _has_more_words_than(field_info.get('label-srcTag') or field_info.get('label-srcText') or '', max_label_words_work_or_edu)
         if workedu_label_within_limit:
-            if self.work_experience_initial_comparison_parameters is None:
+            if self.work_experience_initial_comparison_category is None:
                 # Check if the field relates job-title
-                if self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('job_title'), normalize_whitespace=True):
-                    self.work_experience_initial_comparison_parameters = field_identifiers.get('job_title') # Set the initial field parameters of the work experience section.
+                if 'job_title' in matched_identifiers:
+                    self.work_experience_initial_comparison_category = 'job_title' # Set the initial field category of the work experience section.
                 # Check if the field relates to company
-                elif self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('company'), normalize_whitespace=True):
-                    self.work_experience_initial_comparison_parameters = field_identifiers.get('company') # Set the initial field parameters of the work experience section.
-            if self.education_initial_comparison_parameters is None:
+                elif 'company' in matched_identifiers:
+                    self.work_experience_initial_comparison_category = 'company' # Set the initial field category of the work experience section.
+            if self.education_initial_comparison_category is None:
                 # Check if the field relates to university or college
-                if self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('school'), normalize_whitespace=True):
-                    self.education_initial_comparison_parameters = field_identifiers.get('school') # Set the initial field parameters of the education section.
+                if 'school' in matched_identifiers:
+                    self.education_initial_comparison_category = 'school' # Set the initial field category of the education section.
                 # Check if the field relates to degree
-                elif self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('degree'), normalize_whitespace=True):
-                    self.education_initial_comparison_parameters = field_identifiers.get('degree') # Set the initial field parameters of the education section.
+                elif 'degree' in matched_identifiers:
+                    self.education_initial_comparison_category = 'degree' # Set the initial field category of the education section.
             
             # Check any of the field categories and update field_info['options']:"Job Title","Company","Location","I currently work here","From Start Date","To End Date","Role Description"
-            if self.work_experience_initial_comparison_parameters:
+            if self.work_experience_initial_comparison_category:
 
                 # Check if the field is work experience related and update section IDs accordingly
                 if (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, self.work_experience_initial_comparison_parameters, normalize_whitespace=True)
+                    self.work_experience_initial_comparison_category in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     self.last_edu_or_work_section = 'work-exp' # Set the latest work/edu section type to work experience
@@ -2711,7 +3449,7 @@ class WebPageParser:
 
                 # Check if the field relates to job-title
                 if (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('job_title'), normalize_whitespace=True)
+                    'job_title' in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     if (not self.work_experience_sectionID['Job Title'] < TOTAL_JOBS_ENTRY) or (field_info['type'] == 'hidden'):
@@ -2724,7 +3462,7 @@ class WebPageParser:
                     }
                 # Check if the field relates to company
                 elif (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('company'), normalize_whitespace=True)
+                    'company' in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     if (not self.work_experience_sectionID['Company'] < TOTAL_JOBS_ENTRY) or (field_info['type'] == 'hidden'):
@@ -2737,11 +3475,11 @@ class WebPageParser:
                     }
                 # Check if the field relates to location
                 elif (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('location'), normalize_whitespace=True)
+                    'location' in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     if (self.ParsedDataUtils.is_substrings_in_item(field_info, ["id", "id-custom"], ['work'], normalize_whitespace=True)
-                        or self.WebParserUtils.search_attribute_value(['work','experience'], field_info['webElement'])
+                        or self._search_field_attribute_value(['work','experience'], field_info, field_attrs)
                     ):
                         # Exclude if entry not coming from field and at the same time entry limit has reached, to avoid overlap or mis-interpretation through extra fields.
                         if (not self.work_experience_sectionID['Location'] < TOTAL_JOBS_ENTRY) or (field_info['type'] == 'hidden'):
@@ -2754,10 +3492,10 @@ class WebPageParser:
                         }
                 # Check if the field relates to current work status
                 elif (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('currently_working'), normalize_whitespace=True)
+                    'currently_working' in matched_identifiers
                     and field_info['type'] == 'checkbox'
                     and self.last_edu_or_work_section == 'work-exp'
-                    and all(v is None or (isinstance(v, str) and len(v.split()) < 8) for k in standard_label_keys if (v := field_info.get(k)) is not None or k in field_info) # ∀(label), length should be less than 8 words
+                    and max_label_words < 8 # ∀(label), length should be less than 8 words
                 ):
                     # Exclude if entry not coming from field and at the same time entry limit has reached, to avoid overlap or mis-interpretation through extra fields.
                     if (not self.work_experience_sectionID['I currently work here'] < TOTAL_JOBS_ENTRY) or (field_info['type'] == 'hidden'):
@@ -2770,8 +3508,8 @@ class WebPageParser:
                     }
                 # Check if the field relates to role description
                 elif (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('role_description'), normalize_whitespace=True)
-                    and (field_info['webElement'].tag_name == "textarea") or (field_info['type'] == 'text' and field_info['required'] == 'false') 
+                    'role_description' in matched_identifiers
+                    and ((field_attrs.get('tag') or field_info['webElement'].tag_name) == "textarea") or (field_info['type'] == 'text' and field_info['required'] == 'false') 
                 ):
                     # Exclude if entry not coming from field and at the same time entry limit has reached, to avoid overlap or mis-interpretation through extra fields.
                     if (not self.work_experience_sectionID['Role Description'] < TOTAL_JOBS_ENTRY) or (field_info['type'] == 'hidden'):
@@ -2784,11 +3522,12 @@ class WebPageParser:
                     }
 
             # Check any of the field categories and update field_info['options']:"School or University","Degree","Field of Study or Major","Overall Result (GPA) or Grade","Graduated","From Start Date","To End Date (Actual or Expected)"
-            if self.education_initial_comparison_parameters:
+            # Every education branch below requires one of its identifier categories; skip the ladder otherwise
+            if self.education_initial_comparison_category and not matched_identifiers.isdisjoint(_EDUCATION_CATEGORIES):
 
                 # Check if the field is education related and update section IDs accordingly
                 if (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, self.education_initial_comparison_parameters, normalize_whitespace=True)
+                    self.education_initial_comparison_category in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     self.last_edu_or_work_section = 'edu' # Set the latest work/edu section type to education
@@ -2796,7 +3535,7 @@ class WebPageParser:
 
                 # Check if the field relates to school or university
                 if (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('school'), normalize_whitespace=True)
+                    'school' in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     # Exclude if entry not coming from field and at the same time entry limit has reached, to avoid overlap or mis-interpretation through extra fields.
@@ -2810,7 +3549,7 @@ class WebPageParser:
                     }
                 # Check if the field relates to degree
                 elif (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('degree'), normalize_whitespace=True)
+                    'degree' in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     # Exclude if entry not coming from field and at the same time entry limit has reached, to avoid overlap or mis-interpretation through extra fields.
@@ -2824,7 +3563,7 @@ class WebPageParser:
                     }
                 # Check if the field relates to field of study or major
                 elif (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('field_of_study'), normalize_whitespace=True)
+                    'field_of_study' in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     # Exclude if entry not coming from field and at the same time entry limit has reached, to avoid overlap or mis-interpretation through extra fields.
@@ -2838,7 +3577,7 @@ class WebPageParser:
                     }
                 # Check if the field relates to overall result (GPA) or grade
                 elif (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('gpa_or_grade'), normalize_whitespace=True)
+                    'gpa_or_grade' in matched_identifiers
                     and not is_type_radio_checkbox_textarea_date_datelist
                 ):
                     # Exclude if entry not coming from field and at the same time entry limit has reached, to avoid overlap or mis-interpretation through extra fields.
@@ -2852,10 +3591,10 @@ class WebPageParser:
                     }
                 # Check if the field relates to current enrollment status
                 elif (
-                    self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('currently_enrolled'), normalize_whitespace=True)
+                    'currently_enrolled' in matched_identifiers
                     and field_info['type'] == 'checkbox'
                     and self.last_edu_or_work_section == 'edu'
-                    and all(v is None or (isinstance(v, str) and len(v.split()) < 8) for k in standard_label_keys if (v := field_info.get(k)) is not None or k in field_info) # ∀(label), length should be less than 8 words
+                    and max_label_words < 8 # ∀(label), length should be less than 8 words
                 ):
                     # Exclude if entry not coming from field and at the same time entry limit has reached, to avoid overlap or mis-interpretation through extra fields.
                     if (not self.fields_parse_ongoing or self.education_sectionID['Graduated'] < TOTAL_EDUCATION_ENTRY) or (field_info['type'] == 'hidden'):
@@ -2870,69 +3609,24 @@ class WebPageParser:
         '''
         Date field handling
         '''
-        def is_date_variant_in_metadata(date_format_variants):
-            """
-            This function checks if any of the given date_format_variants is found in the element metadata.
-            """
-            # Check if any of the substrings (e.g., "DD/MM/YYYY", "Day", "YYYY", etc.) is found in the element's metadata keys
-            for date_format in date_format_variants:
-                if self.ParsedDataUtils.is_substrings_in_item(field_info, ["placeholder"], [date_format], exact_match=True, case_sensitive=False):
-                    return True
-                elif self.ParsedDataUtils.is_substrings_in_item(field_info, ["placeholder", "label-srcAttribute", "label-custom", "id", "id-custom", "label-srcTag", "label-srcText", "name"], [date_format], normalize_whitespace=True, case_sensitive=True):
-                    return True
-            return False
-
-        def get_date_base_format():
-            """
-            Determines the base date format of a web form element based on common date format variants.
-
-            This function checks the metadata of a form element against predefined date format variants 
-            (e.g., "MM/DD/YYYY", "Month/Year", "Day", etc.) to identify the base format category 
-            (such as "MMDDYYYY", "MMYYYY", "DD", etc.).
-
-            Returns:
-                str or None: The matching base date format key (e.g., "MMDDYYYY", "MMYYYY"), or 
-                None if no known format matches the element metadata.
-
-            Dependencies:
-                `self.is_date_variant_in_metadata(variants)` 
-                is a helper function that checks whether any variant in the list is present 
-                in the given metadata.
-            """
-
-            # Define a mapping of date formats and corresponding format types with possible variants
-            date_formats = {
-                "MMDDYYYY": ["MM/DD/YYYY", "MM-DD-YYYY", "month.day.year", "month-day-year"],
-                "DDMMYYYY": ["DD/MM/YYYY", "DD-MM-YYYY", "day.month.year", "day-month-year"],
-                "MMYYYY": ["MM/YYYY", "Month/Year", "Month Year", "month-year"],
-                "DD": ["DD", "Day", ".day", "-day"],
-                "MM": ["MM", "Month", ".month", "-month"],
-                "YYYY": ["YYYY", "Year", ".year", ]
-            }
-
-            # Iterate over the date_formats mapping to check each date type in the element_metadata
-            for base_format, date_format_variants in date_formats.items():
-                if is_date_variant_in_metadata(date_format_variants):
-                    return base_format
-            return None
-        
         # Check if the field is a date field
-        if field_info['type'] in {'date', 'datelist'}:
+        if field_info['type'] in _DATE_TYPES:
 
             ''' Get the base format'''
             # Get the base_format of date (e.g., 'MMDDYYY', 'YYYY', 'DD', 'MMYYYY', etc.)
-            base_format = get_date_base_format()
+            base_format = self._get_date_base_format(field_info)
             if not base_format:
                 # Flatten and normalize all relevant metadata fields into a single lowercase string
-                flatten_field_data = self.ParsedDataUtils.get_item_text(field_info, ["placeholder", "label-srcAttribute", "label-custom", "id", "id-custom", "label-srcTag", "label-srcText", "name"])
-                # Check presence of date components
-                has_day = 'DD' in flatten_field_data
-                has_month = 'MM' in flatten_field_data
-                has_year = 'YYYY' in flatten_field_data
+                flatten_field_data = self.ParsedDataUtils.get_item_text(field_info, _DATE_FORMAT_SEARCH_KEYS)
+                # Check presence of date components (one scan collects every component token, overlapping ones included)
+                date_components = set(_DATE_COMPONENT_RE.findall(flatten_field_data))
+                has_day = 'DD' in date_components
+                has_month = 'MM' in date_components
+                has_year = 'YYYY' in date_components
                 if not (has_day or has_month or has_year):
-                    has_day = 'day' in flatten_field_data
-                    has_month = 'month' in flatten_field_data
-                    has_year = 'year' in flatten_field_data
+                    has_day = 'day' in date_components
+                    has_month = 'month' in date_components
+                    has_year = 'year' in date_components
                 
                 if not (has_day or has_month or has_year):
 
@@ -2958,8 +3652,8 @@ class WebPageParser:
                 
 
             # Check if the field is a start date field
-            if (self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('start_date'), normalize_whitespace=True)
-                or self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('start_date_case_sensitive'), normalize_whitespace=True, case_sensitive=True)
+            if ('start_date' in matched_identifiers
+                or 'start_date_case_sensitive' in matched_identifiers
             ): 
                 if self.last_edu_or_work_section == 'work-exp' and workedu_label_within_limit:
                     field_info['options'] = {
@@ -2983,8 +3677,8 @@ class WebPageParser:
                         'format': base_format
                     }
             # Check if the field is an end date field
-            elif (self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('end_date'), normalize_whitespace=True)
-                or self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('end_date_case_sensitive'), normalize_whitespace=True, case_sensitive=True)
+            elif ('end_date' in matched_identifiers
+                or 'end_date_case_sensitive' in matched_identifiers
             ):    
                 if self.last_edu_or_work_section == 'work-exp' and workedu_label_within_limit:
                     field_info['options'] = {
@@ -3020,22 +3714,22 @@ class WebPageParser:
         File upload field handling
         '''
         if (
-            self.WebParserUtils.get_tag_name(field_info['xPath']) in {'input', 'button'}
+            (field_attrs.get('tag') or self.WebParserUtils.get_tag_name(field_info['xPath'])) in _FILE_TAGS
             and (
                 field_info['type'] == 'file' 
-                or self.WebParserUtils.search_attribute_value(field_identifiers.get('resume'), field_info['webElement'])
-                or self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('upload_file'), normalize_whitespace=True)
+                or self._search_field_attribute_value(field_identifiers.get('resume'), field_info, field_attrs)
+                or 'upload_file' in matched_identifiers
             ) 
         ):
 
             field_info['type'] = 'file'
             # Exclude Dropbox, Google Drive, etc. file upload fields
-            if self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('cloud_or_mannual_upload'), normalize_whitespace=True):
+            if 'cloud_or_mannual_upload' in matched_identifiers:
                 return_field_info = False # Exclude this field from being added to the list
             else:
                 # Check if the field is a resume upload field
-                if (self.ParsedDataUtils.is_substrings_in_item(field_info, stardard_field_search_keys, field_identifiers.get('resume'), normalize_whitespace=True)
-                    or self.WebParserUtils.search_attribute_value(field_identifiers.get('resume'), field_info['webElement'])
+                if ('resume' in matched_identifiers
+                    or self._search_field_attribute_value(field_identifiers.get('resume'), field_info, field_attrs)
                 ):
                     field_info['options'] = {
                         'category': 'file-upload',
@@ -3065,18 +3759,24 @@ class WebPageParser:
                              the input field element, including its type, name,
                              label, placeholder, required status, and more.
         """
+        # Fetch the attributes read below in a single round-trip
+        element_attrs = self.WebParserUtils.get_element_attributes(element)
+        element_tag = element_attrs['tag']
+        self._field_attrs[element.id] = element_attrs
+
         # Check if field is hidden or non-interactable for users.
-        if element.get_attribute("type") == 'hidden' and not element.is_enabled(): 
+        if element_attrs['type'] == 'hidden' and not element_attrs['enabled']: 
             return None
 
         ''' Initialize xPath '''
         field_xPath = self.WebParserUtils.get_xpath(element, verify_xpath=True) or None    # Could be absolute or relative (1st try for absolute)
         if not field_xPath: return None # Exclude field element if xPath doesn't exists
-        field_relative_xPath = field_xPath if not self.WebParserUtils.is_absolute_xpath(field_xPath) else self.WebParserUtils.compute_relative_xpath_selenium(element, optimized=False)
+        field_xPath_is_absolute = self.WebParserUtils.is_absolute_xpath(field_xPath)
+        field_relative_xPath = field_xPath if not field_xPath_is_absolute else self.WebParserUtils.compute_relative_xpath_selenium(element, optimized=False)
         
         # Exclude headder/footer fields
-        if self.WebParserUtils.is_absolute_xpath(field_xPath):
-            if 'header' in field_xPath or 'footer' in field_xPath: # Return fields if they are contained in header or footer
+        if field_xPath_is_absolute:
+            if _HEADER_FOOTER_XPATH_RE.search(field_xPath): # Return fields if they are contained in header or footer
                 return None
         else:
             # For relative xPath, we use element-traceback approach to identify if it's contained within header or footer. 
@@ -3084,30 +3784,30 @@ class WebPageParser:
                 return None
             
         ''' Initialize Field Type '''
-        field_type = element.get_attribute("type") or element.tag_name
-        if element.tag_name == 'select': field_type = 'select'
-        if element.tag_name == 'textarea': field_type = 'textarea'
+        field_type = element_attrs['type'] or element_tag
+        if element_tag == 'select': field_type = 'select'
+        if element_tag == 'textarea': field_type = 'textarea'
         # Check for 'combobox' role, ARIA autocomplete, or 'list' attribute for <datalist>, or 'listbox' as attribute's value.
         if self.WebParserUtils.is_list_type(element): field_type = 'list' # For dynamic dropdown field.
 
         # Initialize Labels 
-        field_labelSrcTag = self._get_field_label(element)
-        field_label_attributes : dict = self.WebParserUtils.search_attribute(["label"], element)
+        field_labelSrcTag = self._get_field_label(element, element_attrs)
+        field_label_attributes : dict = self._search_element_attribute(["label"], element_attrs)
         field_labelSrcAttribute = next(iter(field_label_attributes.values()), None) if field_label_attributes else None
-        field_labelSrcAttribute = val if field_labelSrcAttribute is None and (val := element.get_attribute("aria-label")) not in ["", None] else field_labelSrcAttribute
-        field_labelCustom = (diff_set := set((field_label_attributes or {}).values()).difference({element.get_attribute("label")})) and diff_set.pop() or None
+        field_labelSrcAttribute = val if field_labelSrcAttribute is None and (val := element_attrs['aria-label']) not in ["", None] else field_labelSrcAttribute
+        field_labelCustom = _first_other_value(field_label_attributes, element_attrs['label'])
         field_labelSrcText = self.WebParserUtils.find_associated_text(field_xPath)
         # Initialize IDs
-        field_id = val if (val := element.get_attribute("id")) not in [""] else None
-        field_customId = (diff_set := set((self.WebParserUtils.search_attribute(["id"], element) or {}).values()).difference({element.get_attribute("id")})) and diff_set.pop() or None
+        field_id = val if (val := element_attrs['id']) not in [""] else None
+        field_customId = _first_other_value(self._search_element_attribute(["id"], element_attrs), element_attrs['id'])
         # Required
         field_required = self.WebParserUtils.is_field_required(element)
         field_required = True if field_required or ((field_labelSrcTag and (field_labelSrcTag[0] == '*' or field_labelSrcTag[-1] == '*')) or (field_labelSrcText and field_labelSrcText[-1] == '*')) else False
         # Placeholder
-        if element.tag_name.lower() == 'button':    # Treat 'inner text' as placeholder  
+        if element_tag == 'button':    # Treat 'inner text' as placeholder  
             field_placeholder = self.ParsedDataUtils.clean_text(element.text.strip())
         else:
-            field_placeholder = val if (val := element.get_attribute("placeholder")) not in [""] else None
+            field_placeholder = val if (val := element_attrs['placeholder']) not in [""] else None
 
         ''' Execute BLACKLISTED '''
         if not force_insert:
@@ -3126,28 +3826,24 @@ class WebPageParser:
                 ):
                     return None
 
-                # Exclude BLACKLISTED field attribute values
-                for full in config.blacklist.field_blacklist_attribute_value_full: # Check for full blacklist matches first
-                    if any((attr['value'] or '').lower() == full.lower() for attr in element.get_property('attributes')):
-                        return None  # Return None if there's a full match
-                for partial in config.blacklist.field_blacklist_attribute_value_partial: # Check for partial blacklist matches if no full match was found
-                    if any(partial.lower() in (attr['value'] or '').lower() for attr in element.get_property('attributes')):
-                        return None  # Return None if there's a partial match
+                # Exclude BLACKLISTED field attribute values (full or partial match)
+                if self.ParsedDataUtils.match_attribute_value_blacklist(config.blacklist.field_blacklist_attribute_value_full, config.blacklist.field_blacklist_attribute_value_partial, element_attrs['attributes']):
+                    return None
                 
         ''' Initialize Name '''
-        field_name = val if (val := element.get_attribute("name")) else None
+        field_name = val if (val := element_attrs['name']) else None
                 
         ''' Initialize Value '''
-        field_value = val if (val := element.get_attribute("value")) not in [""] else None
+        field_value = val if (val := element_attrs['value']) not in [""] else None
 
         field_options = None
         # Find the first attribute whose name contains 'multiselect' and ends with '-id' or '_id' (case-insensitive),
         # and assign it to multiselectId_attr; return None if no such attribute is found.
-        multiselectId_attr = next((attr for attr in element.get_property('attributes') if 'multiselect' in attr['name'].lower() and re.search(r'[-_]id$', attr['name'].lower())), None)
+        multiselectId_attr = next((attr for attr in element_attrs['attributes'] if 'multiselect' in (attr_name := attr['name'].lower()) and attr_name.endswith(('-id', '_id'))), None)
         if multiselectId_attr:
             field_type = 'multiselect'
             field_options = multiselectId_attr['value']
-        elif field_type == 'select' or element.tag_name == 'select':
+        elif field_type == 'select' or element_tag == 'select':
             field_options = self._extract_select_options(element)
         elif field_type == 'radio' or field_type == 'checkbox':
             if field_labelSrcTag:
@@ -3194,7 +3890,7 @@ class WebPageParser:
                 > If the field relates to button, update `field_type -> button` and `field's xPath -> button's xPath`.
                 > Delete leftover `field_type -> hidden` in post-cleaning process.
         '''
-        if not self.WebParserUtils.is_xpath_visible(field_xPath):
+        if not element_attrs['visible']: # Fetched with the element's attributes (saves a round-trip per field)
             field_type = 'hidden'
         
         field_info = {
@@ -3243,12 +3939,26 @@ class WebPageParser:
                 (el.outerHTML && el.outerHTML.includes("listbox"))
             );
 
-            return !isListType && (
+            const isCandidate = !isListType && (
                 tag === "button" ||
                 (tag === "input" && ["submit", "button", "reset"].includes(type)) ||
                 el.getAttribute("role") === "button"
             );
-        """
+            if (!isCandidate) return false;
+
+            // Skip buttons whose attribute values hit the attribute-value blacklists (same rule as
+            // `match_attribute_value_blacklist` in `_extract_button_info`, evaluated here so they never cross the wire)
+            const fullBlacklist = new Set(%s);
+            const partialBlacklist = %s;
+            for (const attr of el.attributes) {
+                const value = (attr.value || "").toLowerCase();
+                if (fullBlacklist.has(value) || partialBlacklist.some(partial => value.includes(partial))) return false;
+            }
+            return true;
+        """ % (
+            json.dumps(sorted(full.lower() for full in config.blacklist.button_blacklist_attribute_value_full)),
+            json.dumps(sorted(partial.lower() for partial in config.blacklist.button_blacklist_attribute_value_partial))
+        )
         elements: List[WebElement] = self.WebParserUtils.query_all_elements(tag_names = ["button", "input"], predicate_js = predicate_js)
         for btn in elements:
             if (button_info := self._synchronize_button(self._extract_button_info(btn))): buttons.append(button_info)
@@ -3279,23 +3989,26 @@ class WebPageParser:
         '''
         File upload field handling
         '''
+        # `field_identifiers` categories found in the button's search keys (one multi-pattern scan serves all checks below)
+        button_identifiers = self._match_field_identifiers(self._flatten_search_text(button_info, stardard_button_search_keys))
+        has_resume_attribute = None # Resume identifier in an attribute value (queried at most once)
         if (
             self.WebParserUtils.get_tag_name(button_info['xPath']) in {'input', 'button'}
             and (
                 button_info['type'] == 'file' 
-                or self.WebParserUtils.search_attribute_value(field_identifiers.get('resume'), button_info['webElement'])
-                or self.ParsedDataUtils.is_substrings_in_item(button_info, stardard_button_search_keys, field_identifiers.get('upload_file'), normalize_whitespace=True)
+                or (has_resume_attribute := bool(self.WebParserUtils.search_attribute_value(field_identifiers.get('resume'), button_info['webElement'])))
+                or 'upload_file' in button_identifiers
             ) 
         ):
 
             button_info['type'] = 'file'
             # Exclude Dropbox, Google Drive, etc. file upload fields
-            if self.ParsedDataUtils.is_substrings_in_item(button_info, stardard_button_search_keys, field_identifiers.get('cloud_or_mannual_upload'), normalize_whitespace=True):
+            if 'cloud_or_mannual_upload' in button_identifiers:
                 return None # Exclude this button from being added to the list
             else:
                 # Check if the field is a resume upload field
-                if (self.ParsedDataUtils.is_substrings_in_item(button_info, stardard_button_search_keys, field_identifiers.get('resume'), normalize_whitespace=True)
-                    or self.WebParserUtils.search_attribute_value(field_identifiers.get('resume'), button_info['webElement'])
+                if ('resume' in button_identifiers
+                    or (has_resume_attribute if has_resume_attribute is not None else self.WebParserUtils.search_attribute_value(field_identifiers.get('resume'), button_info['webElement']))
                 ):
                     button_info['name'] = 'Resume'
                 else:
@@ -3306,30 +4019,36 @@ class WebPageParser:
         Merges button element into a matching input entry (within self.fields) if they both are associated with same field.
         '''
         if button_info.get('type') != 'submit':
-            for field in self.fields:
-                if any(button_info[k] not in {None, ''} and button_info[k] == field.get(k) for k in ("label-srcTag", "label-srcText", "label-custom", "name", "id", "id-custom", "value")): # MATCH FOUND
-                    # Match Found
-
-                    # Mapping of dynamic list with optional xPath of button.
-                    if field['type'] == 'list':
-                        field['xPath'] = button_info['xPath-relative']
-
-                    # Selectively update values
-                    for k, v in button_info.items():
-                        if v is not None:
-                            if k in field:
-                                if (field[k] is None): # Only update if the field value is None
-                                    field[k] = v
-                                if (v) and (k in ('id', 'id-custom')) and (field['type'] == 'file'): # Force edit for 'id' if file type
-                                    field[k] = v
-                    
-                    # Ensure 'hidden' fiels are mapped with buttons
-                    #  Note: All left-over hidden fields are later removed in post-cleaning process.
-                    if field['type'] == 'hidden' and button_info['type'] != 'file':
-                        field['type'] = 'button'
-                        field['xPath'] = button_info['xPath-relative']
+            merge_index = self._refresh_button_merge_index()
+            candidates = [positions[0] for k in _BUTTON_MERGE_KEYS if button_info[k] not in {None, ''} and (positions := merge_index[k].get(button_info[k]))]
+            if candidates: # MATCH FOUND (earliest field sharing any key value with the button)
+                position = min(candidates)
+                field = self.fields[position]
+                self._index_button_merge_field(position, remove=True) # Re-indexed below once its values are updated
+
+                # Mapping of dynamic list with optional xPath of button.
+                if field['type'] == 'list':
+                    field['xPath'] = button_info['xPath-relative']
+
+                # Selectively update values
+                for k, v in button_info.items():
+                    if v is not None:
+                        if k in field:
+                            if (field[k] is None): # Only update if the field value is None
+                                field[k] = v
+                            if (v) and (k in ('id', 'id-custom')) and (field['type'] == 'file'): # Force edit for 'id' if file type
+                                field[k] = v
+                
+                # Ensure 'hidden' fiels are mapped with buttons
+                #  Note: All left-over hidden fields are later removed in post-cleaning process.
+                if field['type'] == 'hidden' and button_info['type'] != 'file':
+                    field['type'] = 'button'
+                    field['xPath'] = button_info['xPath-relative']
+
+                self._index_button_merge_field(position)
+                self._merge_index = None # Field values/type may have changed: rebuild the radio/checkbox merge index on next use
 
-                    return None # Merged successfully
+                return None # Merged successfully
 
         # No match found, should be added as a new entry.
         return button_info 
@@ -3340,49 +4059,56 @@ class WebPageParser:
         button_xPath = self.WebParserUtils.get_xpath(element, verify_xpath=True) # Compute xPath
         # Exclude button element if xPath doesn't exists
         if not button_xPath: return None
-        button_relative_xPath = button_xPath if not self.WebParserUtils.is_absolute_xpath(button_xPath) else self.WebParserUtils.compute_relative_xpath_selenium(element, optimized=False)
+        button_xPath_is_absolute = self.WebParserUtils.is_absolute_xpath(button_xPath)
+        button_relative_xPath = button_xPath if not button_xPath_is_absolute else self.WebParserUtils.compute_relative_xpath_selenium(element, optimized=False)
+
+        # Fetch the attributes read below in a single round-trip
+        element_attrs = self.WebParserUtils.get_element_attributes(element)
+        element_tag = element_attrs['tag']
 
         # Get button type
-        has_type_attr = self.driver.execute_script("return arguments[0].hasAttribute('type');", element)
-        button_type = element.get_attribute("type") if has_type_attr else "button"
+        button_type = element_attrs['type'] if element_attrs['has-type'] else "button"
         # Final cleaning of button_type.
         button_type = "button" if button_type not in {"submit"} else button_type
 
         # Get button text
-        if element.tag_name.lower() == 'input': # Could be type -> 'button', 'submit', or 'reset'
-            button_text = val if (val := element.get_attribute("value")) else None
+        element_text = None # Visible text (only fetched for non-input buttons)
+        if element_tag == 'input': # Could be type -> 'button', 'submit', or 'reset'
+            button_text = val if (val := element_attrs['value']) else None
         else:
-            button_text = button_text if (button_text := self.ParsedDataUtils.clean_text(element.text.strip())) != '' else None
+            element_text = element.text
+            button_text = button_text if (button_text := self.ParsedDataUtils.clean_text(element_text.strip())) != '' else None
             if not button_text:
-                button_text = val if (val := element.get_attribute("title")) not in [""] else None
+                button_text = val if (val := element_attrs['title']) not in [""] else None
 
         # Get button ID
-        button_id = val if (val := element.get_attribute("id")) not in [""] else None
-        button_id_attributes = self.WebParserUtils.search_attribute(["id"], element)
-        button_customId = (diff_set := set((button_id_attributes or {}).values()).difference({element.get_attribute("id")})) and diff_set.pop() or None
+        button_id = val if (val := element_attrs['id']) not in [""] else None
+        button_id_attributes = self._search_element_attribute(["id"], element_attrs)
+        button_customId = _first_other_value(button_id_attributes, element_attrs['id'])
 
         # Get Label
-        button_labelSrcTag = self._get_field_label(element)
-        button_labelCustom = (diff_set := set((self.WebParserUtils.search_attribute(["label"], element) or {}).values()).difference({element.get_attribute("label")})) and diff_set.pop() or None
+        button_labelSrcTag = self._get_field_label(element, element_attrs)
+        button_labelCustom = _first_other_value(self._search_element_attribute(["label"], element_attrs), element_attrs['label'])
         button_labelSrcText = None
         if force_insert and not self.dom_contains_xml_namespaces:
-            if self.WebParserUtils.is_absolute_xpath(button_xPath):
+            if button_xPath_is_absolute:
                 button_labelSrcText = self.WebParserUtils.find_associated_text(button_xPath)
         
         # Get name
-        button_name = val if (val := element.get_attribute("name")) not in [""] else None
+        button_name = val if (val := element_attrs['name']) not in [""] else None
         if not button_name:
-            button_name = val if (val := element.get_attribute("title")) not in [""] else None
+            button_name = val if (val := element_attrs['title']) not in [""] else None
 
         '''
         Disable blacklist when `force_insert` is set True.
         '''
         if not force_insert:
             ''' Exclude headder/footer button '''
-            if self.WebParserUtils.is_absolute_xpath(button_xPath):
+            if button_xPath_is_absolute:
+                header_footer_steps = {step.lower() for step in _HEADER_FOOTER_XPATH_RE.findall(button_xPath)}
                 if (
-                    ('header' in button_xPath) 
-                    or ('footer' in button_xPath and button_type != 'submit')
+                    ('header' in header_footer_steps) 
+                    or ('footer' in header_footer_steps and button_type != 'submit')
                 ): # Return fields if they are contained in 'header' or 'footer with non-submit type'
                     return None
             else:
@@ -3394,28 +4120,15 @@ class WebPageParser:
                     return None
 
             ''' Exclude BLACKLISTED button attribute values '''
-            match_found = False
-            # Check full blacklist first
-            for full in config.blacklist.button_blacklist_attribute_value_full:
-                # Exclude button if any of its attribute value exactly matchs the full blacklist
-                if any((attr['value'] or '').lower() == full.lower() for attr in element.get_property('attributes')):
-                    match_found = True
-                    break
-            # Check partial blacklist if no full match was found
-            if not match_found:
-                for partial in config.blacklist.button_blacklist_attribute_value_partial:
-                    # Exclude button if any of its attribute value partially matchs the partial blacklist
-                    if any(partial.lower() in (attr['value'] or '').lower() for attr in element.get_property('attributes')):
-                        match_found = True
-                        break
-            if match_found:
+            # Exclude button if any of its attribute value exactly/partially matchs the full/partial blacklist
+            if self.ParsedDataUtils.match_attribute_value_blacklist(config.blacklist.button_blacklist_attribute_value_full, config.blacklist.button_blacklist_attribute_value_partial, element_attrs['attributes']):
                 return None  # Skip this button and move to the next one
 
             ''' Exclude BLACKLISTED buttons text '''
             # Exclude button that match the full blacklist
             if self.ParsedDataUtils.match_full_blacklist(config.blacklist.button_blacklist_text_full, (button_text,)):
                 # If button_text is empty and 'onclick' attribute is not None, skip continue
-                if button_text == '' and element.get_attribute('onclick') is not None:
+                if button_text == '' and element_attrs['onclick'] is not None:
                     pass  # Do not continue, allow processing of this button
                 else:
                     return None  # Continue to the next button otherwise
@@ -3434,7 +4147,7 @@ class WebPageParser:
             ''' Label lookup BLACKLIST '''
             search_label_text = True
             # Check if the button has visible text
-            if element.text != '' and element.tag_name == 'button':
+            if element_tag == 'button' and element_text != '':
                 # Disable label lookup that match the full blacklist (based on Text)
                 if self.ParsedDataUtils.match_full_blacklist(config.blacklist.find_associated_text_blacklist_text_full, (button_text,)):
                     search_label_text = False
@@ -3449,7 +4162,7 @@ class WebPageParser:
                     search_label_text = False
             # Search associated label text if the buttons' id/text was not blacklisted
             if search_label_text and not self.dom_contains_xml_namespaces:
-                if self.WebParserUtils.is_absolute_xpath(button_xPath):
+                if button_xPath_is_absolute:
                     button_labelSrcText = self.WebParserUtils.find_associated_text(button_xPath)
 
             '''' Exclude BLACKLISTED buttons label '''
@@ -3474,8 +4187,8 @@ class WebPageParser:
             "id": button_id,
             "id-custom": button_customId,
             "type": button_type,
-            "value": val if (val := element.get_attribute("value")) else None,
-            "disabled": element.get_attribute("disabled") is not None,
+            "value": val if (val := element_attrs['value']) else None,
+            "disabled": element_attrs['disabled'],
             "webElement": element,
             "xPath": button_xPath,
             "xPath-relative": button_relative_xPath
@@ -3494,11 +4207,21 @@ class WebPageParser:
         links = []
         logger.info("🧼  Fetching and synchronizing links...")
         elements: List[WebElement] = self.WebParserUtils.query_all_elements(tag_names = ["a"])
-        for link_el in elements:
+        # Texts of all links in one round-trip (empty when not rendered, like `WebElement.text`): only whitelisted links are worth the per-link xPath/label lookups
+        link_texts: List[str] = self.driver.execute_script("return arguments[0].map(a => (a.getClientRects().length ? a.innerText || '' : '').trim());", elements) if elements else []
+        for link_el, link_text in zip(elements, link_texts):
+            if not self._is_link_text_whitelisted(link_text):
+                continue
             # Append to links(type:list) if dictionary is returned
-            if (link_info := self._synchronize_link(self._extract_link_info(link_el))): links.append(link_info)
+            if (link_info := self._synchronize_link(self._extract_link_info(link_el, link_text))): links.append(link_info)
         return links
 
+    def _is_link_text_whitelisted(self, link_text: Optional[str]) -> bool:
+        """
+        Checks whether a link text exactly matches (ignoring whitespace and case) one of the start-apply/auth button identifiers.
+        """
+        return bool(link_text) and isinstance(link_text, str) and link_text.translate(_WS_DEL).lower() in _LINK_WHITELIST
+
     def _synchronize_link(self, link_info: dict) -> Dict[str, Any] | None:
         """
         Synchronizes links by filtering and other operations.
@@ -3507,35 +4230,29 @@ class WebPageParser:
         if not link_info:
             return None
         
-        link_whitelist = set(start_apply_btn_identifiers).union(
-                                                            signup_auth_btn_identifiers,
-                                                            signin_auth_btn_identifiers,
-                                                            verify_auth_btn_identifiers,
-                                                            other_auth_btn_identifiers
-                                                        )
-
         # List of whitelisted link texts
-        if not self.ParsedDataUtils.is_substrings_in_item(link_info, ["text"], link_whitelist, normalize_whitespace=True, exact_match=True, case_sensitive=False):
+        if not self._is_link_text_whitelisted(link_info.get("text")):
             return None # Exclude if not in whitelist
         return link_info
 
-    def _extract_link_info(self, element: WebElement) -> Dict[str, Any] | None:
+    def _extract_link_info(self, element: WebElement, link_text: Optional[str] = None) -> Dict[str, Any] | None:
 
         # Initialize xPath
         link_xPath = self.WebParserUtils.get_xpath(element) # Compute xPath
         # Exclude button element if xPath doesn't exists
         if not link_xPath: return None
-        link_relative_xPath = link_xPath if not self.WebParserUtils.is_absolute_xpath(link_xPath) else self.WebParserUtils.compute_relative_xpath_selenium(element, optimized=False)
+        link_xPath_is_absolute = self.WebParserUtils.is_absolute_xpath(link_xPath)
+        link_relative_xPath = link_xPath if not link_xPath_is_absolute else self.WebParserUtils.compute_relative_xpath_selenium(element, optimized=False)
 
         link_labelSrcTag = self._get_field_label(element)
         field_labelSrcText = None
-        if self.WebParserUtils.is_absolute_xpath(link_xPath):
+        if link_xPath_is_absolute:
             field_labelSrcText = self.WebParserUtils.find_associated_text(link_xPath)
 
         link_info = {
             "label-srcTag": link_labelSrcTag,
             "label-srcText": field_labelSrcText,
-            "text": element.text.strip(),
+            "text": link_text if link_text is not None else element.text.strip(),
             "href": element.get_attribute("href"),
             "rel": element.get_attribute("rel"),
             'type': 'link',
@@ -3555,11 +4272,19 @@ class WebPageParser:
                                    about each table.
         """
         tables = []
-        for table in self.driver.find_elements(By.TAG_NAME, 'table'):
+        # Header/cell texts of every table serialized in one round-trip (instead of a `.text` call per cell)
+        found = self.driver.execute_script("""
+            const text = el => (el.getClientRects().length ? el.innerText : '').trim(); // Like WebElement.text: empty when not rendered
+            return Array.from(document.querySelectorAll('table'), table => [
+                table,
+                Array.from(table.querySelectorAll('th'), text),
+                Array.from(table.querySelectorAll('tr'), tr => Array.from(tr.querySelectorAll('td'), text))
+            ]);
+        """)
+        for table, headers, rows in found:
             table_data = {
-                "headers": [th.text.strip() for th in table.find_elements(By.TAG_NAME, 'th')],
-                "rows": [[td.text.strip() for td in tr.find_elements(By.TAG_NAME, 'td')]
-                         for tr in table.find_elements(By.TAG_NAME, 'tr')],
+                "headers": headers,
+                "rows": rows,
                 "selectors": self._get_element_selectors(table)
             }
             tables.append(table_data)
@@ -3576,31 +4301,49 @@ class WebPageParser:
         containers = []
         container_types = ['header', 'section', 'article', 'aside', 'nav', 'div', 'span', 'label', 'p']
 
-        for container_type in container_types:
-            for container in self.driver.find_elements(By.TAG_NAME, container_type):
-                container_data = {
-                    "type": container_type,
-                    "text": container.text.strip(),
-                    "selectors": self._get_element_selectors(container)
-                }
-                containers.append(container_data)
+        # One union selector query (tag names and texts returned alongside) instead of a lookup per container type and a `.text` call per container
+        found = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]), el => [el, el.tagName.toLowerCase(), (el.getClientRects().length ? el.innerText : '').trim()]);",
+            ",".join(container_types)
+        )
+        # Stable sort keeps document order within each type, matching the per-type grouping
+        type_rank = {container_type: rank for rank, container_type in enumerate(container_types)}
+        found.sort(key=lambda pair: type_rank[pair[1]])
+
+        for container, container_type, container_text in found:
+            container_data = {
+                "type": container_type,
+                "text": container_text,
+                "selectors": self._get_element_selectors(container)
+            }
+            containers.append(container_data)
         return containers
 
-    def _get_field_label(self, element: WebElement) -> Optional[str]:
+    def _get_field_label(self, element: WebElement, element_attrs: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Extracts the label associated with a given input field element.
 
         Args:
             element: The input field element to extract the label for.
+            element_attrs: Optional `WebParserUtils.get_element_attributes` result for the element (saves re-reading its attributes).
 
         Returns:
             Union[str, None]: The text of the associated label element, or None
                                if no label is found.
         """
 
-        labelCustom = (diff_set := set((self.WebParserUtils.search_attribute(["label"], element) or {}).values()).difference({element.get_attribute("label")})) and diff_set.pop() or None
-        defaultId = val if (val := element.get_attribute("id")) not in [""] else None
-        customId = (diff_set := set((self.WebParserUtils.search_attribute(["id"], element) or {}).values()).difference({element.get_attribute("id")})) and diff_set.pop() or None
+        if element_attrs is not None:
+            attributes = [(attr['name'], attr['value']) for attr in element_attrs['attributes']]
+            label_attributes = self.WebParserUtils._match_attribute_names(["label"], attributes)
+            id_attributes = self.WebParserUtils._match_attribute_names(["id"], attributes)
+            label_value, id_value = element_attrs['label'], element_attrs['id']
+        else:
+            label_attributes = self.WebParserUtils.search_attribute(["label"], element)
+            id_attributes = self.WebParserUtils.search_attribute(["id"], element)
+            label_value, id_value = element.get_attribute("label"), element.get_attribute("id")
+        labelCustom = _first_other_value(label_attributes, label_value)
+        defaultId = val if (val := id_value) not in [""] else None
+        customId = _first_other_value(id_attributes, id_value)
 
         # Extract all possible ID values that could be associated with label element
         possible_ids = set()
@@ -3611,50 +4354,38 @@ class WebPageParser:
         if customId:
             possible_ids.update(customId.split(' '))
 
-        # Try to find the label for each possible_id for both "for" and "id" attributes
-        for label_id in possible_ids:
-            try:
-                # Check if label for this id exists
-                label = self.driver.find_element(By.CSS_SELECTOR, f'label[for="{label_id}"]')
-                label = self.ParsedDataUtils.clean_text(label.text.strip())
-                if label: 
-                    return label
-            except:
-                pass  # If not found, continue to next block
-
-            try:
-                # Check if label with id attribute exists
-                label = self.driver.find_element(By.CSS_SELECTOR, f'label[id="{label_id}"]')
-                label = self.ParsedDataUtils.clean_text(label.text.strip())
-                if label:
-                    return label
-            except:
-                pass  # If not found, continue to next iteration
-
-        try:
-            # Find the label associated by proximity
-            label = element.find_element(By.XPATH, f'./ancestor::label')
-            label = self.ParsedDataUtils.clean_text(label.text.strip())
-            if label:
-                return label
-        except:
-            pass
-
+        # Collect every label candidate in one round-trip, in lookup order:
+        # (1) for each possible_id, the first label with a matching "for" and the first with a matching "id" attribute,
+        # (2) the label associated by proximity (ancestor), (3) a preceding sibling label.
         try:
-            # Check for preceding label
-            label = self.driver.execute_script("""
-                var el = arguments[0];
-                var label = el.previousElementSibling;
-                if (label && label.tagName.toLowerCase() === 'label') {
-                    return label.textContent.trim();
+            candidates = self.driver.execute_script("""
+                var el = arguments[0], ids = arguments[1];
+                function visibleText(node) { return node.getClientRects().length ? node.innerText : ''; } // Like WebElement.text: empty when not rendered
+                var labels = document.getElementsByTagName('label');
+                var texts = [];
+                for (var i = 0; i < ids.length; i++) {
+                    var forLabel = null, idLabel = null;
+                    for (var j = 0; j < labels.length && !(forLabel && idLabel); j++) {
+                        if (!forLabel && labels[j].getAttribute('for') === ids[i]) forLabel = labels[j];
+                        if (!idLabel && labels[j].getAttribute('id') === ids[i]) idLabel = labels[j];
+                    }
+                    texts.push(forLabel ? visibleText(forLabel) : null, idLabel ? visibleText(idLabel) : null);
                 }
-                return null;
-            """, element)
-            label = self.ParsedDataUtils.clean_text(label)
-            if label:
+                var ancestor = null; // Outermost ancestor label (first in document order)
+                for (var p = el.parentElement; p; p = p.parentElement) {
+                    if (p.tagName.toLowerCase() === 'label') ancestor = p;
+                }
+                texts.push(ancestor ? visibleText(ancestor) : null);
+                var label = el.previousElementSibling;
+                texts.push(label && label.tagName.toLowerCase() === 'label' ? label.textContent.trim() : null);
+                return texts;
+            """, element, list(possible_ids)) or []
+        except Exception:
+            return None
+
+        for candidate in candidates:
+            if candidate and (label := self.ParsedDataUtils.clean_text(candidate.strip())):
                 return label
-        except:
-            pass
 
         return None
 
@@ -3671,10 +4402,13 @@ class WebPageParser:
         """
         options = []
 
-        # Loop through each <option> element in the dropdown
-        for option in select_element.find_elements(By.TAG_NAME, 'option'):
-            option_value = option.get_attribute("value")
-            option_text = self.ParsedDataUtils.clean_text(option.text.strip())
+        # Values and texts of every <option> in the dropdown, fetched in one round-trip
+        raw_options = self.driver.execute_script(
+            "return Array.from(arguments[0].querySelectorAll('option'), option => [option.value, option.text]);",
+            select_element
+        )
+        for option_value, option_text in raw_options:
+            option_text = self.ParsedDataUtils.clean_text(option_text.strip())
 
             ''' Exclude BLACKLISTED options ''' 
             # Check for exact match (full match)
@@ -3704,12 +4438,13 @@ class WebPageParser:
         field_labelSrcText = None
         if self.WebParserUtils.is_absolute_xpath(field_xPath):
             field_labelSrcText = self.WebParserUtils.find_associated_text(field_xPath)
+        label_attribute = next(iter((self.WebParserUtils.search_attribute(['label'], element) or {}).values()), None) # Fetched once for both keys
             
         return {
             "xpath": field_xPath,
-            "id": (attr_vals := self.WebParserUtils.search_attribute(['label'], element)).pop() if attr_vals else None,
+            "id": label_attribute,
             "label-srcText": field_labelSrcText,
-            "label-srcAttribute": (attr_vals := self.WebParserUtils.search_attribute(['label'], element)) and attr_vals.pop() if attr_vals else None
+            "label-srcAttribute": label_attribute
         }
 
     def get_submit_buttons(self, visible_only: bool = True) -> List[WebElement]:
@@ -3723,7 +4458,15 @@ class WebPageParser:
             List[WebElement]: A list of WebElement instances matching <button type="submit">.
         """
         buttons = self.driver.find_elements("xpath", "//button[@type='submit']")
-        return [btn for btn in buttons if btn.is_displayed()] if visible_only else buttons
+        if not visible_only or not buttons:
+            return buttons
+        # Visibility of every button in one round-trip. Rendered boxes rather than `offsetParent`, which is null for
+        # `position: fixed` buttons (e.g. sticky-footer Submit/Next) that `is_displayed()` accepts
+        visible = self.driver.execute_script(
+            "return arguments[0].map(btn => btn.getClientRects().length > 0 && getComputedStyle(btn).visibility !== 'hidden');",
+            buttons
+        )
+        return [btn for btn, is_visible in zip(buttons, visible) if is_visible]
 
     def get_required_fields(self) -> list[WebElement]:
         """
@@ -3732,33 +4475,40 @@ class WebPageParser:
         Returns:
             List[WebElement]: List of input elements that are likely required or invalid.
         """
-        required_fields = []
         input_elements = self.driver.find_elements(By.XPATH, "//input | //textarea | //select")
-
-        for element in input_elements:
-            if self.WebParserUtils.is_field_required(element):
-                required_fields.append(element)
-
-        return required_fields
+        # Required checks for every field in one round-trip (instead of one per field)
+        return [element for element, required in zip(input_elements, self.WebParserUtils.are_fields_required(input_elements)) if required]
 
 
 class HtmlDiffer:
 
     def __init__(self):
         self.parent_paths = []
+        self._evaluator_root = None # Document root the cached XPath evaluator is bound to
+        self._evaluator = None
 
     def get_xpath(self, element, root):
         """Generate XPath of element relative to root"""
         return root.getroottree().getpath(element)
 
-    def compare_elements(self, el_x, el_y, root_x, root_y):
+    def _xpath(self, root, xpath: str) -> list:
+        """`root.xpath(xpath)` through an `XPathEvaluator` bound once per document (instead of setting up a new evaluation context per query)."""
+        if self._evaluator_root is not root:
+            self._evaluator = etree.XPathEvaluator(root)
+            self._evaluator_root = root
+        return self._evaluator(xpath)
+
+    def _compare_element_nodes(self, el_x, el_y, root_x, root_y) -> tuple:
         """
-        Recursively compare two elements. If el_y is new or modified compared to el_x,
-        return the new element. Also store the parent XPath where the change starts if applicable.
+        Compares two elements without their children.
+
+        Returns:
+            tuple: (result, descend) - `result` is the element to report (el_y if it is new or modified, else None);
+                   `descend` is True when both match here, so their children still need comparing.
         """
         # Guard: If el_y is None, there's nothing to compare
         if el_y is None:
-            return None
+            return None, False
 
         # If el_x is None, el_y is new
         if el_x is None:
@@ -3767,47 +4517,64 @@ class HtmlDiffer:
             if parent_el_y is not None:
                 parent_xpath_y = self.get_xpath(parent_el_y, root_y)
                 # Check if parent exists in tree_x
-                if root_x.xpath(parent_xpath_y):
+                if self._xpath(root_x, parent_xpath_y):
                     self.parent_paths.append(parent_xpath_y)
-            return el_y
+            return el_y, False
 
         # If tag or attributes differ, treat as modified
         if el_x.tag != el_y.tag or el_x.attrib != el_y.attrib:
-            return el_y
+            return el_y, False
 
         # If text content differs, treat as modified
         if (el_x.text or '').strip() != (el_y.text or '').strip():
-            return el_y
-
-        # Compare children recursively
-        children_x = list(el_x)
-        children_y = list(el_y)
-        max_len = max(len(children_x), len(children_y))
-
-        new_children = []
-        for i in range(max_len):
-            child_x = children_x[i] if i < len(children_x) else None
-            child_y = children_y[i] if i < len(children_y) else None
-            diff_child = self.compare_elements(child_x, child_y, root_x, root_y)
-            if diff_child is not None:
-                new_children.append(diff_child)
-
-        if new_children:
-            el_copy = lxml_html.Element(el_y.tag, el_y.attrib)
-            el_copy.text = el_y.text
-            for child in new_children:
-                el_copy.append(child)
-            return el_copy
+            return el_y, False
 
-        return None
+        return None, True
+
+    def compare_elements(self, el_x, el_y, root_x, root_y):
+        """
+        Compare two elements and their descendants. If el_y is new or modified compared to el_x,
+        return the new element. Also store the parent XPath where the change starts if applicable.
+
+        Walks the trees with an explicit stack (deeply nested pages would exceed the recursion limit),
+        visiting children pairwise in order exactly like a recursive descent would.
+        """
+        result, descend = self._compare_element_nodes(el_x, el_y, root_x, root_y)
+        if not descend:
+            return result
+
+        # Frames: (el_y, remaining (child_x, child_y) pairs, diffs collected from its children)
+        stack = [(el_y, itertools.zip_longest(el_x, el_y), [])]
+        while True:
+            el_y, child_pairs, new_children = stack[-1]
+            for child_x, child_y in child_pairs:
+                result, descend = self._compare_element_nodes(child_x, child_y, root_x, root_y)
+                if descend:
+                    stack.append((child_y, itertools.zip_longest(child_x, child_y), []))
+                    break
+                if result is not None:
+                    new_children.append(result)
+            else:
+                # All children compared: report a copy of el_y holding only the changed children
+                stack.pop()
+                result = None
+                if new_children:
+                    result = lxml_html.Element(el_y.tag, el_y.attrib)
+                    result.text = el_y.text
+                    for child in new_children:
+                        result.append(child)
+                if not stack:
+                    return result
+                if result is not None:
+                    stack[-1][2].append(result)
 
     def html_diff(self, html_x, html_y) -> Union[str, List[str]]:
         """
         Computes the difference in DOM structure from html_x to html_y.
         Returns the new or modified elements as HTML string and the parent XPaths where changes start.
         """
-        tree_x = lxml_html.fromstring(html_x)
-        tree_y = lxml_html.fromstring(html_y)
+        tree_x = lxml_html.fromstring(html_x, parser=_HTML_DIFF_PARSER)
+        tree_y = lxml_html.fromstring(html_y, parser=_HTML_DIFF_PARSER)
 
         self.parent_paths = []
         diffs = []
@@ -3816,12 +4583,12 @@ class HtmlDiffer:
         body_y = tree_y.find('.//body')
 
         if body_x is not None and body_y is not None:
+            # First child of body_x per (tag, attributes): one lookup per child_y instead of a scan over body_x
+            children_x = {}
+            for child_x in body_x:
+                children_x.setdefault((child_x.tag, frozenset(child_x.attrib.items())), child_x)
             for child_y in body_y:
-                matched = None
-                for child_x in body_x:
-                    if child_x.tag == child_y.tag and child_x.attrib == child_y.attrib:
-                        matched = child_x
-                        break
+                matched = children_x.get((child_y.tag, frozenset(child_y.attrib.items())))
                 diff = self.compare_elements(matched, child_y, tree_x, tree_y)
                 if diff is not None:
                     diffs.append(diff)
@@ -1,3 +1,3 @@
 # modules/embeddings/__init__.py
 from .main import *
-from .vectorstore import filter_relevant_contexts
\ No newline at end of file
+from .vectorstore import filter_relevant_contexts, get_embeddings, get_vectorstore
\ No newline at end of file
@@ -3,6 +3,11 @@ import json
 from langchain_core.documents import Document
 from .flattener import flatten_json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def safe_metadata(meta: dict) -> dict:
     return {k: str(v) if not isinstance(v, (str, int, float, bool)) else v for k, v in meta.items()}
 
@@ -11,8 +16,12 @@ def json_to_documents(json_path, exclude_keys: set = None):
     if exclude_keys is None:
         exclude_keys = set()
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
+    if orjson is not None:
+        with open(json_path, "rb") as f:
+            raw_data = orjson.loads(f.read())
+    else:
+        with open(json_path, "r", encoding="utf-8") as f:
+            raw_data = json.load(f)
 
     flattened = flatten_json(data=raw_data, exclude_keys=exclude_keys)
 
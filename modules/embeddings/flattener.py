@@ -7,23 +7,21 @@ def flatten_json(
     sep: str = ".",
     exclude_keys: set = None
 ) -> List[Tuple[str, str]]:
-    """Recursively flattens nested JSON and returns a list -> flat_data of (key, value) string pairs."""
-    if exclude_keys is None:
-        exclude_keys = set()
+    """Flattens nested JSON (iteratively, in document order) and returns a list -> flat_data of (key, value) string pairs."""
+    # Normalized once for the whole traversal (dict keys are lowercased before the lookup)
+    exclude_keys = frozenset(key.lower() for key in exclude_keys) if exclude_keys else frozenset()
 
     flat_data = []
+    stack = [(parent_key, data)] # LIFO of (key, node): children are pushed in reverse so they pop in order
 
-    if isinstance(data, dict):
-        for k, v in data.items():
-            if k.lower() in exclude_keys:
-                continue
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            flat_data.extend(flatten_json(v, new_key, sep=sep, exclude_keys=exclude_keys))
-    elif isinstance(data, list):
-        for i, v in enumerate(data):
-            new_key = f"{parent_key}[{i}]"
-            flat_data.extend(flatten_json(v, new_key, sep=sep, exclude_keys=exclude_keys))
-    else:
-        flat_data.append((parent_key, str(data)))  # Force everything to string
+    while stack:
+        key, node = stack.pop()
+        if isinstance(node, dict):
+            items = node.items() if not exclude_keys else ((k, v) for k, v in node.items() if k.lower() not in exclude_keys)
+            stack.extend(reversed([(f"{key}{sep}{k}" if key else k, v) for k, v in items]))
+        elif isinstance(node, list):
+            stack.extend(reversed([(f"{key}[{i}]", v) for i, v in enumerate(node)]))
+        else:
+            flat_data.append((key, str(node)))  # Force everything to string
 
     return flat_data
\ No newline at end of file
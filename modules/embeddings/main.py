@@ -3,7 +3,7 @@ import os
 import shutil
 from .utils import get_file_hash
 from .embedder import json_to_documents
-from .vectorstore import embed_and_store
+from .vectorstore import embed_and_store, get_vectorstore, reset_vectorstores
 
 # Global constant for hash file path
 HASH_FILE = None  # This will be set by set_hash_file()
@@ -29,20 +29,36 @@ def run_embedding(json_path, chroma_dir, embed_model, collection_name, exclude_k
     if exclude_keys is None:
         exclude_keys = set()
 
+    def file_stamp(json_path):
+        # Size and modification time: if both match the stored ones, the file is not re-read and re-hashed
+        st = os.stat(json_path)
+        return f"{st.st_size}:{st.st_mtime_ns}"
+
     def has_changed(json_path):
-        current = get_file_hash(json_path)
         if os.path.exists(HASH_FILE):
             with open(HASH_FILE) as f:
                 stored = f.read().strip()
-            return current != stored
+            # Stored as "{size}:{mtime_ns}:{hash}" (a bare hash is from older runs)
+            stored_stamp, _, stored_hash = stored.rpartition(":")
+            if stored_stamp and stored_stamp == file_stamp(json_path):
+                return False
+            if get_file_hash(json_path) != stored_hash:
+                return True
+            update_hash(json_path) # Touched but unchanged: refresh the stamp for the next fast check
+            return False
         return True
 
     def update_hash(json_path):
+        stamp = file_stamp(json_path)
         current = get_file_hash(json_path)
-        with open(HASH_FILE, "w") as f:
-            f.write(current)
+        # Write to a temporary file and swap it in, so a crash mid-write can't leave a truncated hash behind
+        tmp_file = f"{HASH_FILE}.tmp"
+        with open(tmp_file, "w") as f:
+            f.write(f"{stamp}:{current}")
+        os.replace(tmp_file, HASH_FILE)
 
     def clean_chroma_dir(filepath):
+        reset_vectorstores() # Cached handles would point at the deleted store
         if os.path.exists(filepath):
             shutil.rmtree(filepath)
 
@@ -63,14 +79,7 @@ def run_embedding(json_path, chroma_dir, embed_model, collection_name, exclude_k
     print(f"✅  Embedded {len(docs)} chunks.")
 
 def search(chroma_dir, query, k=3, embed_model="mxbai-embed-large"):
-    from langchain_ollama import OllamaEmbeddings
-    from langchain_chroma import Chroma
-
-    db = Chroma(
-        collection_name="jobpilot_user_context",
-        embedding_function=OllamaEmbeddings(model=embed_model),
-        persist_directory=chroma_dir
-    )
+    db = get_vectorstore(chroma_dir, "jobpilot_user_context", embed_model)
     results = db.similarity_search(query, k=k)
     print("\n🔎 Top Matches:")
     for i, doc in enumerate(results):
@@ -1,6 +1,14 @@
 # modules/embeddings/utils.py
 import hashlib
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# The hash only detects changes to the JSON file, so a fast non-cryptographic digest is preferred when available
+_hash_constructor = xxhash.xxh3_128 if xxhash is not None else hashlib.md5
+
 def get_file_hash(filepath):
     with open(filepath, "rb") as f:
-        return hashlib.md5(f.read()).hexdigest()
\ No newline at end of file
+        return hashlib.file_digest(f, _hash_constructor).hexdigest() # Streams the file in chunks instead of reading it whole
@@ -1,16 +1,89 @@
 # modules/embeddings/vectorestore.py
 from langchain_ollama import OllamaEmbeddings
 from langchain_chroma import Chroma
-from sklearn.metrics.pairwise import cosine_similarity
+from langchain_core.embeddings import Embeddings
+from collections import OrderedDict
+import functools
+import threading
 import numpy as np
 
-def embed_and_store(documents, persist_dir, embed_model="mxbai-embed-large", collection_name='json_context'):
-    embeddings = OllamaEmbeddings(model=embed_model)
-    db = Chroma(
+class CachedEmbeddings(Embeddings):
+    """
+    Wraps a LangChain embedding function and memoizes vectors per text (LRU, `maxsize` entries per kind).
+
+    `embed_documents` only sends the texts it has not seen before, de-duplicated, in a single batched call.
+    Document and query vectors are cached separately since models may embed them differently.
+    """
+
+    def __init__(self, embedding_func: Embeddings, maxsize: int = 4096):
+        self.embedding_func = embedding_func
+        self.maxsize = maxsize
+        self._documents = OrderedDict()
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, cache: OrderedDict, text: str, vector: list) -> None:
+        with self._lock:
+            cache[text] = vector
+            cache.move_to_end(text)
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+
+    def _recall(self, cache: OrderedDict, text: str):
+        with self._lock:
+            vector = cache.get(text)
+            if vector is not None:
+                cache.move_to_end(text)
+            return vector
+
+    def embed_documents(self, texts: list) -> list:
+        unique_texts = list(dict.fromkeys(texts))
+        vectors = {text: vector for text in unique_texts if (vector := self._recall(self._documents, text)) is not None}
+        missing = [text for text in unique_texts if text not in vectors]
+        if missing:
+            for text, vector in zip(missing, self.embedding_func.embed_documents(missing)):
+                vectors[text] = vector
+                self._remember(self._documents, text, vector)
+        return [vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> list:
+        vector = self._recall(self._queries, text)
+        if vector is None:
+            vector = self.embedding_func.embed_query(text)
+            self._remember(self._queries, text, vector)
+        return vector
+
+_client_lock = threading.Lock() # Serializes first-time construction of the shared clients below
+
+@functools.lru_cache(maxsize=None)
+def _get_embeddings(embed_model: str) -> CachedEmbeddings:
+    return CachedEmbeddings(OllamaEmbeddings(model=embed_model))
+
+def get_embeddings(embed_model: str = "mxbai-embed-large") -> CachedEmbeddings:
+    """Shared (per model) caching Ollama embeddings client, so repeated stores/searches reuse one client and its vectors."""
+    with _client_lock:
+        return _get_embeddings(embed_model)
+
+@functools.lru_cache(maxsize=8)
+def _get_vectorstore(persist_dir: str, collection_name: str, embed_model: str) -> Chroma:
+    return Chroma(
         collection_name=collection_name,
-        embedding_function=embeddings,
+        embedding_function=_get_embeddings(embed_model),
         persist_directory=persist_dir
     )
+
+def get_vectorstore(persist_dir: str, collection_name: str = 'json_context', embed_model: str = "mxbai-embed-large") -> Chroma:
+    """Shared Chroma handle per (persist_dir, collection_name, embed_model), opened once instead of on every search."""
+    with _client_lock:
+        return _get_vectorstore(persist_dir, collection_name, embed_model)
+
+def reset_vectorstores() -> None:
+    """Drops the shared Chroma handles (call before deleting a persist directory)."""
+    with _client_lock:
+        _get_vectorstore.cache_clear()
+
+def embed_and_store(documents, persist_dir, embed_model="mxbai-embed-large", collection_name='json_context'):
+    db = get_vectorstore(persist_dir, collection_name, embed_model)
     db.add_documents(documents) # This will auto-persist
     # db.persist() # Remove: Because Chroma now auto-persists data as soon as .add_documents() is called.
     return db
@@ -42,8 +115,12 @@ def filter_relevant_contexts(
     query_vec = embedding_func.embed_query(query)
     doc_vecs = embedding_func.embed_documents(doc_texts)
 
-    # Step 2: Compute cosine similarities
-    sim_scores = cosine_similarity([query_vec], doc_vecs)[0]
+    # Step 2: Compute cosine similarities (dot product of L2-normalized vectors; zero vectors score 0)
+    query_arr = np.asarray(query_vec, dtype=np.float64)
+    doc_arr = np.asarray(doc_vecs, dtype=np.float64)
+    query_norm = np.linalg.norm(query_arr)
+    doc_norms = np.linalg.norm(doc_arr, axis=1)
+    sim_scores = (doc_arr @ (query_arr / (query_norm or 1.0))) / np.where(doc_norms == 0, 1.0, doc_norms)
 
     # Step 3: Dynamic threshold based on mean + weighted std deviation
     avg = np.mean(sim_scores)
@@ -65,10 +142,12 @@ def filter_relevant_contexts(
     # Debugging: Print scores for insight
     if debug:
         valid_text = []
+        kept_texts = {text for text, _ in filtered} # One set lookup per doc instead of scanning `filtered` twice
         print("\n-------- [DEBUG: Start] Similarity Scores --------")
         for i, (text, score) in enumerate(scored_docs):
-            keep = "✔" if any(text == f[0] for f in filtered) else "✘"
-            if any(text == f[0] for f in filtered): valid_text.append(text)
+            is_kept = text in kept_texts
+            keep = "✔" if is_kept else "✘"
+            if is_kept: valid_text.append(text)
             print(f"Doc {i+1}: Score = {score:.4f} {keep}")
         print("\n💡 Matched Entries:")
         for i, text in enumerate(valid_text, start=1):
@@ -11,6 +11,22 @@ from google.auth.exceptions import RefreshError
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
 
+_creds_cache = {} # token_file -> (token file mtime_ns, Credentials); skips re-parsing an unchanged token file
+
+def _token_mtime(token_file: str):
+    try:
+        return os.stat(token_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def _write_token(token_file: str, creds: Credentials, previous_json: str = None) -> None:
+    """Saves `creds` to `token_file` unless it serializes to `previous_json`, and caches it against the file's mtime."""
+    token_json = creds.to_json()
+    if token_json != previous_json:
+        with open(token_file, 'w') as token:
+            token.write(token_json)
+    _creds_cache[token_file] = (_token_mtime(token_file), creds)
+
 def get_gmail_service(credentials_file: str, token_file: str = 'token.json', enable_logging: bool = False, headless: bool = False):
     """
     Returns an authenticated Gmail service client.
@@ -26,25 +42,30 @@ def get_gmail_service(credentials_file: str, token_file: str = 'token.json', ena
     """
     creds = None
 
+    # Reuse the credentials parsed earlier in this process while the token file is unchanged
+    mtime = _token_mtime(token_file)
+    cached = _creds_cache.get(token_file)
+    if cached is not None and mtime is not None and cached[0] == mtime:
+        creds = cached[1]
     # Check if token file exists and load credentials
-    if Path(token_file).exists():
+    elif mtime is not None:
         creds = Credentials.from_authorized_user_file(token_file, SCOPES)
+        _creds_cache[token_file] = (mtime, creds)
 
     try:
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
+                previous_json = creds.to_json()
                 creds.refresh(Request()) # Refresh the token if it expired
-                # Save the refreshed token back to file with file lock
-                with open(token_file, 'w') as token:
-                    token.write(creds.to_json())
+                # Save the refreshed token back to file (skipped when the refresh left it unchanged)
+                _write_token(token_file, creds, previous_json)
             else: # Start the OAuth flow if the token is not valid or expired
                 if enable_logging:
                     print("🔐 Starting Gmail authentication flow...")
                 flow = InstalledAppFlow.from_client_secrets_file(credentials_file, SCOPES)
                 creds = flow.run_local_server(port=0)
                 # Save the new token
-                with open(token_file, 'w') as token:
-                    token.write(creds.to_json())
+                _write_token(token_file, creds)
 
     except RefreshError as e:
         if enable_logging:
@@ -52,14 +73,14 @@ def get_gmail_service(credentials_file: str, token_file: str = 'token.json', ena
         # Remove invalid token and retry auth from scratch
         if Path(token_file).exists():
             os.remove(token_file)
+        _creds_cache.pop(token_file, None)
 
         # Retry authentication flow after token removal
         flow = InstalledAppFlow.from_client_secrets_file(credentials_file, SCOPES)
         creds = flow.run_local_server(port=0)
 
         # Save the refreshed credentials
-        with open(token_file, 'w') as token:
-            token.write(creds.to_json())
+        _write_token(token_file, creds)
 
     if enable_logging:
         print("✅ Gmail service authenticated.")
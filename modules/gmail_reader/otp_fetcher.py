@@ -2,22 +2,95 @@
 import re
 from typing import List, Dict, Optional
 from .gmail_service import get_gmail_service
-from typing import Optional, TypedDict, Union
-from bs4 import BeautifulSoup, Tag
+from typing import Optional, Tuple, Union
+from collections.abc import Mapping
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import re
 import base64
 import importlib.util
+import functools
+import time
 from datetime import datetime, timezone
 from filelock import FileLock  # Importing FileLock to handle concurrency
 
-class EmailData(TypedDict):
-    From: str
-    Subject: str
-    Time: int                  # Epoch timestamp in seconds
-    TimeReadable: str          # ISO 8601 formatted string (e.g. "2025-05-16T21:47:00Z")
-    Body: str
-    OTP: Optional[str]
-    URL: List[str]
+# Whitespace runs `_clean_text` rewrites: any run containing a line break (group 1), or spaces/tabs that are not a lone space
+_CLEAN_WHITESPACE_RE = re.compile(r'(\s*[\r\n]\s*)|[ \t]{2,}|\t')
+_OTP_RE = re.compile(r"\b\d{4,10}\b")
+_URL_RE = re.compile(r'https?://[^\s"<>]+')
+_ACTIVATION_KEYWORD_RE = re.compile(r'activate|verify|confirm|signup|register', re.IGNORECASE)
+_ANCHOR_STRAINER = SoupStrainer("a", href=True) # Builds only the <a href> tags instead of the whole document tree
+
+# Fastest installed BeautifulSoup parser, detected once at import
+_BEST_PARSER = next((parser for parser in ['lxml', 'html5lib'] if importlib.util.find_spec(parser)), 'html.parser')
+
+class EmailData(Mapping):
+    """
+    One fetched email, read like a dict (`email['OTP']`, `email.get('URL')`).
+
+    `From`, `Subject` and `Time` come from the message headers up front, while `TimeReadable`, `Body`, `OTP`
+    and `URL` are computed only on first access (callers often need just one of them).
+    """
+    _FIELDS = ("From", "Subject", "Time", "TimeReadable", "Body", "OTP", "URL")
+
+    def __init__(self, message: dict, fetcher: "OTPFetcher"):
+        self._message = message
+        self._fetcher = fetcher
+        self._snippet: str = message.get("snippet", "")
+
+        # Extract headers into a dictionary
+        headers = {h['name']: h['value'] for h in message['payload'].get('headers', [])}
+
+        self.From: str = headers.get("From", "Unknown Sender")
+        self.Subject: str = headers.get("Subject", "No Subject")
+        self.Time: int = int(message.get("internalDate", 0)) // 1000 # Epoch timestamp in seconds
+
+    @functools.cached_property
+    def TimeReadable(self) -> str:
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.Time)) # ISO 8601 in UTC (e.g. "2025-05-16T21:47:00Z")
+
+    @functools.cached_property
+    def _body(self) -> Optional[str]:
+        return self._fetcher._extract_body(self._message) # Tries to extract HTML/plain content
+
+    @functools.cached_property
+    def Body(self) -> str:
+        return self._body or self._snippet
+
+    # `OTP` and `URL` are parsed on the caller's side of `fetch_recent_emails` (outside its try/except),
+    # so a parsing error is reported here and yields an empty value instead of propagating
+    @functools.cached_property
+    def OTP(self) -> Optional[str]:
+        try:
+            return self._fetcher._extract_otp(self.Body) # Extract OTP from the cleaned body or snippet
+        except Exception as e:
+            if self._fetcher.enable_logging:
+                print(f"Error extracting OTP: {e}")
+            return None
+
+    @functools.cached_property
+    def URL(self) -> List[str]:
+        try:
+            # Extract Account Activation URL from raw html (not cleaned body since the URLs could be embedded as hyperlinks)
+            raw_html_body = self._fetcher._extract_raw_html_body(self._message)
+            return self._fetcher._extract_all_activation_urls(raw_html_body or self._body) or []
+        except Exception as e:
+            if self._fetcher.enable_logging:
+                print(f"Error extracting activation URLs: {e}")
+            return []
+
+    def __getitem__(self, key: str):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def __repr__(self) -> str:
+        return f"EmailData(From={self.From!r}, Subject={self.Subject!r}, TimeReadable={self.TimeReadable!r})"
 
 class OTPFetcher:
 
@@ -47,7 +120,7 @@ class OTPFetcher:
             query (str): Optional search query to filter emails using Gmail's search syntax.
 
         Returns:
-            List[EmailData]: A list of dictionaries, each representing an email with the following structure:
+            List[EmailData]: A list of dict-like `EmailData` entries, each representing an email with the following structure:
                 {
                     "From": str,            # Sender's email address
                     "Subject": str,         # Email subject line
@@ -68,37 +141,22 @@ class OTPFetcher:
             ).execute()
 
             messages = results.get('messages', [])
-            email_data = []
-
-            # Step 2: Iterate over each message and fetch full content
-            for msg in messages:
-                msg_id = msg['id']
-                full_msg = self.service.users().messages().get(userId='me', id=msg_id, format='full').execute()
-
-                # Step 3: Extract headers into a dictionary
-                headers = {h['name']: h['value'] for h in full_msg['payload'].get('headers', [])}
-
-                # Step 4: Extract relevant field information
-                sender: str = headers.get("From", "Unknown Sender")
-                subject: str = headers.get("Subject", "No Subject")
-                snippet: str = full_msg.get("snippet", "")
-                epoch_time: int = int(full_msg.get("internalDate", 0)) // 1000 # Extract timestamp in seconds
-                readable_time = datetime.fromtimestamp(epoch_time, tz=timezone.utc).isoformat().replace("+00:00", "Z")
-                body: Optional[str] = self._extract_body(full_msg) # Tries to extract HTML/plain content
-                otp: Optional[str] = self._extract_otp(body or snippet) # Extract OTP from the cleaned body or snippet
-                raw_html_body: Optional[str] = self._extract_raw_html_body(full_msg)
-                activation_url: List[str] = self._extract_all_activation_urls(raw_html_body or body) # Extract Account Activation URL from raw html (not cleaned body since the URLs could be embedded as hyperlinks)
-                
-                # Step 5: Append structured email data to the result list
-                email_data.append({
-                    "From": sender,
-                    "Subject": subject,
-                    "Time": epoch_time,
-                    "TimeReadable": readable_time,
-                    "Body": body or snippet,
-                    "OTP": otp,
-                    "URL": activation_url or []
-                })
+
+            # Step 2: Fetch full content of all messages in one batched HTTP request (instead of one round-trip each)
+            full_messages = {}
+            def collect(request_id, response, exception):
+                if exception is not None:
+                    raise exception
+                full_messages[request_id] = response
+
+            for start in range(0, len(messages), 50): # Gmail tends to rate-limit batches of more than 50 calls
+                batch = self.service.new_batch_http_request(callback=collect)
+                for msg in messages[start:start + 50]:
+                    batch.add(self.service.users().messages().get(userId='me', id=msg['id'], format='full'), request_id=msg['id'])
+                batch.execute()
+
+            # Step 3: Wrap each message (in the listed, most-recent-first order); body, OTP and URLs are parsed on first access
+            email_data = [EmailData(full_messages[msg['id']], self) for msg in messages]
 
             return email_data
 
@@ -145,122 +203,98 @@ class OTPFetcher:
 
     def _clean_text(self, text: str) -> str:
         """Normalize line endings, whitespace, and remove excess newlines."""
-        
-        # Normalize different newline formats (handle Windows, Mac, and Linux line endings)
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
 
-        # Remove any newlines that occur right after other newlines
-        text = re.sub(r'\n{2,}', '\n', text)  # Collapse multiple newlines into one
+        def clean_whitespace(match: re.Match) -> str:
+            # Spaces/tabs collapse into one space
+            if match.group(1) is None:
+                return ' '
+            # A whitespace run with line break(s) collapses into one newline, or into a space when it borders
+            # digits so OTP-like codes are not split across lines
+            source, start, end = match.string, match.start(), match.end()
+            if (start and source[start - 1].isdecimal()) or (end < len(source) and source[end].isdecimal()):
+                return ' '
+            return '\n'
+
+        # Single pass over the stripped text (equivalent to normalizing line endings, collapsing newlines,
+        # spaces and tabs, trimming spaces around newlines, and merging newlines around digits one after another)
+        return _CLEAN_WHITESPACE_RE.sub(clean_whitespace, text.strip())
 
-        # Strip leading and trailing whitespaces
-        text = text.strip()
+    def _html_to_text(self, html: str) -> str:
+        """Converts HTML to readable plain text using the best available parser."""
+        soup = BeautifulSoup(html, _BEST_PARSER)
+        return self._clean_text(soup.get_text(separator=" "))
 
-        # Normalize multiple spaces or tabs into one space
-        text = re.sub(r'[ \t]+', ' ', text)
+    def _extract_parts(self, message: dict) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        Walks the message's MIME tree once, base64-decoding each text part a single time (cached on `message`).
 
-        # Additional stripping of extra spaces before or after newlines
-        text = re.sub(r'\s*\n\s*', '\n', text)  # Remove extra spaces before or after newlines
-        
-        # Special case: Handle newlines before or after OTP-like patterns (like numeric codes)
-        # Remove newlines around digits or passcodes
-        text = re.sub(r'(\d+)\n', r'\1 ', text)  # Merge digits followed by a newline into a single space
-        text = re.sub(r'\n(\d+)', r' \1', text)  # Merge newlines before digits into a single space
+        Returns:
+            Tuple: (text_parts, raw_html) where `text_parts` are the decoded `(mime_type, text)` text/plain and
+            text/html parts in depth-first order (nested parts first), and `raw_html` is the first text/html part.
+        """
+        cached = message.get("_text_parts")
+        if cached is not None:
+            return cached
 
-        return text
+        text_parts: List[Tuple[str, str]] = []
+        raw_html: Optional[str] = None
 
-    def _html_to_text(self, html: str) -> str:
-        """Converts HTML to readable plain text using the best available parser."""
-        
-        def get_best_available_parser() -> str:
-            for parser in ['lxml', 'html5lib', 'html.parser']:
-                if parser == 'html.parser' or importlib.util.find_spec(parser):
-                    return parser
-            return 'html.parser'
-
-        best_parser = get_best_available_parser()
-        soup = BeautifulSoup(html, best_parser)
-        text = soup.get_text(separator=" ")
-        return self._clean_text(text)
-
-    def _extract_body(self, message: dict) -> Optional[str]:
-        """Extracts and cleans text from email body (plain or HTML, including nested parts)."""
-        
-        def extract_from_parts(parts: list) -> Optional[str]:
+        def collect_from_parts(parts: list) -> None:
             for part in parts:
-                mime_type = part.get("mimeType", "")
-                body_data = part.get("body", {}).get("data")
                 nested_parts = part.get("parts")
+                if nested_parts: # Recurse into nested parts
+                    collect_from_parts(nested_parts)
 
-                # Recurse into nested parts
-                if nested_parts:
-                    nested = extract_from_parts(nested_parts)
-                    if nested:
-                        return nested
-
-                if body_data:
-                    decoded = base64.urlsafe_b64decode(body_data).decode("utf-8", errors="ignore")
-                    if mime_type == "text/plain":
-                        return self._clean_text(decoded)
-                    elif mime_type == "text/html":
-                        # Parse as HTML, which already calls _clean_text
-                        return self._html_to_text(decoded)  # Cleaned by _html_to_text
-
-            return None
+                mime_type = part.get("mimeType", "")
+                body_data = part.get("body", {}).get("data")
+                if body_data and mime_type in ("text/plain", "text/html"):
+                    text_parts.append((mime_type, base64.urlsafe_b64decode(body_data).decode("utf-8", errors="ignore")))
 
         try:
             payload = message.get("payload", {})
             parts = payload.get("parts")
             if parts:
-                return extract_from_parts(parts)
-
-            # If no parts, check top-level body
-            data = payload.get("body", {}).get("data")
-            if data:
-                decoded = base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
-                # Parse as HTML and clean the result (since _html_to_text already handles cleaning)
-                return self._html_to_text(decoded)
+                collect_from_parts(parts)
+                raw_html = next((decoded for mime_type, decoded in text_parts if mime_type == "text/html" and decoded), None)
+            else:
+                # If no parts, check top-level body (always read as HTML for the body text)
+                data = payload.get("body", {}).get("data")
+                if data:
+                    decoded = base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
+                    text_parts.append(("text/html", decoded))
+                    if payload.get("mimeType") == "text/html":
+                        raw_html = decoded
 
         except Exception as e:
-            print(f"Error extracting body: {e}")
-
-        return None
-
-    def _extract_raw_html_body(self, message: dict) -> Optional[str]:
-        def extract_html_from_parts(parts: list) -> Optional[str]:
-            for part in parts:
-                mime_type = part.get("mimeType", "")
-                body_data = part.get("body", {}).get("data")
-                nested_parts = part.get("parts")
+            print(f"Error extracting message parts: {e}")
 
-                if nested_parts:
-                    result = extract_html_from_parts(nested_parts)
-                    if result:
-                        return result
-
-                if mime_type == "text/html" and body_data:
-                    return base64.urlsafe_b64decode(body_data).decode("utf-8", errors="ignore")
-
-            return None
+        message["_text_parts"] = (text_parts, raw_html)
+        return text_parts, raw_html
 
+    def _extract_body(self, message: dict) -> Optional[str]:
+        """Extracts and cleans text from email body (first plain or HTML part with text, including nested parts)."""
         try:
-            payload = message.get("payload", {})
-            parts = payload.get("parts")
-            if parts:
-                return extract_html_from_parts(parts)
-
-            data = payload.get("body", {}).get("data")
-            if data and payload.get("mimeType") == "text/html":
-                return base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
+            for mime_type, decoded in self._extract_parts(message)[0]:
+                if mime_type == "text/plain":
+                    text = self._clean_text(decoded)
+                else:
+                    # Parse as HTML, which already calls _clean_text
+                    text = self._html_to_text(decoded)
+                if text:
+                    return text
 
         except Exception as e:
-            print(f"Error extracting raw HTML body: {e}")
+            print(f"Error extracting body: {e}")
 
         return None
 
+    def _extract_raw_html_body(self, message: dict) -> Optional[str]:
+        return self._extract_parts(message)[1]
+
     def _extract_otp(self, body: str) -> Optional[str]:
         """Extracts the first numeric sequence that looks like an OTP (length ≥ 4)."""
-        matches = re.findall(r"\b\d{4,10}\b", body)
-        return matches[0] if matches else None
+        match = _OTP_RE.search(body) # Stops at the first match instead of collecting all of them
+        return match.group(0) if match else None
 
     def _extract_all_activation_urls(self, body: str) -> List[str]:
         """
@@ -275,24 +309,16 @@ class OTPFetcher:
         if not body:
             return []
 
-        urls = set()
-
-        # Parse HTML for anchor tags with href
-        soup = BeautifulSoup(body, "html.parser")
-        for a in soup.find_all("a", href=True):
-            if isinstance(a, Tag):
-                urls.add(a['href'])
+        # Extract from raw plain text using regex
+        urls = set(_URL_RE.findall(body))
 
-        # Also extract from raw plain text using regex
-        raw_links = re.findall(r'https?://[^\s"<>]+', body)
-        urls.update(raw_links)
+        # Parse HTML for anchor tags with href (plain-text bodies have none, so skip the parser)
+        if '<a' in body or '<A' in body:
+            soup = BeautifulSoup(body, _BEST_PARSER, parse_only=_ANCHOR_STRAINER)
+            for a in soup.find_all("a", href=True):
+                if isinstance(a, Tag):
+                    urls.add(a['href'])
 
         # Filter for activation-like links
-        activation_keywords = ['activate', 'verify', 'confirm', 'signup', 'register']
-        relevant_links = [
-            url for url in urls
-            if any(kw in url.lower() for kw in activation_keywords)
-        ]
-
-        return sorted(relevant_links)
+        return sorted(url for url in urls if _ACTIVATION_KEYWORD_RE.search(url))
 
@@ -3,14 +3,22 @@ from fastapi import FastAPI, HTTPException, Body, Query
 from fastapi import Path as FastAPIPath
 from urllib.parse import unquote
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from contextlib import asynccontextmanager
 from typing import List
 import sqlite3
+import threading
+import asyncio
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -21,15 +29,27 @@ if not os.path.isdir(JOB_DB_DIR):
 JOB_DB = PROJECT_ROOT / os.getenv("JOB_DB", ".job_db/job_store.db")
 DB_PATH = JOB_DB
 
+# ✅ One SQLite connection per process (opened in `lifespan`) shared by all routes.
+# Sync routes run on FastAPI's threadpool, so every use of the connection holds `db_lock`.
+db_lock = threading.Lock()
+
+def open_db() -> sqlite3.Connection:
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;")
+    return conn
+
 # ✅ Lifespan context manager for FastAPI app
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
+    app.state.db = open_db()
     print("✅ Job DB initialized on startup")
     yield
+    app.state.db.close()
     print("🔻 FastAPI is shutting down...")
 
-app = FastAPI(lifespan=lifespan)
+# Serialize responses with orjson when installed (polled routes such as /next-job return small dicts at high rate)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse if orjson is not None else JSONResponse)
 
 # ✅ CORS Middleware
 app.add_middleware(
@@ -52,6 +72,7 @@ def init_db():
             updated_at TEXT DEFAULT CURRENT_TIMESTAMP
         )
     ''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_queue_status ON job_queue(status)") # Index seek for `WHERE status=...`
     conn.commit()
     conn.close()
 
@@ -70,83 +91,73 @@ class JobInsert(BaseModel):
 
 # === API Routes ===
 
+def _next_job_sync():
+    with db_lock, app.state.db as conn:
+        # Claim a job atomically in one statement (needs SQLite >= 3.35 for RETURNING)
+        return conn.execute(
+            "UPDATE job_queue SET status='active', updated_at=CURRENT_TIMESTAMP "
+            "WHERE url=(SELECT url FROM job_queue WHERE status='new' LIMIT 1) RETURNING url"
+        ).fetchone()
+
+def _fetch_all_sync(query: str, params: tuple = ()) -> list:
+    with db_lock:
+        return app.state.db.execute(query, params).fetchall()
+
+# Hot read/claim routes are `async def` and push the blocking SQLite work to a worker thread
 @app.get("/next-job")
-def get_next_job():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT url FROM job_queue WHERE status='new' LIMIT 1")
-    row = c.fetchone()
+async def get_next_job():
+    row = await asyncio.to_thread(_next_job_sync)
     if not row:
-        conn.close()
         raise HTTPException(status_code=404, detail="No new jobs available")
-    url = row[0]
-    c.execute("UPDATE job_queue SET status='active', updated_at=CURRENT_TIMESTAMP WHERE url=?", (url,))
-    conn.commit()
-    conn.close()
-    return {"url": url}
+    return {"url": row[0]}
 
 @app.post("/refresh-job")
 def refresh_job(update: JobUpdate):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    # Check if job already exists
-    c.execute("SELECT 1 FROM job_queue WHERE url = ?", (update.url,))
-    exists = c.fetchone()
-    if exists:
-        c.execute(
-            "UPDATE job_queue SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE url = ?",
-            (update.status, update.url),
-        )
-    else:
-        c.execute(
-            "INSERT INTO job_queue (url, status) VALUES (?, ?)",
-            (update.url, update.status),
-        )
-    conn.commit()
-    conn.close()
+    with db_lock, app.state.db as conn:
+        c = conn.cursor()
+        # Check if job already exists
+        c.execute("SELECT 1 FROM job_queue WHERE url = ?", (update.url,))
+        exists = c.fetchone()
+        if exists:
+            c.execute(
+                "UPDATE job_queue SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE url = ?",
+                (update.status, update.url),
+            )
+        else:
+            c.execute(
+                "INSERT INTO job_queue (url, status) VALUES (?, ?)",
+                (update.url, update.status),
+            )
     return {"message": f"Job {update.url} set to status {update.status}"}
 
 @app.post("/job/update")
 def update_job(update: JobUpdate = Body(...)):
     url = update.url
     status = update.status
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("UPDATE job_queue SET status=?, updated_at=CURRENT_TIMESTAMP WHERE url=?", (status, url))
-    if c.rowcount == 0:
-        c.execute("INSERT INTO job_queue (url, status) VALUES (?, ?)", (url, status))
-    conn.commit()
-    conn.close()
+    with db_lock, app.state.db as conn:
+        c = conn.cursor()
+        c.execute("UPDATE job_queue SET status=?, updated_at=CURRENT_TIMESTAMP WHERE url=?", (status, url))
+        if c.rowcount == 0:
+            c.execute("INSERT INTO job_queue (url, status) VALUES (?, ?)", (url, status))
     return {"message": f"Job status updated to {status} for url {url}"}
 
 @app.get("/all-jobs")
-def list_jobs():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT url, status FROM job_queue ORDER BY created_at DESC")
-    jobs = [{"url": url, "status": status} for url, status in c.fetchall()]
-    conn.close()
+async def list_jobs():
+    rows = await asyncio.to_thread(_fetch_all_sync, "SELECT url, status FROM job_queue ORDER BY created_at DESC")
+    jobs = [{"url": url, "status": status} for url, status in rows]
     return {"jobs": jobs}
 
 # ✅ Dev-only: Bulk insert test jobs
 @app.post("/load-jobs")
 def load_jobs(batch: JobList):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    added, skipped = 0, 0
-    for url in batch.urls:
+    with db_lock, app.state.db as conn: # Rolls back on error
+        changes_before = conn.total_changes
         try:
-            c.execute("INSERT OR IGNORE INTO job_queue (url, status) VALUES (?, 'new')", (url,))
-            if c.rowcount > 0:
-                added += 1
-            else:
-                skipped += 1
+            conn.executemany("INSERT OR IGNORE INTO job_queue (url, status) VALUES (?, 'new')", ((url,) for url in batch.urls))
         except Exception as e:
-            conn.rollback()
             raise HTTPException(status_code=400, detail=str(e))
-    conn.commit()
-    conn.close()
-    return {"added": added, "skipped": skipped, "total": len(batch.urls)}
+        added = conn.total_changes - changes_before
+    return {"added": added, "skipped": len(batch.urls) - added, "total": len(batch.urls)}
 
 @app.post("/admin/reset")
 def reset_jobs(reset_type: str = "truncate"):
@@ -155,53 +166,42 @@ def reset_jobs(reset_type: str = "truncate"):
     - 'truncate': deletes all jobs
     - 'new': sets all statuses to 'new'
     """
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    if reset_type == "truncate":
-        c.execute("DELETE FROM job_queue")
-    elif reset_type == "new":
-        c.execute("UPDATE job_queue SET status='new', updated_at=CURRENT_TIMESTAMP")
-    else:
-        conn.close()
-        raise HTTPException(status_code=400, detail="Invalid reset_type. Use 'truncate' or 'new'")
-    conn.commit()
-    conn.close()
+    with db_lock, app.state.db as conn:
+        c = conn.cursor()
+        if reset_type == "truncate":
+            c.execute("DELETE FROM job_queue")
+        elif reset_type == "new":
+            c.execute("UPDATE job_queue SET status='new', updated_at=CURRENT_TIMESTAMP")
+        else:
+            raise HTTPException(status_code=400, detail="Invalid reset_type. Use 'truncate' or 'new'")
     return {"message": f"Job table reset with method: {reset_type}"}
 
 @app.post("/add-jobs")
 def add_jobs(job_data: JobInsert):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-
     added = 0
     skipped = 0
 
     try:
-        for url in job_data.urls:
+        with db_lock, app.state.db as conn: # Commits on success, rolls back on error
             if job_data.update_if_exists:
                 # Insert or replace (overwrite existing job)
-                c.execute(
+                conn.executemany(
                     "INSERT OR REPLACE INTO job_queue (url, status) VALUES (?, ?)",
-                    (url, job_data.status)
+                    ((url, job_data.status) for url in job_data.urls)
                 )
-                added += 1
+                added = len(job_data.urls)
             else:
-                # Insert only if not exists
-                c.execute(
+                # Insert only if not exists (a plain INSERT, unlike OR IGNORE, still reports an invalid status)
+                changes_before = conn.total_changes
+                conn.executemany(
                     "INSERT INTO job_queue (url, status) "
                     "SELECT ?, ? WHERE NOT EXISTS (SELECT 1 FROM job_queue WHERE url=?)",
-                    (url, job_data.status, url)
+                    ((url, job_data.status, url) for url in job_data.urls)
                 )
-                if c.rowcount == 1:
-                    added += 1
-                else:
-                    skipped += 1
-        conn.commit()
+                added = conn.total_changes - changes_before
+                skipped = len(job_data.urls) - added
     except sqlite3.Error as e:
-        conn.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
-    finally:
-        conn.close()
 
     return {
         "message": (
@@ -212,15 +212,11 @@ def add_jobs(job_data: JobInsert):
     }
 
 @app.get("/jobs-by-status/{status}")
-def get_jobs_by_status(status: str):
+async def get_jobs_by_status(status: str):
     valid_statuses = {"new", "active", "success", "failed"}
     if status not in valid_statuses:
         raise HTTPException(status_code=400, detail="Invalid status filter.")
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT url FROM job_queue WHERE status=?", (status,))
-    data = c.fetchall()
-    conn.close()
+    data = await asyncio.to_thread(_fetch_all_sync, "SELECT url FROM job_queue WHERE status=?", (status,))
     return {"urls": [url for (url,) in data]}
 
 # @app.post("/refresh-job")
@@ -7,12 +7,17 @@ job_urls = [
     f"https://workday.wd5.myworkdayjobs.com/en-US/Workday/job/Israel-Tel-Aviv/Software-Engineer---HiredScore_JR-0096009-2?q=software%20engineer",
 ]
 
+BATCH_SIZE = 500  # URLs per /load-jobs request (the server inserts each batch with one executemany)
+
 def load_jobs():
-    response = requests.post(
-        f"{SERVER_URL}/load-jobs",
-        json={"urls": job_urls}
-    )
-    print("✅ Response:", response.status_code, response.json())
+    # One keep-alive session for all batches instead of a new connection (and TLS handshake) per request
+    with requests.Session() as session:
+        for start in range(0, len(job_urls), BATCH_SIZE):
+            response = session.post(
+                f"{SERVER_URL}/load-jobs",
+                json={"urls": job_urls[start:start + BATCH_SIZE]}
+            )
+            print("✅ Response:", response.status_code, response.json())
 
 if __name__ == "__main__":
     load_jobs()
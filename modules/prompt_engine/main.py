@@ -1,8 +1,7 @@
 # modules/prompt_engine/main.py
+import functools
 from langchain_ollama.llms import OllamaLLM
-from langchain_chroma import Chroma
-from langchain_ollama import OllamaEmbeddings
-from modules.embeddings import filter_relevant_contexts
+from modules.embeddings import filter_relevant_contexts, get_embeddings, get_vectorstore
 from . import prompt_templates
 
 class PromptAgent:
@@ -12,13 +11,17 @@ class PromptAgent:
         self.embed_model = embed_model
         self.chroma_db = chroma_db
         self.collection_name = collection_name
+        self.llm = OllamaLLM(model=llm_model) # Built once and reused by every `resolve` call
+        # Same questions recur across applications; reuse their retrieved context (embeddings are built before the agent)
+        self._cached_context = functools.lru_cache(maxsize=512)(self._retrieve_context)
 
     def _fetch_context(self, question: str, top_k: int = 6, min_keep: int = 1, debug: bool = False) -> str:
-        db = Chroma(
-            collection_name=self.collection_name,
-            persist_directory=self.chroma_db,
-            embedding_function=OllamaEmbeddings(model=self.embed_model)
-        )
+        if debug: # Bypass the cache so the similarity scores are printed
+            return self._retrieve_context(question, top_k, min_keep, debug=True)
+        return self._cached_context(question, top_k, min_keep)
+
+    def _retrieve_context(self, question: str, top_k: int, min_keep: int, debug: bool = False) -> str:
+        db = get_vectorstore(self.chroma_db, self.collection_name, self.embed_model)
 
         # Retrieve top_k documents
         docs = db.similarity_search(question, k=top_k)
@@ -28,7 +31,7 @@ class PromptAgent:
         filtered_texts = filter_relevant_contexts(
             query=question,
             doc_texts=doc_texts,
-            embedding_func=OllamaEmbeddings(model=self.embed_model),
+            embedding_func=get_embeddings(self.embed_model),
             min_keep=min_keep,
             debug=debug
         )
@@ -63,8 +66,6 @@ class PromptAgent:
         custom_prompt_fn: callable = None,
         custom_prompt_args: dict = None
     ) -> str:
-        llm = OllamaLLM(model=self.llm_model)
-
         if custom_prompt_fn:
             # Case 1: Metadata-based prompt that doesn’t need embeddings
             if custom_prompt_args and not question and not options:
@@ -87,4 +88,4 @@ class PromptAgent:
             else:
                 prompt = prompt_templates.base_prompt(context, question)
 
-        return llm.invoke(prompt).strip()
+        return self.llm.invoke(prompt).strip()
@@ -2,7 +2,7 @@
 import logging
 import os
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler
 
 '''
 | Level Name | Numeric Value | Used For                                    |
@@ -23,7 +23,8 @@ def setup_logger(
     refresh_logs: bool = False,
     use_timestamp: bool = False,
     max_bytes: int = 2_000_000,
-    backup_count: int = 3
+    backup_count: int = 3,
+    buffer_capacity: int = 1000
 ) -> logging.Logger:
     """
     Creates and configures a logger with console and optional file output.
@@ -38,6 +39,7 @@ def setup_logger(
         use_timestamp (bool): If True, include timestamp in filename.
         max_bytes (int): Max file size before rotating.
         backup_count (int): Number of rotated backups to keep.
+        buffer_capacity (int): Records buffered before writing to the log file (ERROR and above flush immediately); 0 writes every record.
 
     Returns:
         logging.Logger: Configured logger.
@@ -73,6 +75,10 @@ def setup_logger(
             file_handler = RotatingFileHandler(file_path, maxBytes=max_bytes, backupCount=backup_count)
 
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        if buffer_capacity > 0:
+            # Coalesce file writes; buffered records are also flushed by `logging.shutdown()` at interpreter exit
+            logger.addHandler(MemoryHandler(capacity=buffer_capacity, flushLevel=logging.ERROR, target=file_handler))
+        else:
+            logger.addHandler(file_handler)
 
     return logger